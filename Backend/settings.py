@@ -16,6 +16,7 @@ import os
 from dotenv import load_dotenv
 from urllib.parse import urlparse, parse_qsl
 from datetime import timedelta
+from corsheaders.defaults import default_headers
 
 
 load_dotenv()
@@ -144,6 +145,7 @@ SIMPLE_JWT = {
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "api.middleware.RequestMetricsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -154,6 +156,9 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     "api.middleware.InternalAPIKeyMiddleware",
     "api.middleware.RefreshTokenMiddleware",
+    "api.middleware.DeferredCacheInvalidationMiddleware",
+    # Last, so profiles cover the view only.
+    "api.middleware.RequestProfilerMiddleware",
 ]
 
 ROOT_URLCONF = 'Backend.urls'
@@ -198,6 +203,12 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # File-backed test DB: shared-cache in-memory SQLite fails concurrent writers with
+            # "table is locked" instead of waiting, which breaks the multi-threaded game tests.
+            "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
+            # SQLite ignores SELECT ... FOR UPDATE; taking the write lock at BEGIN serializes game
+            # actions instead, and waits rather than failing two transactions that both read first.
+            "OPTIONS": {"transaction_mode": "IMMEDIATE", "timeout": 20},
         }
     }
 
@@ -215,6 +226,84 @@ CACHES = {
     }
 }
 
+# Optional per-worker L1 cache in front of Redis for hot, rarely-changing keys
+# (see CacheService `local=True`). Deletes are broadcast to other workers via Redis pub/sub.
+CACHE_L1_ENABLED = _env_bool("CACHE_L1_ENABLED", default=False)
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1024"))
+CACHE_L1_TTL_SECONDS = float(os.getenv("CACHE_L1_TTL_SECONDS", "30"))
+CACHE_L1_INVALIDATION_CHANNEL = os.getenv("CACHE_L1_INVALIDATION_CHANNEL", "workquest:cache:l1:invalidate")
+
+# Per-key-family cache hit/miss/loader-time counters (see api/services/cache_metrics.py).
+# Counters are buffered per worker and flushed to Redis at most every CACHE_METRICS_FLUSH_SECONDS.
+CACHE_METRICS_ENABLED = _env_bool("CACHE_METRICS_ENABLED", default=True)
+CACHE_METRICS_FLUSH_SECONDS = float(os.getenv("CACHE_METRICS_FLUSH_SECONDS", "10"))
+# Raw (pickled) writes have no stored length at hand; measuring one costs a second pickle, so
+# only this fraction of them is sized. Codec writes are always sized for free.
+CACHE_METRICS_PAYLOAD_SAMPLE_RATE = float(os.getenv("CACHE_METRICS_PAYLOAD_SAMPLE_RATE", "0.01"))
+
+# Per-view request latency histograms, DB query count/time and cache calls
+# (api/services/request_metrics.py, RequestMetricsMiddleware), keyed by URL name and flushed to
+# Redis at most every REQUEST_METRICS_FLUSH_SECONDS. Bucket bounds are in milliseconds.
+REQUEST_METRICS_ENABLED = _env_bool("REQUEST_METRICS_ENABLED", default=True)
+REQUEST_METRICS_FLUSH_SECONDS = float(os.getenv("REQUEST_METRICS_FLUSH_SECONDS", "10"))
+REQUEST_METRICS_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Sampling request profiler (api/services/request_profiler.py, RequestProfilerMiddleware). Off: the
+# middleware is dropped at startup. On: requests to REQUEST_PROFILER_VIEWS (URL names; empty = all)
+# are profiled at REQUEST_PROFILER_SAMPLE_RATE, or when `X-Profile: <INTERNAL_SERVICE_API_KEY>` is sent.
+# cProfile records every thread in the process, so a profile that overlapped another request in the
+# same worker is discarded; with gthread workers most are. Profile on a worker run with `--threads 1`.
+REQUEST_PROFILER_ENABLED = _env_bool("REQUEST_PROFILER_ENABLED", default=False)
+REQUEST_PROFILER_SAMPLE_RATE = float(os.getenv("REQUEST_PROFILER_SAMPLE_RATE", "0"))
+REQUEST_PROFILER_VIEWS = tuple(v for v in os.getenv("REQUEST_PROFILER_VIEWS", "").split(",") if v)
+REQUEST_PROFILER_DIR = os.getenv("REQUEST_PROFILER_DIR") or BASE_DIR / "profiles"
+REQUEST_PROFILER_MAX_PROFILES = int(os.getenv("REQUEST_PROFILER_MAX_PROFILES", "200"))
+
+# Per-key-family payload codecs (see api/services/cache_codec.py). Keys are a family
+# ("log:project_game_logs") or its first segment ("log"); values are "msgpack" (a
+# requirement; pickle if it's missing), "json", "pickle" or "raw" (django-redis default pickling).
+# Encoded bodies of at least CACHE_COMPRESS_MIN_BYTES are compressed (zlib, or zstd if installed).
+CACHE_CODECS = {
+    "log": "msgpack",
+    "task": "msgpack",
+}
+CACHE_DEFAULT_CODEC = os.getenv("CACHE_DEFAULT_CODEC", "raw")
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION", "zlib")
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))
+CACHE_COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", "3"))
+
+# Server-sent events stream of project game logs (api/services/log_stream.py). TaskLog.write
+# publishes to Redis pub/sub ("redis") or dispatches in-process ("memory", single-process dev).
+TASKLOG_STREAM_ENABLED = _env_bool("TASKLOG_STREAM_ENABLED", default=True)
+TASKLOG_STREAM_BROKER = os.getenv("TASKLOG_STREAM_BROKER", "redis")
+TASKLOG_STREAM_MAX_SECONDS = float(os.getenv("TASKLOG_STREAM_MAX_SECONDS", "300"))
+TASKLOG_STREAM_HEARTBEAT_SECONDS = float(os.getenv("TASKLOG_STREAM_HEARTBEAT_SECONDS", "15"))
+TASKLOG_STREAM_MAX_PENDING = int(os.getenv("TASKLOG_STREAM_MAX_PENDING", "1000"))
+# An open stream holds one gunicorn thread (GUNICORN_THREADS per worker, see entrypoint.sh) for
+# up to TASKLOG_STREAM_MAX_SECONDS. Cap them per worker so the rest of the pool keeps serving
+# other requests; streams beyond the cap get 503. 0 disables the cap.
+TASKLOG_STREAM_MAX_PER_WORKER = int(os.getenv("TASKLOG_STREAM_MAX_PER_WORKER", "8"))
+
+# Game log pages (GET /projects/<id>/logs/): keyset pagination on (created_at, id), newest first.
+GAME_LOGS_PAGE_SIZE = int(os.getenv("GAME_LOGS_PAGE_SIZE", "100"))
+GAME_LOGS_MAX_PAGE_SIZE = int(os.getenv("GAME_LOGS_MAX_PAGE_SIZE", "500"))
+
+# Per-worker Effect/Item catalog (api/domains/catalog.py). Workers compare their copy against a
+# Redis version key at most every CATALOG_VERSION_CHECK_SECONDS (admin edits bump it) and reload
+# after CATALOG_MAX_AGE_SECONDS regardless, in case Redis is unavailable.
+CATALOG_VERSION_CHECK_SECONDS = float(os.getenv("CATALOG_VERSION_CHECK_SECONDS", "5"))
+CATALOG_MAX_AGE_SECONDS = float(os.getenv("CATALOG_MAX_AGE_SECONDS", "300"))
+
+# Per-project member user-ID set behind Project.check_access (api/domains/project_member_management.py),
+# cached in Redis and dropped by add_member/remove_member. 0 disables it (one indexed EXISTS per check).
+PROJECT_MEMBER_CACHE_SECONDS = int(os.getenv("PROJECT_MEMBER_CACHE_SECONDS", "60"))
+
+# Read-only polling views marked with ClaimsJWTAuthentication (api/cookie_authentication.py) trust
+# the access token's user claims up to expiry instead of loading the user; logout revokes the
+# token in Redis, and a password change or deactivation revokes every token the user was issued
+# before it (api/signals.py). Off: those views authenticate like every other view.
+CLAIMS_AUTH_ENABLED = _env_bool("CLAIMS_AUTH_ENABLED", default=False)
+
 # Optional: store Django sessions in Redis
 if _env_bool("DJANGO_USE_CACHE_SESSIONS", default=False):
     SESSION_ENGINE = "django.contrib.sessions.backends.cache"
@@ -246,6 +335,10 @@ CORS_ALLOWED_ORIGINS = _env_csv(
     default=["http://localhost:5173"],
 )
 
+# Polled endpoints answer If-None-Match with 304 (api/utils/etag.py); let the frontend send/read them.
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match")
+CORS_EXPOSE_HEADERS = ["ETag"]
+
 CSRF_TRUSTED_ORIGINS = _env_csv(
     "CSRF_TRUSTED_ORIGINS",
     default=["http://localhost:5173"],
@@ -16,6 +16,8 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from .domains.catalog import bump_catalog_version
+from .services.cache_service import CacheService
 from .models.Achievement import Achievement
 from .models.ActivityLog import ActivityLog
 from .models.Boss import Boss
@@ -572,11 +574,25 @@ class UserTaskAdmin(WorkQuestModelAdmin):
 
 @admin.register(Boss)
 class BossAdmin(WorkQuestModelAdmin):
+    """Every change drops the cached boss list (Redis and each worker's L1)."""
+
     list_display = ("boss_name", "boss_type", "boss_id")
     list_filter = ("boss_type",)
     search_fields = ("boss_name", "boss_id")
     readonly_fields = ("boss_id",)
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        CacheService().invalidate_all_bosses()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        CacheService().invalidate_all_bosses()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        CacheService().invalidate_all_bosses()
+
 
 @admin.register(ProjectBoss)
 class ProjectBossAdmin(WorkQuestModelAdmin):
@@ -616,8 +632,24 @@ class UserAttackAdmin(WorkQuestModelAdmin):
 # ---------------------------------------------------------------------------
 
 
+class CatalogModelAdmin(WorkQuestModelAdmin):
+    """Effect/Item admins: every change invalidates the workers' in-memory catalog."""
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        bump_catalog_version()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        bump_catalog_version()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        bump_catalog_version()
+
+
 @admin.register(Effect)
-class EffectAdmin(WorkQuestModelAdmin):
+class EffectAdmin(CatalogModelAdmin):
     list_display = ("effect_type", "value", "effect_polarity", "rare_level", "created_at")
     list_filter = ("effect_type", "effect_polarity", "created_at")
     search_fields = ("description", "effect_id")
@@ -646,7 +678,7 @@ class UserEffectAdmin(WorkQuestModelAdmin):
 
 
 @admin.register(Item)
-class ItemAdmin(WorkQuestModelAdmin):
+class ItemAdmin(CatalogModelAdmin):
     list_display = ("name", "effects", "created_at")
     search_fields = ("name", "description", "item_id")
     readonly_fields = ("item_id", "created_at")
@@ -1,16 +1,85 @@
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import router
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.utils import get_md5_hash_password
 from rest_framework.exceptions import AuthenticationFailed
 
+from api.models import BusinessUser
+from api.services.auth_service import BUSINESS_USER_ID_CLAIM, is_token_revoked
+
+
+def get_business_user(request):
+    """
+    The request's BusinessUser: the one CookieJWTAuthentication attached, else looked up from
+    `request.user` (other authenticators, tests). Raises BusinessUser.DoesNotExist like the lookup.
+    """
+    business_user = getattr(request, "business_user", None)
+    if business_user is not None:
+        return business_user
+    return BusinessUser.objects.get(auth_user=request.user)
+
+
+def _business_profile(user):
+    try:
+        return user.business_profile
+    except ObjectDoesNotExist:
+        return None
+
+
 class CookieJWTAuthentication(JWTAuthentication):
     """
     1) HTTP-only cookie `access` (primary for same-site / desktop browsers)
     2) Authorization: Bearer <access> (fallback when cross-site cookies are blocked)
     3) Rotate access via HTTP-only `refresh` cookie when access is missing/expired
+
+    The user's BusinessUser is loaded in the same query and exposed as `request.business_user`.
     """
 
     def authenticate(self, request):
+        result = self._authenticate(request)
+        if result is not None:
+            request.business_user = _business_profile(result[0])
+        return result
+
+    def get_user(self, validated_token):
+        """
+        SimpleJWT's `get_user`, with the BusinessUser joined in.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        try:
+            user = self.user_model.objects.select_related("business_profile").get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
+
+    def get_refreshed_user(self, validated_token):
+        """
+        The user of an access token just minted from the `refresh` cookie.
+        """
+        return self.get_user(validated_token)
+
+    def _authenticate(self, request):
         access_token = request.COOKIES.get("access")
 
         if access_token:
@@ -42,10 +111,10 @@ class CookieJWTAuthentication(JWTAuthentication):
 
         try:
             refresh = RefreshToken(refresh_token)
-            new_access = str(refresh.access_token)
-
-            validated_token = self.get_validated_token(new_access)
-            user = self.get_user(validated_token)
+            # Minted and signed right here, so it doesn't need decoding and validating again.
+            validated_token = refresh.access_token
+            new_access = str(validated_token)
+            user = self.get_refreshed_user(validated_token)
 
             # Attach new access token to the DRF request object so middleware can set cookie.
             request._new_access_token = new_access
@@ -53,4 +122,54 @@ class CookieJWTAuthentication(JWTAuthentication):
             return user, validated_token
 
         except (TokenError, InvalidToken, AuthenticationFailed):
-            return None
\ No newline at end of file
+            return None
+
+
+class ClaimsJWTAuthentication(CookieJWTAuthentication):
+    """
+    For designated read-only polling views: trusts the token's user_id/business_user_id claims
+    up to expiry instead of loading the user, so authentication makes no query. The returned
+    User/BusinessUser carry only their keys; any other field is loaded on first access.
+
+    Tokens on the revocation list are rejected: logged out (by jti), or issued before the user's
+    password changed or they were deactivated (`revoke_user_tokens`), which stands in for
+    SimpleJWT's CHECK_USER_IS_ACTIVE / CHECK_REVOKE_TOKEN. Tokens without the claim (minted
+    before it existed), CLAIMS_AUTH_ENABLED off, or an unreachable revocation list fall back to
+    the regular lookup.
+    """
+
+    def get_user(self, validated_token):
+        if not getattr(settings, "CLAIMS_AUTH_ENABLED", False):
+            return super().get_user(validated_token)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        business_user_id = validated_token.get(BUSINESS_USER_ID_CLAIM)
+        if user_id is None or not business_user_id:
+            return super().get_user(validated_token)
+
+        revoked = is_token_revoked(validated_token)
+        if revoked:
+            raise AuthenticationFailed(_("Token has been revoked."), code="token_revoked")
+        if revoked is None:
+            return super().get_user(validated_token)
+        return self._user_from_claims(user_id, business_user_id)
+
+    def get_refreshed_user(self, validated_token):
+        # A freshly minted token's iat is now, so the revocation list can't vouch for it; the
+        # refresh path is the slow one anyway, so check the user in the database.
+        return super().get_user(validated_token)
+
+    def _user_from_claims(self, user_id, business_user_id):
+        user_pk = self.user_model._meta.get_field(api_settings.USER_ID_FIELD)
+        user = self.user_model.from_db(
+            router.db_for_read(self.user_model), [user_pk.attname], [user_pk.to_python(user_id)]
+        )
+        # from_db() takes values in concrete-field order.
+        business_user = BusinessUser.from_db(
+            router.db_for_read(BusinessUser),
+            ["auth_user_id", "user_id"],
+            [user.pk, uuid.UUID(str(business_user_id))],
+        )
+        # Wire both sides of the one-to-one so neither direction queries.
+        BusinessUser.auth_user.field.set_cached_value(business_user, user)
+        self.user_model.business_profile.related.set_cached_value(user, business_user)
+        return user
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Union
+
+from django.db import connections, models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Least
+from django.db.models.sql import UpdateQuery
+
+from api.domains.unit_of_work import flush_pending, save_fields
+
+
+def _supports_update_returning(connection) -> bool:
+    if connection.vendor == "postgresql":
+        return True
+    # SQLite gained RETURNING in 3.35, the same release Django keys this feature on.
+    return connection.vendor == "sqlite" and connection.features.can_return_columns_from_insert
+
+
+def update_returning(model: models.Model, returning: tuple[str, ...], **values: Any) -> bool:
+    """
+    Apply `values` (usually F() expressions) to `model`'s row in a single
+    `UPDATE ... RETURNING` and copy the returned columns back onto `model`.
+
+    Returns False if the row no longer exists. Backends without UPDATE ... RETURNING fall back
+    to UPDATE + SELECT inside one transaction.
+    """
+    queryset = type(model)._default_manager.filter(pk=model.pk)
+    connection = connections[queryset.db]
+
+    if _supports_update_returning(connection):
+        query = queryset.query.chain(UpdateQuery)
+        query.add_update_values(values)
+        sql, params = query.get_compiler(queryset.db).as_sql()
+        columns = ", ".join(connection.ops.quote_name(model._meta.get_field(f).column) for f in returning)
+        with connection.cursor() as cursor:
+            cursor.execute(f"{sql} RETURNING {columns}", params)
+            row = cursor.fetchone()
+    else:
+        with transaction.atomic(using=queryset.db):
+            row = None
+            if queryset.update(**values):
+                row = queryset.values_list(*returning).get()
+
+    if row is None:
+        return False
+    for field, value in zip(returning, row):
+        setattr(model, field, value)
+    return True
+
+
+def _is_persisted(model: Any) -> bool:
+    return isinstance(model, models.Model) and model.pk is not None and not model._state.adding
+
+
+def apply_delta(
+    model: Any,
+    field: str,
+    delta: Union[int, float],
+    *,
+    floor: Optional[int] = 0,
+    ceiling: Optional[str] = None,
+) -> Any:
+    """
+    Atomically add `delta` to `model.<field>`, clamped to `floor` and to the `ceiling` column
+    in SQL, so concurrent changes to the same row can't overwrite each other.
+
+    The new value is written back onto `model` and returned. Models that are not saved rows
+    (new instances, test doubles) are updated in Python via `save_fields` instead.
+    """
+    delta = int(round(delta))
+
+    if not _is_persisted(model):
+        value = getattr(model, field) + delta
+        if ceiling is not None:
+            value = min(value, getattr(model, ceiling))
+        if floor is not None:
+            value = max(value, floor)
+        setattr(model, field, value)
+        save_fields(model, field)
+        return value
+
+    # The UPDATE reads the column from the row, so unflushed setter writes must land first.
+    flush_pending(model, field, *((ceiling,) if ceiling else ()))
+
+    expression = F(field) + Value(delta)
+    if ceiling is not None:
+        expression = Least(expression, F(ceiling))
+    if floor is not None:
+        expression = Greatest(expression, Value(floor))
+
+    if not update_returning(model, (field,), **{field: expression}):
+        raise ValueError(f"{type(model).__name__} no longer exists")
+    return getattr(model, field)
+
+
+def apply_deltas(model: Any, **deltas: int) -> None:
+    """
+    Atomically add several unclamped deltas to `model` in one UPDATE (same fallback rules as
+    `apply_delta`), writing the new values back onto `model`.
+    """
+    deltas = {field: int(delta) for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    if not _is_persisted(model):
+        for field, delta in deltas.items():
+            setattr(model, field, getattr(model, field) + delta)
+        save_fields(model, *deltas)
+        return
+
+    flush_pending(model, *deltas)
+    values = {field: F(field) + Value(delta) for field, delta in deltas.items()}
+    if not update_returning(model, tuple(deltas), **values):
+        raise ValueError(f"{type(model).__name__} no longer exists")
+
+
+def update_if(model: Any, guard: dict[str, Any], **values: Any) -> bool:
+    """
+    Write `values` to `model`'s row only while its columns still equal `guard` (a conditional
+    UPDATE ... WHERE), so exactly one of several concurrent callers performs a state transition.
+
+    Returns whether this call changed the row. On success `values` are copied onto `model`; when
+    another caller got there first the guarded columns are re-read instead. Models that are not
+    saved rows check the guard against their own attributes and save via `save_fields`.
+    """
+    if not _is_persisted(model):
+        if any(getattr(model, field) != expected for field, expected in guard.items()):
+            return False
+        for field, value in values.items():
+            setattr(model, field, value)
+        save_fields(model, *values)
+        return True
+
+    # Unflushed setter writes to these columns would otherwise land after (and undo) this one.
+    flush_pending(model, *guard, *values)
+    changed = type(model)._default_manager.filter(pk=model.pk, **guard).update(**values)
+    if changed:
+        for field, value in values.items():
+            setattr(model, field, value)
+    else:
+        model.refresh_from_db(fields=list({*guard, *values}))
+    return bool(changed)
@@ -1,5 +1,9 @@
 import rest_framework
 
+from api.domains.atomic_update import apply_delta, apply_deltas, update_if
+from api.domains.unit_of_work import save_fields
+from api.models.ProjectBoss import ProjectBoss
+
 class Boss:
     def __init__(self, boss_model):
         self._boss = boss_model
@@ -23,7 +27,7 @@ class Boss:
     @status.setter
     def status(self, value:str):
         self._boss.status = value
-        self._boss.save(update_fields=["status"])
+        save_fields(self._boss, "status")
     
     @property
     def phase(self) -> int:
@@ -31,7 +35,7 @@ class Boss:
     @phase.setter
     def phase(self, value: int):
         self._boss.phase = value
-        self._boss.save(update_fields=["phase"])  
+        save_fields(self._boss, "phase")  
 
     @hp.setter
     def hp(self, value: int):
@@ -42,7 +46,7 @@ class Boss:
             raise ValueError("Boss HP cannot exceed max_hp")
 
         self._boss.hp = value
-        self._boss.save(update_fields=["hp"])
+        save_fields(self._boss, "hp")
 
     @max_hp.setter
     def max_hp(self, value: int):
@@ -54,7 +58,7 @@ class Boss:
             self._boss.hp = value
 
         self._boss.max_hp = value
-        self._boss.save(update_fields=["max_hp", "hp"])
+        save_fields(self._boss, "max_hp", "hp")
     
     @property
     def boss(self):
@@ -62,7 +66,7 @@ class Boss:
     @boss.setter
     def boss(self, value):
         self._boss.boss = value
-        self._boss.save(update_fields=["boss"])
+        save_fields(self._boss, "boss")
 
     @property
     def name(self):
@@ -78,19 +82,62 @@ class Boss:
     @updated_at.setter
     def updated_at(self, value):
         self._boss.updated_at = value
-        self._boss.save(update_fields=["updated_at"])
+        save_fields(self._boss, "updated_at")
+
 
+    @property
+    def task_changes(self):
+        """
+        (tasks added, priority added, priority deleted) since the current phase was set up.
+        """
+        return (
+            int(self._boss.added_tasks or 0),
+            int(self._boss.added_priority or 0),
+            int(self._boss.deleted_priority or 0),
+        )
+
+    def consume_task_changes(self, added_tasks, added_priority, deleted_priority):
+        # Subtract what was read instead of zeroing, so task changes that land concurrently
+        # carry over to the next phase.
+        apply_deltas(
+            self._boss,
+            added_tasks=-added_tasks,
+            added_priority=-added_priority,
+            deleted_priority=-deleted_priority,
+        )
 
     def attacked(self, damage):
-        new_hp = self.hp - damage
-        if new_hp < 0:
-            new_hp = 0
-        self.hp = new_hp
+        # Clamped in SQL against the row itself, so concurrent attacks can't lose damage.
+        apply_delta(self._boss, "hp", -damage, floor=0, ceiling="max_hp")
 
     def full_heal(self):
         self.hp = self.max_hp
 
+    def lock(self):
+        """
+        Re-read the row with SELECT ... FOR UPDATE; inside a transaction, attacks on this boss
+        then queue behind each other and each sees the previous one's hp, phase and status.
+        """
+        self._boss.refresh_from_db(from_queryset=ProjectBoss.objects.select_for_update())
+
+    def advance_phase(self, from_phase, hp, updated_at):
+        """
+        Start phase `from_phase + 1` at full `hp`. Guarded on the row still being alive in
+        `from_phase`, so of several attacks that all brought it to 0 only one advances it.
+        Returns whether this call advanced the phase.
+        """
+        return update_if(
+            self._boss,
+            {"status": "Alive", "phase": from_phase},
+            phase=from_phase + 1,
+            max_hp=hp,
+            hp=hp,
+            updated_at=updated_at,
+        )
+
     def die(self):
-        self.status = "Dead"
-        self.hp = 0
-        self._boss.save(update_fields=["status", "hp"])
\ No newline at end of file
+        """
+        Kill the boss in its current phase; returns False if another caller already killed it
+        or moved it on to a new phase (which must not be killed by this blow).
+        """
+        return update_if(self._boss, {"status": "Alive", "phase": self._boss.phase}, hp=0, status="Dead")
\ No newline at end of file
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from api.models.Effect import Effect
+from api.models.Item import Item
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "workquest:catalog:version"
+
+GOOD = "GOOD"
+BAD = "BAD"
+COMMON = "common"
+RARE = "rare"
+EPIC = "epic"
+
+
+def rarity_of(effect: Any) -> str:
+    """
+    Bucket an effect's `rare_level` (unset counts as common). Bad effects have no epic tier.
+    """
+    level = int(effect.rare_level or 1)
+    if level == 1:
+        return COMMON
+    if level == 2 or effect.effect_polarity != GOOD:
+        return RARE
+    return EPIC
+
+
+class Catalog:
+    """
+    Read-only snapshot of the Effect/Item tables: effects bucketed by polarity and rarity, and
+    an effect -> item index. Shared across threads, so treat the model instances as immutable.
+    """
+
+    def __init__(self, effects: Iterable[Effect], items: Iterable[Item], *, version: Optional[int] = None):
+        self.version = version
+        self.effects = tuple(effects)
+        self._buckets: dict[tuple[str, str], tuple[Effect, ...]] = {}
+        for effect in self.effects:
+            polarity = GOOD if effect.effect_polarity == GOOD else BAD
+            key = (polarity, rarity_of(effect))
+            self._buckets[key] = self._buckets.get(key, ()) + (effect,)
+
+        # First item per effect in primary-key order (what `.filter(effects=...).first()` returned).
+        self._item_by_effect: dict[Any, Item] = {}
+        for item in items:
+            if item.effects_id is not None:
+                self._item_by_effect.setdefault(item.effects_id, item)
+
+    @classmethod
+    def load(cls, *, version: Optional[int] = None) -> "Catalog":
+        return cls(
+            Effect.objects.all(),
+            Item.objects.filter(effects__isnull=False).order_by("pk"),
+            version=version,
+        )
+
+    def bucket(self, polarity: str, rarity: str) -> tuple[Effect, ...]:
+        return self._buckets.get((polarity, rarity), ())
+
+    def item_for(self, effect: Any) -> Optional[Item]:
+        if effect is None:
+            return None
+        return self._item_by_effect.get(effect.pk)
+
+
+_lock = threading.Lock()
+_catalog: Optional[Catalog] = None
+_loaded_at = 0.0
+_checked_at = 0.0
+
+
+def _shared_version() -> Optional[int]:
+    try:
+        value = cache.get(VERSION_KEY)
+    except Exception:
+        # Redis down: keep serving the local copy until it reaches CATALOG_MAX_AGE_SECONDS.
+        logger.warning("catalog version check failed", exc_info=True)
+        return None
+    return int(value) if value is not None else 0
+
+
+def get_catalog() -> Catalog:
+    """
+    This worker's catalog, loaded on first use and reloaded when the shared version moves on.
+    """
+    global _catalog, _loaded_at, _checked_at
+
+    now = time.monotonic()
+    current = _catalog
+    check_every = float(getattr(settings, "CATALOG_VERSION_CHECK_SECONDS", 5))
+    max_age = float(getattr(settings, "CATALOG_MAX_AGE_SECONDS", 300))
+    if current is not None and now - _checked_at < check_every and now - _loaded_at < max_age:
+        return current
+
+    with _lock:
+        current = _catalog
+        now = time.monotonic()
+        if current is not None and now - _checked_at < check_every and now - _loaded_at < max_age:
+            return current
+
+        version = _shared_version()
+        _checked_at = now
+        stale = current is None or now - _loaded_at >= max_age
+        if not stale and version is not None and version != current.version:
+            stale = True
+        if stale:
+            current = Catalog.load(version=version)
+            _catalog = current
+            _loaded_at = now
+        return current
+
+
+def reset_catalog() -> None:
+    """
+    Drop this worker's copy (next `get_catalog()` reloads).
+    """
+    global _catalog
+    with _lock:
+        _catalog = None
+
+
+def bump_catalog_version() -> None:
+    """
+    Invalidate every worker's catalog after Effect/Item edits. Runs after commit so no worker
+    reloads the old rows.
+    """
+
+    def _bump() -> None:
+        reset_catalog()
+        try:
+            try:
+                cache.incr(VERSION_KEY)
+            except ValueError:
+                if not cache.add(VERSION_KEY, 1, timeout=None):
+                    cache.incr(VERSION_KEY)
+        except Exception:
+            logger.warning("catalog version bump failed; workers reload within CATALOG_MAX_AGE_SECONDS", exc_info=True)
+
+    if connection.in_atomic_block:
+        transaction.on_commit(_bump)
+    else:
+        _bump()
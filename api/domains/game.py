@@ -1,25 +1,27 @@
 from api.models.UserItem import UserItem
-from api.models.Item import Item
 from api.models.UserEffect import UserEffect
 from api.models.ProjectBoss import ProjectBoss
 from api.models.UserReport import UserReport
+from api.models.IdempotencyKey import IdempotencyKey
 from api.domains.boss import Boss as BossDomain
+from api.domains.project_member import ProjectMember as ProjectMemberDomain
 from api.models.Boss import Boss
 import random
 from django.utils import timezone
 from api.models import TaskLog
 from api.domains.review import Review
+from api.domains.catalog import get_catalog
 from api.dtos.review_dto import TaskFacts
 import math
 from api.utils.log_payloads import task_snapshot, project_member_snapshot
+from api.domains.unit_of_work import unit_of_work
 
 class Game:
     def __init__(self, project_domain):
         self._project = project_domain
         self._task_management = project_domain.TaskManagement
         self._project_member_management = project_domain.project_member_management
-        self._review = Review()
-        self._players = self._project_member_management.members
+        self._review = None
 
         self._boss = None
 
@@ -43,7 +45,14 @@ class Game:
         
     @property
     def players(self):
-        return self._players
+        return self._project_member_management.members
+
+    @property
+    def review(self):
+        # Built on first use; only support/review flows need it.
+        if self._review is None:
+            self._review = Review()
+        return self._review
     
     @property
     def boss(self):
@@ -62,6 +71,7 @@ class Game:
         self._boss = BossDomain(project_boss)
         return self._boss
 
+    @unit_of_work()
     def initial_boss_setup(self):
         existing = self.boss
         if existing is not None and existing.boss is not None:
@@ -96,31 +106,18 @@ class Game:
         self._boss.updated_at = timezone.now()
         return self._boss
 
+    @unit_of_work()
     def next_phase_boss_setup(self):
         """
         Setup the next phase for a normal boss.
 
         Returns a dict with phase/setup details when advanced, otherwise None.
         """
-        add_logs = TaskLog.objects.filter(
-            project_id=self._project.project.project_id,
-            actor_type=TaskLog.ActorType.USER,
-            event_type=TaskLog.EventType.TASK_CREATED,
-            created_at__gt=self.boss.updated_at,
-        )
-
-        delete_logs = TaskLog.objects.filter(
-            project_id=self._project.project.project_id,
-            actor_type=TaskLog.ActorType.USER,
-            event_type=TaskLog.EventType.TASK_DELETED,
-            created_at__gt=self.boss.updated_at,
-        )
-
-        if not add_logs.exists():
+        # Counters kept by TaskManagement.create_task/delete_task since the last phase setup.
+        added_tasks, add_value, delete_value = self.boss.task_changes
+        if not added_tasks:
             return None
 
-        add_value = sum(int((log.payload or {}).get("task_priority_snapshot") or 0) for log in add_logs)
-        delete_value = sum(int((log.payload or {}).get("task_priority_snapshot") or 0) for log in delete_logs)
         net_change = add_value - delete_value
         # Preserve existing gate: only advance phase if the net task-priority increased.
         if net_change <= 0:
@@ -135,13 +132,11 @@ class Game:
         )
         hp_change = int(boss_hp_units * self.BASE_BOSS_HP)
         
-        # set up boss next phase
+        # set up boss next phase (one guarded UPDATE: a concurrent killing blow can't advance it twice)
         from_phase = int(self.boss.phase or 1)
-        self.boss.max_hp = hp_change
-        self.boss.hp = hp_change
-        self.boss.phase += 1
-
-        self.boss.updated_at = timezone.now()
+        if not self.boss.advance_phase(from_phase, hp_change, timezone.now()):
+            return None
+        self.boss.consume_task_changes(added_tasks, add_value, delete_value)
 
         return {
             "project_boss_id": str(self.boss.project_boss.project_boss_id),
@@ -179,6 +174,8 @@ class Game:
         return project_boss_model
 
 
+    @TaskLog.batch()
+    @unit_of_work()
     def player_attack(self, player_id, task):
         """
         player_id : ID of the player who attacks
@@ -200,7 +197,7 @@ class Game:
         if not task.is_completed():
             raise ValueError("Task is not completed")
         
-        effects = player.effects()
+        effects = ProjectMemberDomain.effects_for([player])[str(player.project_member_id)]
 
         time_left = task.deadline - timezone.now()
         time_left_percent = time_left / (task.deadline - task.created_at) 
@@ -223,18 +220,20 @@ class Game:
         damage = self.BASE_PLAYER_DAMAGE * task.priority * time_weight
         # buff or debuff effect
 
+        consumed = []
         for user_effect in effects:
             if user_effect.effect.effect_type == "DAMAGE_BUFF":
                 damage = damage + (user_effect.effect.value * damage) 
                 # one-time effects are consumed on attack
-                player.clear_effect(user_effect)
+                consumed.append(user_effect)
             elif user_effect.effect.effect_type == "DAMAGE_DEBUFF":
                 damage = damage - (user_effect.effect.value * damage)
                 # one-time effects are consumed on attack
-                player.clear_effect(user_effect)
+                consumed.append(user_effect)
+        ProjectMemberDomain.clear_effects(consumed)
 
         score = damage * self.BASE_SCORE
-        player.score = player.score + score
+        player.add_score(score)
         self.boss.attacked(damage)
 
         TaskLog.write(
@@ -252,19 +251,21 @@ class Game:
             },
         )
         
+        # Several attacks can bring the boss to 0 at once; the phase advance and die() are guarded
+        # UPDATEs, so only one of them runs the transition and writes its log.
         if self.boss.hp <= 0:
             boss_type = (self.boss.boss.boss_type or "").lower()
             if boss_type == "normal":
                 next_phase = self.next_phase_boss_setup()
                 if next_phase is None:
-                    self.boss.die()
-                    TaskLog.write(
-                        project_id=self._project.project.project_id,
-                        actor_type=TaskLog.ActorType.USER,
-                        actor_id=player.project_member_id,
-                        event_type=TaskLog.EventType.KILL_BOSS,
-                        payload={"player_id": str(player.project_member_id)},
-                    )
+                    if self.boss.die():
+                        TaskLog.write(
+                            project_id=self._project.project.project_id,
+                            actor_type=TaskLog.ActorType.USER,
+                            actor_id=player.project_member_id,
+                            event_type=TaskLog.EventType.KILL_BOSS,
+                            payload={"player_id": str(player.project_member_id)},
+                        )
                 else:
                     phase_advanced = True
                     TaskLog.write(
@@ -280,8 +281,7 @@ class Game:
                             **(next_phase or {}),
                         },
                     )
-            else:
-                self.boss.die()
+            elif self.boss.die():
                 TaskLog.write(
                     project_id=self._project.project.project_id,
                     actor_type=TaskLog.ActorType.USER,
@@ -303,12 +303,19 @@ class Game:
             "boss_phase_advanced": phase_advanced,
         } 
 
+    @TaskLog.batch()
+    @unit_of_work()
     def boss_attack(self, task):
         """
         task: Task that the boss attacks with (Task domain object)
         effect: Buff or Debuff effect on the attack (Event model object)
         """
-        target_players = task.get_assigned_members()
+        # Resolve assignees against the project's member list so the updated HP/status is
+        # visible to anything reading this domain afterwards (e.g. the status write-through).
+        target_players = [
+            self._project_member_management.get_member(str(p.project_member_id)) or p
+            for p in task.get_assigned_members()
+        ]
         if not target_players:
             raise ValueError("No players assigned to this task")
         
@@ -316,22 +323,25 @@ class Game:
             raise ValueError("Task is completed")
         
         attacked_players =  []
+        # One query for every target's effects; consumed ones are deleted together below.
+        effects_by_player = ProjectMemberDomain.effects_for(p for p in target_players if p.status != "Dead")
+        consumed = []
 
         for player in target_players:
             if player.status == "Dead":
                 continue
-            effects = player.effects()
+            effects = effects_by_player[str(player.project_member_id)]
             # Calculate damage per-player so effects don't leak across players.
             damage = self.BASE_BOSS_DAMAGE * (task.priority)
             for user_effect in effects:
                 if user_effect.effect.effect_type == "DEFENCE_BUFF":
                     damage = damage - (user_effect.effect.value * damage)
                     # one-time effects are consumed on attack
-                    player.clear_effect(user_effect)
+                    consumed.append(user_effect)
                 elif user_effect.effect.effect_type == "DEFENCE_DEBUFF":
                     damage = damage + (user_effect.effect.value * damage)
                     # one-time effects are consumed on attack
-                    player.clear_effect(user_effect)
+                    consumed.append(user_effect)
             # Never allow negative damage (would heal and can violate domain invariants).
             damage = max(damage, 0)
             player.attacked(damage)
@@ -355,8 +365,8 @@ class Game:
                 },
             )
 
-            if player.hp <= 0 :
-                player.die()
+            # die() is a guarded UPDATE: of two hits that both leave the player at 0, one logs the kill.
+            if player.hp <= 0 and player.die():
                 TaskLog.write(
                     project_id=self._project.project.project_id,
                     actor_type=TaskLog.ActorType.BOSS,
@@ -371,6 +381,7 @@ class Game:
                     },
                 )
     
+        ProjectMemberDomain.clear_effects(consumed)
         
         # boss_attack_log = BossAttack.objects.create(
         #     project_boss=self._boss.project_boss,
@@ -382,6 +393,8 @@ class Game:
             "attacked_players": attacked_players
         }
     
+    @TaskLog.batch()
+    @unit_of_work()
     def player_support(self, report_domain):
         """
         Apply "support" from a review/report to one or more receivers.
@@ -397,21 +410,6 @@ class Game:
         if task is None:
             raise ValueError("report_domain.task is required")
        
-        # Guard: support is one-time per report_id (avoid farming / double apply)
-        support_event_types = (
-            TaskLog.EventType.GIVE_ITEM,
-            TaskLog.EventType.APPLY_BUFF,
-            TaskLog.EventType.APPLY_DEBUFF,
-            TaskLog.EventType.HEAL,
-        )
-        already_supported = TaskLog.objects.filter(
-            project_id=self._project.project.project_id,
-            event_type__in=support_event_types,
-            payload__report_id=str(report_domain.report_id),
-        ).exists()
-        if already_supported:
-            raise ValueError("Support already applied")
-
 
         def _ts(dt):
             return dt.timestamp() if dt is not None else None
@@ -422,7 +420,7 @@ class Game:
             completed_at_ts=_ts(task.completed_at),
             deadline_ts=_ts(task.deadline),
         )
-        trust_scores = self._review.trust_policy.compute(facts, report_domain.sentiment_score)
+        trust_scores = self.review.trust_policy.compute(facts, report_domain.sentiment_score)
         weighted_sentiment_score = float(trust_scores.get("weight_sentiment_score"))
 
         # Determine receivers: ONLY those targeted by this review (UserReport rows).
@@ -443,11 +441,20 @@ class Game:
                 continue
             receivers.append(receiver_domain)
 
+        # Guard: support is one-time per report_id (avoid farming / double apply). The claim
+        # rolls back with the caller's transaction if applying the support fails.
+        if not IdempotencyKey.claim(
+            IdempotencyKey.Kind.REPORT_SUPPORT,
+            report_domain.report_id,
+            project_id=self._project.project.project_id,
+        ):
+            raise ValueError("Support already applied")
+
         # --- Score calculation (use Review domain method only) ---
-        reporter_score = int(self._review.calculate_player_score(facts, report_domain.sentiment_score))
+        reporter_score = int(self.review.calculate_player_score(facts, report_domain.sentiment_score))
 
         reporter = report_domain.reporter
-        reporter.score = reporter.score + reporter_score
+        reporter.add_score(reporter_score)
 
         applied = []
         for receiver in receivers:
@@ -462,7 +469,7 @@ class Game:
                 )
                 continue
             # effect recieve
-            effect = self._review.decide_effect(facts, report_domain.sentiment_score)
+            effect = self.review.decide_effect(facts, report_domain.sentiment_score)
             if effect is None:
                 applied.append(
                     {
@@ -477,7 +484,7 @@ class Game:
             rand_choice = random.choice(choice)
             item = None
             if effect is not None:
-                item = Item.objects.filter(effects=effect).first()
+                item = get_catalog().item_for(effect)
             if item is None:
                 rand_choice = "effect"
             if rand_choice == "item":
@@ -615,6 +622,7 @@ class Game:
             "applied": applied,
         }
 
+    @unit_of_work()
     def player_heal(
         self,
         Healer_id,
@@ -682,6 +690,7 @@ class Game:
         }
     
 
+    @unit_of_work()
     def player_use_item(self, player_id, item_id):
         """
         Consume a user's owned item and apply its effect.
@@ -794,6 +803,7 @@ class Game:
             },
         }
     
+    @unit_of_work()
     def player_revive(self, player_id):
         player = self._project_member_management.get_member(player_id)
         if player.status == "Alive":
@@ -6,9 +6,11 @@ from .game import Game
 class Project:
     def __init__(self, project_model):
         self._project = project_model
-        self._project_member_management = ProjectMemberManagement(project_model)
-        self._task_management = TaskManagement(project_model)
-        self._game = Game(self)
+        # Built on first use: most requests only need one of them (or none, e.g. check_access
+        # only touches member management).
+        self._project_member_management = None
+        self._task_management = None
+        self._game = None
 
 
     @property
@@ -17,14 +19,20 @@ class Project:
     
     @property
     def TaskManagement(self):
+        if self._task_management is None:
+            self._task_management = TaskManagement(self._project)
         return self._task_management
     
     @property
     def project_member_management(self):
+        if self._project_member_management is None:
+            self._project_member_management = ProjectMemberManagement(self._project)
         return self._project_member_management
 
     @property
     def game(self):
+        if self._game is None:
+            self._game = Game(self)
         return self._game
 
     def edit_project_metadata(self, project_data):
@@ -54,11 +62,11 @@ class Project:
         return self._project
 
     def check_access(self, user):
-        is_member = self._project_member_management.is_member(user)
+        is_member = self.project_member_management.is_member(user)
         return is_member and self._project.status == "Working"
 
     def setup_boss(self):
         """
         Setup the boss for this project using the Game domain
         """
-        return self._game.initial_boss_setup()
\ No newline at end of file
+        return self.game.initial_boss_setup()
\ No newline at end of file
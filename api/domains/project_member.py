@@ -1,3 +1,5 @@
+from api.domains.atomic_update import apply_delta, update_if
+from api.domains.unit_of_work import save_fields
 from api.models.UserEffect import UserEffect
 
 class ProjectMember:
@@ -26,7 +28,7 @@ class ProjectMember:
     @status.setter
     def status(self, value):
         self._member.status = value
-        self._member.save(update_fields=["status"])
+        save_fields(self._member, "status")
 
     @property
     def hp(self):
@@ -41,7 +43,7 @@ class ProjectMember:
             raise ValueError("Player HP cannot exceed max_hp")
 
         self._member.hp = value
-        self._member.save(update_fields=["hp"])
+        save_fields(self._member, "hp")
 
     @property
     def max_hp(self):
@@ -57,7 +59,7 @@ class ProjectMember:
             self._member.hp = value
 
         self._member.max_hp = value
-        self._member.save(update_fields=["max_hp", "hp"])
+        save_fields(self._member, "max_hp", "hp")
 
     @property
     def score(self):
@@ -68,13 +70,33 @@ class ProjectMember:
             raise ValueError("Player score cannot be negative")
 
         self._member.score = value
-        self._member.save(update_fields=["score"])
+        save_fields(self._member, "score")
 
     def delete(self):
         self._member.delete()
 
     def effects(self):
-        return list(UserEffect.objects.filter(project_member=self._member))
+        return list(UserEffect.objects.select_related("effect").filter(project_member=self._member))
+
+    @staticmethod
+    def effects_for(members):
+        """
+        Active UserEffects (with their Effect) for every member in one query,
+        keyed by str(project_member_id).
+        """
+        by_member = {str(m.project_member_id): [] for m in members}
+        if not by_member:
+            return by_member
+        rows = UserEffect.objects.select_related("effect").filter(project_member_id__in=list(by_member))
+        for user_effect in rows:
+            by_member[str(user_effect.project_member_id)].append(user_effect)
+        return by_member
+
+    @staticmethod
+    def clear_effects(user_effects):
+        ids = [ue.pk for ue in user_effects]
+        if ids:
+            UserEffect.objects.filter(pk__in=ids).delete()
     
     def applied(self, effect):
         UserEffect.objects.create(
@@ -87,18 +109,16 @@ class ProjectMember:
 
 
     def attacked(self, damage):
-        new_hp = self.hp - damage
-        if new_hp < 0:
-            new_hp = 0
-        self.hp = new_hp
+        # Clamped in SQL against the row itself, so concurrent attacks can't lose damage.
+        apply_delta(self._member, "hp", -damage, floor=0, ceiling="max_hp")
 
     def heal(self, heal_amount):
-        new_hp = self.hp + heal_amount
-        if new_hp > self.max_hp:
-            new_hp = self.max_hp
-        self.hp = new_hp
+        apply_delta(self._member, "hp", heal_amount, floor=0, ceiling="max_hp")
+
+    def add_score(self, points):
+        apply_delta(self._member, "score", points, floor=0)
 
     def die(self):
-        self.status = "Dead"
-        self.hp = 0
+        # False when a concurrent attack already killed this player (it logs the kill, not us).
+        return update_if(self._member, {"status": "Alive"}, hp=0, status="Dead")
   
\ No newline at end of file
@@ -1,6 +1,14 @@
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+
 from api.models.ProjectMember import ProjectMember as ProjectMemberModel
 from .project_member import ProjectMember as ProjectMemberDomain
 
+logger = logging.getLogger(__name__)
+
+
 class ProjectMemberManagement:
     def __init__(self, project_model):
         self.project = project_model
@@ -14,7 +22,7 @@ class ProjectMemberManagement:
         if self._members is None:
             model_members = ProjectMemberModel.objects.filter(
                 project=self.project
-            ).select_related("user")
+            ).select_related("user", "user__auth_user")
             self._members = [ProjectMemberDomain(member) for member in model_members]
         return self._members
 
@@ -28,6 +36,7 @@ class ProjectMemberManagement:
         )
         new_member_domain = ProjectMemberDomain(new_member)
         self._members = None
+        self._invalidate_member_ids()
         return new_member_domain
 
     def get_member(self, member_id):
@@ -52,14 +61,70 @@ class ProjectMemberManagement:
         return member
 
     def remove_member(self, member_id):
-        for idx, member in enumerate(self._members):
-            if member.id == member_id:
-                member.delete()          
-                del self._members[idx]   
+        for idx, member in enumerate(self.members):
+            if str(member.project_member_id) == str(member_id):
+                member.delete()
+                del self._members[idx]
+                self._invalidate_member_ids()
                 return True
-    
+        return False
+
     def is_member(self, user):
-        for i in self.members:
-            if i.user == user:
-                return True
-        return False 
\ No newline at end of file
+        """
+        Whether `user` (a BusinessUser) belongs to the project. Uses the loaded members if any,
+        else the cached member-ID set, else one EXISTS on the (project, user) unique index.
+        """
+        if self._members is not None:
+            return any(member.user == user for member in self._members)
+        user_id = getattr(user, "pk", None)
+        if user_id is None:
+            return False
+        member_ids = self._cached_member_ids()
+        if member_ids is not None:
+            return str(user_id) in member_ids
+        return ProjectMemberModel.objects.filter(project=self.project, user_id=user_id).exists()
+
+    def _cached_member_ids(self):
+        """
+        The project's member user IDs (as strings) from the cache, loading them on a miss.
+        None when the cache is disabled or unavailable.
+        """
+        ttl = int(getattr(settings, "PROJECT_MEMBER_CACHE_SECONDS", 0))
+        if ttl <= 0:
+            return None
+        from api.services.cache_service import CacheService
+
+        try:
+            cache_svc = CacheService()
+            key = cache_svc.keys.project_member_ids(self.project.pk)
+            member_ids = cache_svc.get(key)
+            if member_ids is None:
+                member_ids = frozenset(
+                    str(user_id)
+                    for user_id in ProjectMemberModel.objects.filter(project=self.project).values_list("user_id", flat=True)
+                )
+                cache_svc.set(key, member_ids, ttl_seconds=ttl)
+            return member_ids
+        except Exception:
+            logger.warning("project member cache unavailable", exc_info=True)
+            return None
+
+    def _invalidate_member_ids(self):
+        if int(getattr(settings, "PROJECT_MEMBER_CACHE_SECONDS", 0)) <= 0:
+            return
+        from api.services.cache_service import CacheService
+
+        project_id = self.project.pk
+
+        def _delete():
+            try:
+                cache_svc = CacheService()
+                cache_svc.delete(cache_svc.keys.project_member_ids(project_id))
+            except Exception:
+                logger.warning("project member cache invalidation failed", exc_info=True)
+
+        # After commit, so a concurrent check can't re-cache the pre-change set.
+        if connection.in_atomic_block:
+            transaction.on_commit(_delete)
+        else:
+            _delete()
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import random
 from typing import Optional, Literal, Protocol
 
-from api.models.Effect import Effect
+from api.domains.catalog import BAD, COMMON, EPIC, GOOD, RARE, get_catalog
 from api.dtos.review_dto import TaskFacts
 from api.domains.trust_score_policy import TrustScorePolicy, AlignmentTrustScorePolicy
 
@@ -32,29 +32,13 @@ class Review:
         if self._effects_loaded:
             return
 
-        # reset buckets (avoid duplicates if called multiple times)
-        self.good_common_effects = []
-        self.good_rare_effects = []
-        self.good_epic_effects = []
-        self.bad_common_effects = []
-        self.bad_rare_effects = []
-
-        for e in Effect.objects.all():
-            rare = int(e.rare_level or 1)
-            is_good = (e.effect_polarity == "GOOD")
-
-            if is_good:
-                if rare == 1:
-                    self.good_common_effects.append(e)
-                elif rare == 2:
-                    self.good_rare_effects.append(e)
-                else:
-                    self.good_epic_effects.append(e)
-            else:
-                if rare == 1:
-                    self.bad_common_effects.append(e)
-                else:
-                    self.bad_rare_effects.append(e)
+        # Buckets come from the worker-wide catalog (no query per Review).
+        catalog = get_catalog()
+        self.good_common_effects = list(catalog.bucket(GOOD, COMMON))
+        self.good_rare_effects = list(catalog.bucket(GOOD, RARE))
+        self.good_epic_effects = list(catalog.bucket(GOOD, EPIC))
+        self.bad_common_effects = list(catalog.bucket(BAD, COMMON))
+        self.bad_rare_effects = list(catalog.bucket(BAD, RARE))
 
         self._effects_loaded = True
         
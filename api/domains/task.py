@@ -1,4 +1,5 @@
 from api.domains.project_member import ProjectMember
+from api.domains.unit_of_work import save_fields
 from api.models import UserTask
 
 
@@ -25,7 +26,7 @@ class Task:
     @priority.setter
     def priority(self, value):
         self._task.priority = value
-        self._task.save(update_fields=["priority"])
+        save_fields(self._task, "priority")
 
     @property
     def task_name(self):
@@ -34,7 +35,7 @@ class Task:
     @task_name.setter
     def task_name(self, value):
         self._task.task_name = value
-        self._task.save(update_fields=["task_name"])
+        save_fields(self._task, "task_name")
 
     @property
     def description(self):
@@ -43,7 +44,7 @@ class Task:
     @description.setter
     def description(self, value):
         self._task.description = value
-        self._task.save(update_fields=["description"])
+        save_fields(self._task, "description")
 
     @property
     def status(self):
@@ -52,7 +53,7 @@ class Task:
     @status.setter
     def status(self, value):
         self._task.status = value
-        self._task.save(update_fields=["status"])
+        save_fields(self._task, "status")
 
     @property
     def deadline(self):
@@ -61,7 +62,7 @@ class Task:
     @deadline.setter
     def deadline(self, value):
         self._task.deadline = value
-        self._task.save(update_fields=["deadline"])
+        save_fields(self._task, "deadline")
 
     @property
     def created_at(self):
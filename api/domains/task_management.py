@@ -2,11 +2,13 @@ from api.models.Task import Task
 from api.models.TaskLog import TaskLog
 from api.models.UserTask import UserTask
 from api.models.ProjectMember import ProjectMember
+from api.models.ProjectBoss import ProjectBoss
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from .task import Task as TaskDomain
 from api.domains.project_member import ProjectMember as ProjectMemberDomain
+from api.domains.unit_of_work import unit_of_work
 from api.utils.log_payloads import task_snapshot, project_member_snapshot
 
 
@@ -29,33 +31,37 @@ class TaskManagement:
         return Task.objects.filter(project=self.project)
 
     def create_task(self, task_data, user):
-        new_task = Task.objects.create(
-            project=self.project,
-            priority=task_data.get("priority", 0),
-            task_name=task_data.get("task_name"),
-            description=task_data.get("description"),
-            status=task_data.get("status", "backlog"),
-            deadline=task_data.get("deadline")
-        )
-        new_task_domain = TaskDomain(new_task)
-        self._tasks = None
-        self.project.total_tasks += 1
-        self.project.save()
+        with transaction.atomic():
+            new_task = Task.objects.create(
+                project=self.project,
+                priority=task_data.get("priority", 0),
+                task_name=task_data.get("task_name"),
+                description=task_data.get("description"),
+                status=task_data.get("status", "backlog"),
+                deadline=task_data.get("deadline")
+            )
+            new_task_domain = TaskDomain(new_task)
+            self._tasks = None
+            self.project.total_tasks += 1
+            self.project.save()
+            ProjectBoss.record_task_change(
+                self.project, added_tasks=1, added_priority=int(new_task.priority or 0)
+            )
 
-        project_member = ProjectMember.objects.get(user=user, project=self.project)
-        TaskLog.write(
-            project_id=self.project.project_id,
-            actor_type=TaskLog.ActorType.USER,
-            actor_id=project_member.project_member_id,
-            event_type=TaskLog.EventType.TASK_CREATED,
-            payload={
-                "task_id": str(new_task.task_id),
-                "task_priority_snapshot": int(new_task.priority or 0),
-                "task": task_snapshot(new_task),
-                "actor": project_member_snapshot(project_member),
-            },
-        )
-        return new_task_domain
+            project_member = ProjectMember.objects.get(user=user, project=self.project)
+            TaskLog.write(
+                project_id=self.project.project_id,
+                actor_type=TaskLog.ActorType.USER,
+                actor_id=project_member.project_member_id,
+                event_type=TaskLog.EventType.TASK_CREATED,
+                payload={
+                    "task_id": str(new_task.task_id),
+                    "task_priority_snapshot": int(new_task.priority or 0),
+                    "task": task_snapshot(new_task),
+                    "actor": project_member_snapshot(project_member),
+                },
+            )
+            return new_task_domain
 
     def get_task(self, task_id):
         # If tasks cache is already loaded, do an in-memory lookup (no DB hit).
@@ -73,6 +79,7 @@ class TaskManagement:
             return None
         
         
+    @unit_of_work()
     def edit_task(self, task_id, task_data, user):
         task = self.get_task(task_id)
         if not task:
@@ -105,6 +112,7 @@ class TaskManagement:
         )
         return task
     
+    @unit_of_work()
     def move_task(self, task_id, task_data, user):
         EVENT = TaskLog.EventType.TASK_UPDATED
         task = self.get_task(task_id)
@@ -178,6 +186,8 @@ class TaskManagement:
                 },
             )
             
+            ProjectBoss.record_task_change(self.project, deleted_priority=int(task.priority or 0))
+
             # delete any UserTask assignments that reference this task
             UserTask.objects.filter(task=task._task).delete()
 
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+
+class UnitOfWork:
+    """
+    Dirty-field tracker: domain setters record which fields of which model row changed, and
+    `flush()` writes each row once with all of its dirty fields (one UPDATE per row).
+    """
+
+    def __init__(self) -> None:
+        self._dirty: dict[int, tuple[Any, set[str]]] = {}
+
+    def mark(self, model: Any, fields: tuple[str, ...]) -> None:
+        _, dirty = self._dirty.setdefault(id(model), (model, set()))
+        dirty.update(fields)
+
+    def dirty_fields(self, model: Any) -> set[str]:
+        entry = self._dirty.get(id(model))
+        return set(entry[1]) if entry else set()
+
+    def flush_row(self, model: Any) -> None:
+        entry = self._dirty.pop(id(model), None)
+        if entry is not None:
+            model.save(update_fields=sorted(entry[1]))
+
+    def flush(self) -> None:
+        pending = list(self._dirty.values())
+        self._dirty.clear()
+        for model, fields in pending:
+            model.save(update_fields=sorted(fields))
+
+
+_current: ContextVar[Optional[UnitOfWork]] = ContextVar("workquest_unit_of_work", default=None)
+
+
+def save_fields(model: Any, *fields: str) -> None:
+    """
+    Persist `fields` of `model`: deferred to the active unit of work, else saved right away.
+    """
+    uow = _current.get()
+    if uow is None:
+        model.save(update_fields=list(fields))
+        return
+    uow.mark(model, fields)
+
+
+def flush_pending(model: Any, *fields: str) -> None:
+    """
+    Write `model`'s pending changes now if any of `fields` is dirty in the active unit of work
+    (needed before SQL that reads those columns back, e.g. atomic F() updates).
+    """
+    uow = _current.get()
+    if uow is not None and uow.dirty_fields(model).intersection(fields):
+        uow.flush_row(model)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """
+    Coalesce domain setter writes until the block (or decorated domain operation) ends.
+
+    Nested blocks join the outermost one. On success the dirty rows are flushed; if the block
+    raises they are discarded (the surrounding transaction is expected to roll back too).
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+    uow = UnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+    finally:
+        _current.reset(token)
+    uow.flush()
@@ -13,3 +13,9 @@ class ProjectLogReadDTO:
     payload: dict[str, Any]
     created_at: datetime
 
+
+
+@dataclass(frozen=True)
+class ProjectLogPageDTO:
+    logs: list[ProjectLogReadDTO]
+    next_cursor: Optional[str]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pickle
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.services import cache_codec
+
+
+def sample_game_logs(count: int) -> list[dict]:
+    """
+    Synthetic `project_game_logs` payload shaped like `asdict(ProjectLogReadDTO)` rows.
+    """
+    now = timezone.now()
+    project_id = str(uuid.uuid4())
+    members = [
+        {
+            "project_member_id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "username": f"player{i}",
+            "status": "Alive",
+            "hp": 80 + i,
+            "max_hp": 100,
+            "score": 1200 + i * 7,
+        }
+        for i in range(5)
+    ]
+    logs = []
+    for i in range(count):
+        member = members[i % len(members)]
+        created = now - timedelta(minutes=i)
+        logs.append(
+            {
+                "id": str(uuid.uuid4()),
+                "project_id": project_id,
+                "actor_type": "user" if i % 3 else "system",
+                "actor_id": member["user_id"],
+                "event_type": "USER_ATTACK" if i % 3 else "BOSS_ATTACK",
+                "payload": {
+                    "task_id": str(uuid.uuid4()),
+                    "task": {
+                        "task_id": str(uuid.uuid4()),
+                        "task_name": f"Implement feature #{i}",
+                        "description": "Wire the new endpoint into the dashboard and add tests.",
+                        "status": "done",
+                        "priority": i % 4,
+                        "deadline": (created + timedelta(days=3)).isoformat(),
+                        "created_at": (created - timedelta(days=2)).isoformat(),
+                        "completed_at": created.isoformat(),
+                    },
+                    "project_member": member,
+                    "damage": 10 + i % 25,
+                    "boss_hp": max(0, 5000 - i * 3),
+                    "player_hp": member["hp"],
+                },
+                "created_at": created,
+            }
+        )
+    return logs
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark cached-payload codecs against plain pickle on a realistic "
+        "project_game_logs payload: stored size and encode/decode time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logs", type=int, default=500, help="Log rows in the sample payload.")
+        parser.add_argument("--iterations", type=int, default=200, help="Encode/decode rounds per codec.")
+
+    def handle(self, *args, **opts):
+        logs = max(int(opts["logs"]), 1)
+        iterations = max(int(opts["iterations"]), 1)
+        value = sample_game_logs(logs)
+
+        rows = [
+            (
+                "pickle (current)",
+                *self._bench(lambda: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads, iterations),
+            )
+        ]
+        for name in ("pickle", "json", "msgpack"):
+            codec = cache_codec.CODECS[name]
+            label = f"{name}+compress" if codec.name == name else f"{name} (-> {codec.name})+compress"
+            rows.append(
+                (
+                    label,
+                    *self._bench(
+                        lambda codec=codec: cache_codec.encode(codec, value),
+                        lambda raw: cache_codec.decode(raw)[0],
+                        iterations,
+                    ),
+                )
+            )
+
+        self.stdout.write(f"payload: {logs} log rows, {iterations} iterations")
+        header = f"{'codec':<28} {'bytes':>10} {'encode_us':>11} {'decode_us':>11}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for label, size, enc_us, dec_us in rows:
+            self.stdout.write(f"{label:<28} {size:>10} {enc_us:>11.1f} {dec_us:>11.1f}")
+
+    @staticmethod
+    def _bench(dumps, loads, iterations: int) -> tuple[int, float, float]:
+        raw = dumps()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            dumps()
+        encode_us = (time.perf_counter() - started) * 1e6 / iterations
+        started = time.perf_counter()
+        for _ in range(iterations):
+            loads(raw)
+        decode_us = (time.perf_counter() - started) * 1e6 / iterations
+        return len(raw), encode_us, decode_us
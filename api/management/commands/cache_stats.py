@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from api.services.cache_metrics import cache_metrics
+
+
+class Command(BaseCommand):
+    help = "Print per-key-family cache hit/miss, loader time and payload counters (aggregated across workers)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the raw snapshot as JSON.",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Clear all counters after printing them.",
+        )
+
+    def handle(self, *args, **opts):
+        families = cache_metrics.snapshot()
+
+        if opts.get("json"):
+            self.stdout.write(json.dumps(families, indent=2, sort_keys=True))
+        elif not families:
+            self.stdout.write("No cache metrics recorded.")
+        else:
+            header = (
+                f"{'family':<32} {'hits':>8} {'l1':>8} {'misses':>8} {'ratio':>7} "
+                f"{'loads':>7} {'avg_ms':>9} {'avg_bytes':>10} {'pat_del':>8} {'keys_del':>9}"
+            )
+            self.stdout.write(header)
+            self.stdout.write("-" * len(header))
+            for family, m in families.items():
+                self.stdout.write(
+                    f"{family:<32} {m['hits']:>8} {m['l1_hits']:>8} {m['misses']:>8} "
+                    f"{_fmt(m['hit_ratio']):>7} {m['loads']:>7} {_fmt(m['avg_loader_ms']):>9} "
+                    f"{_fmt(m['avg_payload_bytes']):>10} {m['pattern_deletes']:>8} {m['keys_deleted']:>9}"
+                )
+
+        if opts.get("reset"):
+            cache_metrics.reset()
+            self.stdout.write(self.style.SUCCESS("Cache metrics reset."))
+
+
+def _fmt(value) -> str:
+    return "-" if value is None else str(value)
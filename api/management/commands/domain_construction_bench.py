@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.domains.project import Project as ProjectDomain
+from api.models import BusinessUser, Project, ProjectMember
+from api.services.game_service import GameService
+from api.services.task_service import TaskService
+
+
+@contextmanager
+def eager_construction():
+    """
+    Build every ProjectDomain component in the constructor, as it did before construction
+    became lazy (members were loaded by Game.__init__).
+    """
+    original = ProjectDomain.__init__
+
+    def __init__(self, project_model):
+        original(self, project_model)
+        game = self.game
+        game.players
+        game.review
+
+    ProjectDomain.__init__ = __init__
+    try:
+        yield
+    finally:
+        ProjectDomain.__init__ = original
+
+
+class Command(BaseCommand):
+    help = (
+        "Per-request ProjectDomain construction cost (time and query count) on the "
+        "task_list, get_project_logs and get_game_status paths, eager vs lazy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project-id", help="Project to benchmark (default: the first project with members).")
+        parser.add_argument("--iterations", type=int, default=200, help="Requests per path and mode.")
+
+    def handle(self, *args, **opts):
+        iterations = max(int(opts["iterations"]), 1)
+        member = ProjectMember.objects.select_related("project", "user")
+        if opts.get("project_id"):
+            member = member.filter(project_id=opts["project_id"])
+        member = member.order_by("project_id").first()
+        if member is None:
+            raise CommandError("No project with members found.")
+        project_id = member.project.project_id
+        user = BusinessUser.objects.get(pk=member.user_id)
+
+        # Only the work a cache miss does before the loader runs (plus game status, which is
+        # all domain work); the cache layer itself is not exercised.
+        def task_list():
+            svc = TaskService(project_id, user)
+            svc._domain.check_access(user)
+
+        def get_project_logs():
+            ProjectDomain(Project.objects.get(project_id=project_id)).check_access(user)
+
+        def get_game_status():
+            try:
+                GameService().get_game_status(project_id)
+            except ValueError:
+                pass  # no boss yet: the domain work up to that point is still measured
+
+        paths = [("task_list", task_list), ("get_project_logs", get_project_logs), ("get_game_status", get_game_status)]
+
+        self.stdout.write(f"project {project_id}, {iterations} iterations")
+        header = f"{'path':<20} {'mode':<6} {'queries':>8} {'us/request':>11}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for name, fn in paths:
+            with eager_construction():
+                self._report(name, "eager", fn, iterations)
+            self._report(name, "lazy", fn, iterations)
+
+    def _report(self, name, mode, fn, iterations):
+        with CaptureQueriesContext(connection) as queries:
+            fn()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        per_request_us = (time.perf_counter() - started) * 1e6 / iterations
+        self.stdout.write(f"{name:<20} {mode:<6} {len(queries):>8} {per_request_us:>11.1f}")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import time
+from collections import defaultdict
+
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from api.models.IdempotencyKey import IdempotencyKey
 from api.models.Task import Task
 from api.models.TaskLog import TaskLog
 from api.services.game_service import GameService
@@ -11,12 +15,13 @@ from api.utils.log_payloads import task_snapshot
 
 
 ACTIVE_TASK_STATUSES = ("backlog", "todo", "inProgress")
+KIND = IdempotencyKey.Kind.OVERDUE_BOSS_ATTACK
 
 
 class Command(BaseCommand):
     help = (
         "Auto-triggers a boss attack ONCE for each overdue (deadline passed), incomplete task "
-        "that has at least one assignee. Uses TaskLog marker events for idempotency (no schema changes)."
+        "that has at least one assignee. Attacked tasks are claimed in the IdempotencyKey ledger."
     )
 
     def add_arguments(self, parser):
@@ -37,6 +42,14 @@ class Command(BaseCommand):
             default=None,
             help="Optional: only process tasks belonging to this project UUID.",
         )
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help=(
+                "Group overdue tasks by project: one transaction, lock query, idempotency claim "
+                "and game domain per project."
+            ),
+        )
 
     def handle(self, *args, **options):
         now = timezone.now()
@@ -66,6 +79,42 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS(f"[DRY RUN] {len(tasks)} task(s) matched."))
             return
 
+        started = time.perf_counter()
+        if options.get("batch"):
+            processed, attacked, failed = self._run_batched(tasks, now)
+        else:
+            processed, attacked, failed = self._run_per_task(tasks, now)
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Overdue boss attack complete. processed={processed} attacked={attacked} failed={failed} "
+                f"elapsed={elapsed:.2f}s throughput={rate:.1f} tasks/sec"
+            )
+        )
+
+    @staticmethod
+    def _is_due(task, now) -> bool:
+        return task.status != "done" and task.deadline is not None and task.deadline < now
+
+    @staticmethod
+    def _write_marker(task) -> None:
+        # System entry in the game log; idempotency itself lives in the IdempotencyKey ledger.
+        TaskLog.write(
+            project_id=task.project_id,
+            actor_type=TaskLog.ActorType.SYSTEM,
+            actor_id=None,
+            event_type=TaskLog.EventType.BOSS_ATTACK,
+            payload={
+                "task_id": str(task.task_id),
+                "task": task_snapshot(task),
+                "damage": 0,
+                "player_hp": None,
+            },
+        )
+
+    def _run_per_task(self, tasks, now):
         svc = GameService()
         processed = 0
         attacked = 0
@@ -79,46 +128,60 @@ class Command(BaseCommand):
                     locked = Task.objects.select_for_update().get(task_id=t.task_id)
 
                     # Re-check conditions under lock (idempotency + race safety)
-                    if locked.status == "done":
-                        continue
-                    if locked.deadline is None or locked.deadline >= now:
+                    if not self._is_due(locked, now):
                         continue
                     if not locked.assigned_members.exists():
                         continue
-                    if TaskLog.objects.filter(
-                        project_id=locked.project_id,
-                        actor_type=TaskLog.ActorType.SYSTEM,
-                        event_type=TaskLog.EventType.BOSS_ATTACK,
-                        payload__task_id=str(locked.task_id),
-                    ).exists():
+                    if not IdempotencyKey.claim(KIND, locked.task_id, project_id=locked.project_id):
                         continue
 
                     svc.boss_attack(str(locked.project_id), str(locked.task_id))
                     attacked += 1
-
-                    # Marker log so we don't re-attack the same overdue task on the next run.
-                    TaskLog.write(
-                        project_id=locked.project_id,
-                        actor_type=TaskLog.ActorType.SYSTEM,
-                        actor_id=None,
-                        event_type=TaskLog.EventType.BOSS_ATTACK,
-                        payload={
-                            "task_id": str(locked.task_id),
-                            "task": task_snapshot(locked),
-                            "damage": 0,
-                            "player_hp": None,
-                        },
-                    )
+                    self._write_marker(locked)
             except Exception as e:
                 failed += 1
                 self.stderr.write(
                     f"[ERROR] overdue boss attack failed task={t.task_id} project={t.project_id}: {e}"
                 )
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Overdue boss attack complete. processed={processed} attacked={attacked} failed={failed}"
-            )
-        )
+        return processed, attacked, failed
+
+    def _run_batched(self, tasks, now):
+        svc = GameService()
+        attacked = 0
+        failed = 0
 
+        candidates = defaultdict(list)
+        for t in tasks:
+            candidates[t.project_id].append(t.task_id)
+
+        for project_id, task_ids in candidates.items():
+            try:
+                # One transaction per project, so row locks are held for one project's attacks
+                # rather than the whole run, and one project's failure doesn't undo the others.
+                with transaction.atomic(), TaskLog.batch():
+                    # Lock the project's candidates at once (in a stable order, so overlapping runs
+                    # queue up instead of deadlocking), then claim all due ones in one insert.
+                    locked = list(
+                        Task.objects.select_for_update().filter(task_id__in=task_ids).order_by("task_id")
+                    )
+                    due = [t for t in locked if self._is_due(t, now)]
+                    claimed = IdempotencyKey.claim_many(KIND, {str(t.task_id): t.project_id for t in due})
+                    project_tasks = [t for t in due if str(t.task_id) in claimed]
+                    if not project_tasks:
+                        continue
+
+                    hit, skipped = svc.overdue_boss_attacks(str(project_id), project_tasks)
+                    for t in hit:
+                        self._write_marker(t)
+                    # Not attacked this time: give the claims back so a later run can retry.
+                    IdempotencyKey.release(KIND, skipped)
+                attacked += len(hit)
+                for task_id, reason in skipped.items():
+                    self.stdout.write(f"[SKIP] task={task_id} project={project_id}: {reason}")
+            except Exception as e:
+                # The rollback also dropped this project's claims.
+                failed += len(task_ids)
+                self.stderr.write(f"[ERROR] overdue boss attack failed project={project_id}: {e}")
 
+        return len(tasks), attacked, failed
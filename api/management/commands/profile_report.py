@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pstats
+from collections import defaultdict
+from io import StringIO
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from api.services.request_profiler import iter_profiles, profiler_dir
+
+
+class Command(BaseCommand):
+    help = (
+        "List request profiles written by RequestProfilerMiddleware and summarize the top "
+        "offenders: slowest requests, hottest functions (cumulative time) and slowest SQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", help="Profile directory (default: REQUEST_PROFILER_DIR).")
+        parser.add_argument("--view", help="Only profiles of this URL name.")
+        parser.add_argument("--limit", type=int, default=10, help="Rows per section.")
+        parser.add_argument("--show", help="Print the full pstats report of one profile (file name or stem).")
+
+    def handle(self, *args, **opts):
+        directory = Path(opts["dir"]) if opts.get("dir") else profiler_dir()
+        limit = max(int(opts["limit"]), 1)
+
+        if opts.get("show"):
+            self._show(directory, opts["show"], limit)
+            return
+
+        profiles = [
+            (path, meta)
+            for path, meta in iter_profiles(directory)
+            if not opts.get("view") or meta.get("view") == opts["view"]
+        ]
+        if not profiles:
+            self.stdout.write(f"No profiles in {directory}.")
+            return
+
+        self.stdout.write(f"{len(profiles)} profile(s) in {directory}\n")
+        self._requests(profiles, limit)
+        self._functions(profiles, limit)
+        self._queries(profiles, limit)
+
+    def _requests(self, profiles, limit):
+        header = f"{'profile':<48} {'view':<28} {'status':>6} {'ms':>10} {'queries':>8} {'sql_ms':>9}"
+        self.stdout.write("Slowest requests")
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for path, meta in sorted(profiles, key=lambda p: p[1].get("ms", 0), reverse=True)[:limit]:
+            self.stdout.write(
+                f"{path.stem:<48} {str(meta.get('view')):<28} {meta.get('status', '-'):>6} "
+                f"{meta.get('ms', 0):>10.1f} {meta.get('query_count', 0):>8} {meta.get('query_ms', 0):>9.1f}"
+            )
+
+    def _functions(self, profiles, limit):
+        stats = pstats.Stats(str(profiles[0][0]), stream=StringIO())
+        for path, _meta in profiles[1:]:
+            stats.add(str(path))
+        # stats.stats: (file, line, func) -> (primitive calls, calls, tottime, cumtime, callers)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        rows = [(func, data) for func, data in rows if not _is_framework(func)][:limit]
+
+        header = f"{'cum_s':>9} {'tot_s':>9} {'calls':>9}  function"
+        self.stdout.write("\nHottest functions (cumulative, all profiles; Django/DRF internals omitted)")
+        self.stdout.write(header)
+        self.stdout.write("-" * 72)
+        for (filename, line, name), (_prim, calls, tottime, cumtime, _callers) in rows:
+            self.stdout.write(f"{cumtime:>9.4f} {tottime:>9.4f} {calls:>9}  {_short(filename)}:{line}({name})")
+
+    def _queries(self, profiles, limit):
+        totals: dict[str, list[float]] = defaultdict(lambda: [0, 0.0])
+        for _path, meta in profiles:
+            for query in meta.get("queries", []):
+                entry = totals[query["sql"]]
+                entry[0] += 1
+                entry[1] += query.get("ms", 0.0)
+
+        header = f"{'count':>7} {'total_ms':>10} {'avg_ms':>9}  sql"
+        self.stdout.write("\nSlowest SQL (total time, all profiles)")
+        self.stdout.write(header)
+        self.stdout.write("-" * 72)
+        for sql, (count, total_ms) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:limit]:
+            self.stdout.write(f"{count:>7} {total_ms:>10.1f} {total_ms / count:>9.2f}  {_clip(sql)}")
+
+    def _show(self, directory, name, limit):
+        path = directory / name
+        if path.suffix != ".prof":
+            path = directory / f"{Path(name).stem}.prof"
+        if not path.exists():
+            self.stderr.write(f"No profile {path}.")
+            return
+        stats = pstats.Stats(str(path), stream=self.stdout)
+        stats.sort_stats("cumulative").print_stats(limit)
+
+
+def _is_framework(func) -> bool:
+    filename = func[0]
+    return filename.startswith("~") or any(
+        part in filename for part in ("/django/", "/rest_framework/", "/rest_framework_simplejwt/")
+    )
+
+
+def _short(filename: str) -> str:
+    marker = "/api/"
+    return filename[filename.index(marker) + 1 :] if marker in filename else filename
+
+
+def _clip(sql: str, width: int = 140) -> str:
+    sql = " ".join(sql.split())
+    return sql if len(sql) <= width else sql[: width - 3] + "..."
@@ -1,7 +1,20 @@
+import logging
 import os
+import time
+from contextlib import ExitStack
 
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
 from django.http import JsonResponse
 from django.conf import settings
+
+from api.services.cache_service import CacheService
+from api.services.request_metrics import current_stats, request_metrics
+from api.services.request_profiler import ProfileCapture, request_finished, request_started, should_profile
+
+logger = logging.getLogger(__name__)
+
+
 class RefreshTokenMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -40,4 +53,101 @@ class InternalAPIKeyMiddleware:
                     status=403
                 )
         print("InternalAPIKeyMiddleware: API key valid, proceeding to view")
-        return self.get_response(request)
\ No newline at end of file
+        return self.get_response(request)
+
+
+class DeferredCacheInvalidationMiddleware:
+    """
+    Collect every cache invalidation a request makes and flush them once, after commit,
+    in a single Redis pipeline (views typically call several invalidate_* helpers in a row).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with CacheService.deferred_invalidation():
+            return self.get_response(request)
+
+
+class RequestMetricsMiddleware:
+    """
+    Record wall time, DB query count/time and cache calls for every request under its URL name
+    (`task_list`, `player_attack`, ...) in per-view latency histograms (see `request_metrics`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request_metrics.enabled:
+            return self.get_response(request)
+
+        token = request_metrics.start()
+        stats = current_stats()
+        started = time.perf_counter()
+        error = True
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(self._count_query(stats)))
+                response = self.get_response(request)
+            error = response.status_code >= 500
+            return response
+        finally:
+            match = getattr(request, "resolver_match", None)
+            view = (match.url_name or match.view_name) if match is not None else "unresolved"
+            request_metrics.finish(token, view, time.perf_counter() - started, error=error)
+
+    @staticmethod
+    def _count_query(stats):
+        def wrapper(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                stats.db_queries += 1
+                stats.db_seconds += time.perf_counter() - started
+
+        return wrapper
+
+
+class RequestProfilerMiddleware:
+    """
+    Opt-in cProfile + SQL capture for sampled requests (see `request_profiler.should_profile`),
+    written to REQUEST_PROFILER_DIR; summarize with `manage.py profile_report`. Removed from the
+    stack entirely unless REQUEST_PROFILER_ENABLED.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_PROFILER_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_started()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_finished()
+        capture = getattr(request, "_profile_capture", None)
+        if capture is not None:
+            capture.stop()
+            if capture.overlapped:
+                # Mixed with another thread's calls; only clean profiles are written.
+                logger.info("discarded profile of %s: another request ran concurrently", capture.view_name)
+                return response
+            path = capture.write(request, response.status_code)
+            if path is not None:
+                response["X-Profile-Id"] = path.stem
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = getattr(request, "resolver_match", None)
+        view_name = (match.url_name or match.view_name) if match is not None else "unresolved"
+        if should_profile(request, view_name):
+            try:
+                request._profile_capture = ProfileCapture(view_name).start()
+            except ValueError:
+                pass
+        return None
@@ -0,0 +1,68 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+SUPPORT_EVENT_TYPES = ("GIVE_ITEM", "APPLY_BUFF", "APPLY_DEBUFF", "HEAL")
+
+
+def backfill_from_task_logs(apps, schema_editor):
+    """
+    Seed the ledger from the TaskLog markers the old JSON-payload checks relied on, so actions
+    that already ran are not repeated after the switch.
+    """
+    TaskLog = apps.get_model("api", "TaskLog")
+    IdempotencyKey = apps.get_model("api", "IdempotencyKey")
+    db = schema_editor.connection.alias
+
+    sources = (
+        (
+            "overdue_boss_attack",
+            TaskLog.objects.using(db).filter(actor_type="system", event_type="BOSS_ATTACK", payload__has_key="task_id"),
+            "payload__task_id",
+        ),
+        (
+            "report_support",
+            TaskLog.objects.using(db).filter(event_type__in=SUPPORT_EVENT_TYPES, payload__has_key="report_id"),
+            "payload__report_id",
+        ),
+    )
+    for kind, logs, key_path in sources:
+        batch = []
+        for project_id, key in logs.values_list("project_id", key_path).distinct().iterator():
+            if not key:
+                continue
+            batch.append(IdempotencyKey(kind=kind, key=str(key), project_id=project_id))
+            if len(batch) >= 1000:
+                IdempotencyKey.objects.using(db).bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        IdempotencyKey.objects.using(db).bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0041_tasklog_created_at_default"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("overdue_boss_attack", "Overdue Boss Attack"), ("report_support", "Report Support")],
+                        max_length=32,
+                    ),
+                ),
+                ("key", models.CharField(max_length=64)),
+                ("project_id", models.UUIDField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("kind", "key"), name="uniq_idempotency_kind_key")],
+            },
+        ),
+        migrations.RunPython(backfill_from_task_logs, migrations.RunPython.noop),
+    ]
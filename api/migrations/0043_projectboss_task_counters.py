@@ -0,0 +1,57 @@
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    Seed the counters of live bosses from the TASK_CREATED/TASK_DELETED logs written since
+    their current phase was set up (what next-phase setup used to sum on every check).
+    """
+    ProjectBoss = apps.get_model("api", "ProjectBoss")
+    TaskLog = apps.get_model("api", "TaskLog")
+    db = schema_editor.connection.alias
+
+    for boss in ProjectBoss.objects.using(db).filter(status="Alive").iterator():
+        logs = TaskLog.objects.using(db).filter(
+            project_id=boss.project_id,
+            actor_type="user",
+            event_type__in=("TASK_CREATED", "TASK_DELETED"),
+            created_at__gt=boss.updated_at,
+        )
+        added_tasks = added = deleted = 0
+        for event_type, payload in logs.values_list("event_type", "payload").iterator():
+            priority = int((payload or {}).get("task_priority_snapshot") or 0)
+            if event_type == "TASK_CREATED":
+                added_tasks += 1
+                added += priority
+            else:
+                deleted += priority
+        if added_tasks or added or deleted:
+            ProjectBoss.objects.using(db).filter(pk=boss.pk).update(
+                added_tasks=added_tasks, added_priority=added, deleted_priority=deleted
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0042_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectboss",
+            name="added_tasks",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectboss",
+            name="added_priority",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectboss",
+            name="deleted_priority",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
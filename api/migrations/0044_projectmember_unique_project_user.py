@@ -0,0 +1,77 @@
+from django.db import migrations, models
+
+
+def _unique_sets(model, field_name):
+    sets = [tuple(fields) for fields in model._meta.unique_together]
+    sets += [
+        tuple(c.fields)
+        for c in model._meta.constraints
+        if isinstance(c, models.UniqueConstraint) and c.fields and c.condition is None
+    ]
+    return [fields for fields in sets if field_name in fields]
+
+
+def _move_children(ProjectMember, db, keep, duplicates):
+    """
+    Repoint every row referencing a duplicate membership (task assignments, effects, items,
+    reports, attacks, ...) to the kept one. A row that would then collide with one the kept
+    membership already has under a unique constraint (e.g. the same task assigned to both) is
+    a true duplicate and is dropped instead.
+    """
+    for rel in ProjectMember._meta.related_objects:
+        if rel.many_to_many:
+            continue
+        model, fk = rel.related_model, rel.field.name
+        rows = model.objects.using(db).filter(**{f"{fk}__in": duplicates})
+        for fields in _unique_sets(model, fk):
+            others = [f for f in fields if f != fk]
+            kept = model.objects.using(db).filter(**{fk: keep})
+            taken = set(kept.values_list(*others)) if others else ({()} if kept.exists() else set())
+            for pk, *values in rows.values_list("pk", *others):
+                if tuple(values) in taken:
+                    model.objects.using(db).filter(pk=pk).delete()
+                else:
+                    taken.add(tuple(values))
+        rows.update(**{fk: keep})
+
+
+def drop_duplicate_members(apps, schema_editor):
+    """
+    Keep one membership per (project, user) before the unique constraint goes on: the one with
+    the highest score. Rows referencing the other memberships are moved to it first, so the
+    delete cascades to nothing.
+    """
+    ProjectMember = apps.get_model("api", "ProjectMember")
+    db = schema_editor.connection.alias
+
+    duplicated = (
+        ProjectMember.objects.using(db)
+        .values("project_id", "user_id")
+        .annotate(n=models.Count("pk"))
+        .filter(n__gt=1)
+    )
+    for row in list(duplicated):
+        members = list(
+            ProjectMember.objects.using(db)
+            .filter(project_id=row["project_id"], user_id=row["user_id"])
+            .order_by("-score", "pk")
+            .values_list("pk", flat=True)
+        )
+        keep, duplicates = members[0], members[1:]
+        _move_children(ProjectMember, db, keep, duplicates)
+        ProjectMember.objects.using(db).filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0043_projectboss_task_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_members, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="projectmember",
+            constraint=models.UniqueConstraint(fields=("project", "user"), name="uniq_project_member_project_user"),
+        ),
+    ]
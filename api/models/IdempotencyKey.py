@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from django.db import IntegrityError, connections, models, router, transaction
+from django.utils import timezone
+
+
+class IdempotencyKey(models.Model):
+    """
+    Ledger of one-time game actions. A row for (kind, key) means the action ran; it is claimed
+    in the same transaction as the action, so a rolled-back action releases its key.
+    """
+
+    class Kind(models.TextChoices):
+        OVERDUE_BOSS_ATTACK = "overdue_boss_attack"  # key: task_id
+        REPORT_SUPPORT = "report_support"  # key: report_id
+
+    # Rows per INSERT (keeps bind parameters well under SQLite's limit).
+    CLAIM_CHUNK = 200
+
+    kind = models.CharField(max_length=32, choices=Kind.choices)
+    key = models.CharField(max_length=64)
+    project_id = models.UUIDField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "key"], name="uniq_idempotency_kind_key"),
+        ]
+
+    @classmethod
+    def claim(cls, kind: str, key, *, project_id=None) -> bool:
+        """
+        Claim (kind, key) with a single insert-or-conflict. True if this call claimed it,
+        False if it was already claimed.
+        """
+        return str(key) in cls.claim_many(kind, {str(key): project_id})
+
+    @classmethod
+    def claim_many(cls, kind: str, keys: Mapping[str, Optional[object]]) -> set[str]:
+        """
+        Claim every key in `keys` (key -> project_id) in one statement; returns the keys this
+        call claimed (already-claimed ones are left alone).
+        """
+        if not keys:
+            return set()
+        db = router.db_for_write(cls)
+        connection = connections[db]
+        now = timezone.now()
+
+        if connection.vendor not in ("postgresql", "sqlite") or not connection.features.can_return_columns_from_insert:
+            claimed = set()
+            for key, project_id in keys.items():
+                try:
+                    with transaction.atomic(using=db):
+                        cls.objects.using(db).create(kind=kind, key=str(key), project_id=project_id, created_at=now)
+                    claimed.add(str(key))
+                except IntegrityError:
+                    pass
+            return claimed
+
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING key: conflicting rows are skipped (no error,
+        # no savepoint) and only freshly inserted keys come back.
+        qn = connection.ops.quote_name
+        fields = [cls._meta.get_field(name) for name in ("kind", "key", "project_id", "created_at")]
+        items = list(keys.items())
+        claimed = set()
+        for start in range(0, len(items), cls.CLAIM_CHUNK):
+            chunk = items[start : start + cls.CLAIM_CHUNK]
+            params = [
+                field.get_db_prep_save(value, connection)
+                for key, project_id in chunk
+                for field, value in zip(fields, (kind, str(key), project_id, now))
+            ]
+            sql = (
+                f"INSERT INTO {qn(cls._meta.db_table)} ({', '.join(qn(f.column) for f in fields)}) "
+                f"VALUES {', '.join(['(%s, %s, %s, %s)'] * len(chunk))} "
+                f"ON CONFLICT ({qn('kind')}, {qn('key')}) DO NOTHING RETURNING {qn('key')}"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                claimed.update(row[0] for row in cursor.fetchall())
+        return claimed
+
+    @classmethod
+    def release(cls, kind: str, keys: Iterable) -> None:
+        """
+        Drop claims for actions that ended up not running (so a later run can retry them).
+        """
+        keys = [str(k) for k in keys]
+        if keys:
+            cls.objects.filter(kind=kind, key__in=keys).delete()
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F, Subquery
 import uuid
 
 from django.utils import timezone
@@ -20,7 +21,25 @@ class ProjectBoss(models.Model):
     phase = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(default=timezone.now)
+    # Task changes since the current phase was set up (consumed by next-phase setup).
+    added_tasks = models.IntegerField(default=0)
+    added_priority = models.IntegerField(default=0)
+    deleted_priority = models.IntegerField(default=0)
 
     def __str__(self) -> str:
         boss_name = self.boss.boss_name if self.boss_id else "(no boss)"
-        return f"{boss_name} @ {self.project.project_name}"
\ No newline at end of file
+        return f"{boss_name} @ {self.project.project_name}"
+
+    @classmethod
+    def record_task_change(cls, project, *, added_tasks=0, added_priority=0, deleted_priority=0) -> int:
+        """
+        Bump the task counters of the project's active (latest) boss in one UPDATE. Call it in
+        the same transaction as the task change. Returns the number of rows updated (0 when the
+        project has no boss yet).
+        """
+        latest = cls.objects.filter(project=project).order_by("-created_at").values("pk")[:1]
+        return cls.objects.filter(pk=Subquery(latest)).update(
+            added_tasks=F("added_tasks") + added_tasks,
+            added_priority=F("added_priority") + added_priority,
+            deleted_priority=F("deleted_priority") + deleted_priority,
+        )
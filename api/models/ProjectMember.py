@@ -18,5 +18,11 @@ class ProjectMember(models.Model):
     score = models.IntegerField(default=0)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="Alive")
 
+    class Meta:
+        constraints = [
+            # Also the index behind the per-request membership check (project, user).
+            models.UniqueConstraint(fields=["project", "user"], name="uniq_project_member_project_user"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.user.username} — {self.project.project_name}"
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
 
 from django.db import models
+from django.utils import timezone
+
+# Logs buffered by the innermost open `TaskLog.batch()` (None when writes go straight through).
+_pending_logs: ContextVar[Optional[list]] = ContextVar("tasklog_batch", default=None)
 
 
 class TaskLog(models.Model):
@@ -46,6 +53,15 @@ class TaskLog(models.Model):
         # Boss lifecycle
         BOSS_NEXT_PHASE_SETUP = "BOSS_NEXT_PHASE_SETUP"
 
+    # Events shown in the project's game log (and pushed to its event stream).
+    GAME_EVENT_TYPES = (
+        EventType.USER_ATTACK,
+        EventType.BOSS_ATTACK,
+        EventType.KILL_BOSS,
+        EventType.KILL_PLAYER,
+        EventType.BOSS_REVIVE,
+        EventType.USER_REVIVE,
+    )
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project_id = models.UUIDField(db_index=True, blank=True, null=True)
@@ -56,7 +72,9 @@ class TaskLog(models.Model):
     event_type = models.CharField(max_length=50, choices=EventType.choices, db_index=True, blank=True, null=True)
     payload = models.JSONField(default=dict)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Stamped when the event is written (not when a batch is inserted) so batched logs keep
+    # their order and timing.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         indexes = [
@@ -74,10 +92,64 @@ class TaskLog(models.Model):
         event_type: str,
         payload: dict | None = None,
     ) -> "TaskLog":
-        return cls.objects.create(
+        """
+        Record an event. Inside `TaskLog.batch()` the log is buffered and returned unsaved
+        (its id and created_at are already set); otherwise it is inserted right away.
+        """
+        fields = dict(
             project_id=project_id,
             actor_type=actor_type,
             actor_id=actor_id,
             event_type=event_type,
             payload=(payload or {}),
         )
+        pending = _pending_logs.get()
+        if pending is not None:
+            log = cls(**fields)
+            pending.append(log)
+            return log
+
+        log = cls.objects.create(**fields)
+        cls._published([log])
+        return log
+
+    @classmethod
+    @contextmanager
+    def batch(cls) -> Iterator[None]:
+        """
+        Buffer `TaskLog.write` calls and insert them with one `bulk_create` when the outermost
+        block exits (inside the caller's transaction, so they commit or roll back with it).
+
+        Nested blocks join the outer buffer; if one raises, only the logs it wrote are dropped.
+        Usable as a decorator.
+        """
+        pending = _pending_logs.get()
+        if pending is not None:
+            mark = len(pending)
+            try:
+                yield
+            except BaseException:
+                del pending[mark:]
+                raise
+            return
+
+        pending = []
+        token = _pending_logs.set(pending)
+        try:
+            yield
+        finally:
+            _pending_logs.reset(token)
+        if pending:
+            cls.objects.bulk_create(pending)
+            cls._published(pending)
+
+    @classmethod
+    def _published(cls, logs) -> None:
+        game_logs = [log for log in logs if log.event_type in cls.GAME_EVENT_TYPES]
+        if not game_logs:
+            return
+        # Imported lazily: api.services imports the domains, which import this model.
+        from api.services.log_stream import publish_task_log
+
+        for log in game_logs:
+            publish_task_log(log)
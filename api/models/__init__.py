@@ -14,4 +14,5 @@ from .UserBossCollection import UserBossCollection
 from .UserFeedback import UserFeedback
 from .UserReport import UserReport
 from .UserTask import UserTask
-from .ProjectEndSummary import ProjectEndSummary
\ No newline at end of file
+from .ProjectEndSummary import ProjectEndSummary
+from .IdempotencyKey import IdempotencyKey
\ No newline at end of file
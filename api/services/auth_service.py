@@ -1,7 +1,19 @@
+import logging
+import time
+
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
+from django.core.exceptions import ObjectDoesNotExist
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from api.models import BusinessUser
+from api.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+# Copied into every access token minted from the refresh token; lets ClaimsJWTAuthentication
+# resolve the BusinessUser without a query.
+BUSINESS_USER_ID_CLAIM = "business_user_id"
 
 
 def register_user(username, email, password, name, profile_img):
@@ -32,8 +44,64 @@ def login_user(username, password=None, social=False):
             return None, None
 
     refresh = RefreshToken.for_user(user)
+    try:
+        refresh[BUSINESS_USER_ID_CLAIM] = str(user.business_profile.pk)
+    except ObjectDoesNotExist:
+        pass
 
     return user, {
         "access": str(refresh.access_token),
         "refresh": str(refresh),
     }
+
+
+def revoke_token(token):
+    """
+    Put a validated token's jti on the revocation list until the token expires. Only
+    claims-authenticated views consult the list (the others re-load the user anyway).
+    """
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return
+    ttl = int(token.get("exp", 0) - time.time())
+    if ttl <= 0:
+        return
+    cache_svc = CacheService()
+    cache_svc.set(cache_svc.keys.revoked_token(jti), 1, ttl_seconds=ttl)
+
+
+def revoke_user_tokens(user_id):
+    """
+    Reject every token issued to `user_id` so far (password change, deactivation). Kept for a
+    refresh token's lifetime, which outlives every access token issued before it.
+    """
+    ttl = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    try:
+        cache_svc = CacheService()
+        cache_svc.set(cache_svc.keys.tokens_revoked_before(user_id), int(time.time()), ttl_seconds=ttl)
+    except Exception:
+        logger.warning("could not revoke the tokens of user %s", user_id, exc_info=True)
+
+
+def is_token_revoked(token):
+    """
+    True/False from the revocation list (the token's jti, or every token of its user issued
+    before a password change / deactivation), or None when it can't be checked (Redis down).
+    """
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return None
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    try:
+        cache_svc = CacheService()
+        jti_key = cache_svc.keys.revoked_token(jti)
+        user_key = cache_svc.keys.tokens_revoked_before(user_id) if user_id is not None else None
+        # One round-trip for both lists.
+        found = cache_svc.get_many([k for k in (jti_key, user_key) if k is not None])
+    except Exception:
+        logger.warning("token revocation list unavailable", exc_info=True)
+        return None
+    if jti_key in found:
+        return True
+    revoked_before = found.get(user_key)
+    return revoked_before is not None and int(token.get("iat", 0)) < int(revoked_before)
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import pickle
+import struct
+import uuid
+import zlib
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.conf import settings
+
+from api.services.cache_metrics import key_family
+
+logger = logging.getLogger(__name__)
+
+# Encoded payloads are stored as bytes starting with this header, followed by a codec id,
+# a flags byte, an optional soft-TTL envelope and the (possibly compressed) body. Anything
+# else read back from Redis is a plain pickled value and is returned unchanged.
+MAGIC = b"\x00WQ"
+FLAG_ZLIB = 0x01
+FLAG_SOFT = 0x02
+FLAG_ZSTD = 0x04
+_SOFT = struct.Struct("!dd")
+
+
+class CodecError(Exception):
+    pass
+
+
+class Codec:
+    """
+    Serializer for cached values. `dumps` raises TypeError for values it can't represent.
+    """
+
+    name = ""
+    ident = 0
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class PickleCodec(Codec):
+    name = "pickle"
+    ident = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+# Types JSON/msgpack can't carry natively; tagged so they round-trip to the same Python type.
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_TIME = 3
+_EXT_UUID = 4
+_EXT_DECIMAL = 5
+
+
+def _to_ext(obj: Any) -> tuple[int, str]:
+    if isinstance(obj, dt.datetime):
+        return _EXT_DATETIME, obj.isoformat()
+    if isinstance(obj, dt.date):
+        return _EXT_DATE, obj.isoformat()
+    if isinstance(obj, dt.time):
+        return _EXT_TIME, obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return _EXT_UUID, obj.hex
+    if isinstance(obj, Decimal):
+        return _EXT_DECIMAL, str(obj)
+    raise TypeError(f"Cannot encode {type(obj).__name__}")
+
+
+def _from_ext(code: int, text: str) -> Any:
+    if code == _EXT_DATETIME:
+        return dt.datetime.fromisoformat(text)
+    if code == _EXT_DATE:
+        return dt.date.fromisoformat(text)
+    if code == _EXT_TIME:
+        return dt.time.fromisoformat(text)
+    if code == _EXT_UUID:
+        return uuid.UUID(hex=text)
+    if code == _EXT_DECIMAL:
+        return Decimal(text)
+    raise CodecError(f"Unknown ext type {code}")
+
+
+class JSONCodec(Codec):
+    """
+    Compact JSON with tagged datetimes/UUIDs/Decimals; readable from non-Python consumers.
+    """
+
+    name = "json"
+    ident = 2
+    _TAG = "__wq__"
+
+    def dumps(self, value: Any) -> bytes:
+        def default(obj: Any) -> Any:
+            code, text = _to_ext(obj)
+            return {self._TAG: [code, text]}
+
+        return json.dumps(value, default=default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        def hook(obj: dict) -> Any:
+            tagged = obj.get(self._TAG) if len(obj) == 1 else None
+            return _from_ext(*tagged) if tagged is not None else obj
+
+        return json.loads(data, object_hook=hook)
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+    ident = 3
+
+    def __init__(self) -> None:
+        import msgpack  # type: ignore
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        def default(obj: Any) -> Any:
+            code, text = _to_ext(obj)
+            return self._msgpack.ExtType(code, text.encode("utf-8"))
+
+        return self._msgpack.packb(value, default=default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        def ext_hook(code: int, payload: bytes) -> Any:
+            return _from_ext(code, payload.decode("utf-8"))
+
+        return self._msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False)
+
+
+def _build_codecs() -> dict[str, Codec]:
+    codecs: dict[str, Codec] = {"pickle": PickleCodec(), "json": JSONCodec()}
+    try:
+        codecs["msgpack"] = MsgpackCodec()
+    except ImportError:
+        # msgpack is in requirements.txt; without it, families configured for msgpack fall back
+        # to (compressed) pickle, which benchmarks smaller and faster than tagged JSON
+        # (`manage.py cache_codec_bench`).
+        codecs["msgpack"] = codecs["pickle"]
+    return codecs
+
+
+CODECS = _build_codecs()
+_BY_IDENT = {codec.ident: codec for codec in CODECS.values()}
+
+
+def _zstd():
+    try:
+        import zstandard  # type: ignore
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def codec_for(key: str) -> Optional[Codec]:
+    """
+    Codec configured for the key's family in `CACHE_CODECS` (exact family, then its first
+    segment), else `CACHE_DEFAULT_CODEC`. None means "store as-is" (django-redis pickles it).
+    """
+    configured = getattr(settings, "CACHE_CODECS", {}) or {}
+    family = key_family(key)
+    name = configured.get(family) or configured.get(family.split(":", 1)[0])
+    name = name or getattr(settings, "CACHE_DEFAULT_CODEC", None)
+    if not name or name == "raw":
+        return None
+    codec = CODECS.get(name)
+    if codec is None:
+        logger.warning("unknown cache codec %r for %s; storing raw", name, family)
+    return codec
+
+
+def encode(codec: Codec, value: Any, *, soft: Optional[tuple[float, float]] = None) -> bytes:
+    """
+    Serialize with `codec` (falling back to pickle for unsupported values) and compress
+    bodies of at least `CACHE_COMPRESS_MIN_BYTES`.
+    """
+    try:
+        body = codec.dumps(value)
+    except (TypeError, ValueError, OverflowError):
+        codec = CODECS["pickle"]
+        body = codec.dumps(value)
+
+    flags = 0
+    if len(body) >= int(getattr(settings, "CACHE_COMPRESS_MIN_BYTES", 1024)):
+        zstd = _zstd() if getattr(settings, "CACHE_COMPRESSION", "zlib") == "zstd" else None
+        if zstd is not None:
+            compressed = zstd.ZstdCompressor(level=int(getattr(settings, "CACHE_COMPRESS_LEVEL", 3))).compress(body)
+            flag = FLAG_ZSTD
+        else:
+            compressed = zlib.compress(body, int(getattr(settings, "CACHE_COMPRESS_LEVEL", 3)))
+            flag = FLAG_ZLIB
+        if len(compressed) < len(body):
+            body, flags = compressed, flags | flag
+
+    envelope = b""
+    if soft is not None:
+        flags |= FLAG_SOFT
+        envelope = _SOFT.pack(*soft)
+    return MAGIC + bytes((codec.ident, flags)) + envelope + body
+
+
+def is_encoded(raw: Any) -> bool:
+    return isinstance(raw, bytes) and raw[: len(MAGIC)] == MAGIC
+
+
+def decode(raw: bytes) -> tuple[Any, Optional[tuple[float, float]]]:
+    """
+    Inverse of `encode`: returns (value, soft envelope or None). Raises CodecError.
+    """
+    try:
+        offset = len(MAGIC)
+        ident, flags = raw[offset], raw[offset + 1]
+        offset += 2
+        soft = None
+        if flags & FLAG_SOFT:
+            soft = _SOFT.unpack_from(raw, offset)
+            offset += _SOFT.size
+        body = raw[offset:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        elif flags & FLAG_ZSTD:
+            zstd = _zstd()
+            if zstd is None:
+                raise CodecError("zstandard is not installed")
+            body = zstd.ZstdDecompressor().decompress(body)
+        codec = _BY_IDENT.get(ident)
+        if codec is None:
+            raise CodecError(f"Unknown codec id {ident}")
+        return codec.loads(body), soft
+    except CodecError:
+        raise
+    except Exception as e:
+        raise CodecError(str(e)) from e
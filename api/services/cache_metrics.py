@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = (
+    "hits",
+    "l1_hits",
+    "misses",
+    "stale_refreshes",
+    "loads",
+    "payload_writes",
+    "payload_sized",
+    "pattern_deletes",
+    "keys_deleted",
+)
+FLOAT_FIELDS = ("loader_seconds", "payload_bytes")
+
+
+def key_family(key: str) -> str:
+    """
+    Collapse a concrete key into its family, e.g.
+    "workquest:task:project_tasks:<pid>:g3:<uid>" -> "task:project_tasks".
+    """
+    parts = str(key).split(":")
+    return ":".join(parts[1:3]) if len(parts) > 2 else ":".join(parts)
+
+
+def payload_size(value: Any) -> int:
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class CacheMetrics:
+    """
+    Per-key-family cache counters (hits, misses, loader time, payload bytes, pattern deletes).
+
+    Counters are accumulated in-process and flushed to Redis hashes at most every
+    `CACHE_METRICS_FLUSH_SECONDS` in one pipeline, so every worker contributes to a
+    shared view without adding a Redis write per cache call.
+    """
+
+    def __init__(self, *, prefix: str = "workquest:metrics:cache", flush_seconds: Optional[float] = None):
+        self.prefix = prefix
+        self.flush_seconds = (
+            float(getattr(settings, "CACHE_METRICS_FLUSH_SECONDS", 10)) if flush_seconds is None else flush_seconds
+        )
+        self._pending: dict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(getattr(settings, "CACHE_METRICS_ENABLED", True))
+
+    def families_key(self) -> str:
+        return f"{self.prefix}:families"
+
+    def family_key(self, family: str) -> str:
+        return f"{self.prefix}:family:{family}"
+
+    # -------- Recording --------
+    def incr(self, key: str, **fields: float) -> None:
+        if not self.enabled:
+            return
+        family = key_family(key)
+        with self._lock:
+            bucket = self._pending[family]
+            for name, amount in fields.items():
+                bucket[name] += amount
+            due = time.monotonic() - self._last_flush >= self.flush_seconds
+        if due:
+            self.flush()
+
+    def record_hit(self, key: str, *, l1: bool = False) -> None:
+        if l1:
+            self.incr(key, hits=1, l1_hits=1)
+        else:
+            self.incr(key, hits=1)
+
+    def record_miss(self, key: str) -> None:
+        self.incr(key, misses=1)
+
+    def record_load(self, key: str, seconds: float) -> None:
+        self.incr(key, loads=1, loader_seconds=seconds)
+
+    def record_payload(self, key: str, value: Any, *, size: Optional[int] = None) -> None:
+        """
+        Count a cache write. `size` is the stored byte length when the codec already knows it;
+        otherwise (raw pickled writes) the value is re-pickled to measure it only for a
+        CACHE_METRICS_PAYLOAD_SAMPLE_RATE fraction of writes. `payload_sized` counts the
+        measured writes so the average stays unbiased.
+        """
+        if not self.enabled:
+            return
+        if size is None:
+            rate = float(getattr(settings, "CACHE_METRICS_PAYLOAD_SAMPLE_RATE", 0.01))
+            if rate <= 0 or random.random() >= rate:
+                self.incr(key, payload_writes=1)
+                return
+            size = payload_size(value)
+        self.incr(key, payload_writes=1, payload_sized=1, payload_bytes=size)
+
+    def record_pattern_delete(self, pattern: str, deleted: int) -> None:
+        self.incr(pattern, pattern_deletes=1, keys_deleted=deleted)
+
+    # -------- Storage --------
+    def _take_pending(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            pending = {family: dict(fields) for family, fields in self._pending.items()}
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+        return pending
+
+    def flush(self) -> None:
+        pending = self._take_pending()
+        if not pending:
+            return
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            pipe = get_redis_connection("default").pipeline(transaction=False)
+            for family, fields in pending.items():
+                pipe.sadd(self.families_key(), family)
+                for name, amount in fields.items():
+                    if name in FLOAT_FIELDS:
+                        pipe.hincrbyfloat(self.family_key(family), name, amount)
+                    else:
+                        pipe.hincrby(self.family_key(family), name, int(amount))
+            pipe.execute()
+        except Exception:
+            # Metrics must never break caching; this batch is dropped.
+            logger.warning("cache metrics flush failed", exc_info=True)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Return aggregated counters per family (all workers), with derived ratios.
+        """
+        self.flush()
+        raw: dict[str, dict[str, float]] = {}
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            conn = get_redis_connection("default")
+            families = sorted(
+                f.decode("utf-8") if isinstance(f, bytes) else str(f) for f in conn.smembers(self.families_key())
+            )
+            pipe = conn.pipeline(transaction=False)
+            for family in families:
+                pipe.hgetall(self.family_key(family))
+            for family, fields in zip(families, pipe.execute()):
+                raw[family] = {
+                    (k.decode("utf-8") if isinstance(k, bytes) else str(k)): float(v) for k, v in fields.items()
+                }
+        except Exception:
+            logger.warning("cache metrics snapshot failed", exc_info=True)
+        return {family: self._derive(fields) for family, fields in raw.items()}
+
+    def reset(self) -> None:
+        self._take_pending()
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            conn = get_redis_connection("default")
+            families = conn.smembers(self.families_key())
+            keys = [self.family_key(f.decode("utf-8") if isinstance(f, bytes) else str(f)) for f in families]
+            conn.delete(self.families_key(), *keys)
+        except Exception:
+            logger.warning("cache metrics reset failed", exc_info=True)
+
+    @staticmethod
+    def _derive(fields: dict[str, float]) -> dict[str, float]:
+        out = {name: int(fields.get(name, 0)) for name in COUNTER_FIELDS}
+        out.update({name: round(float(fields.get(name, 0.0)), 6) for name in FLOAT_FIELDS})
+        lookups = out["hits"] + out["misses"]
+        out["hit_ratio"] = round(out["hits"] / lookups, 4) if lookups else None
+        out["avg_loader_ms"] = round(out["loader_seconds"] * 1000 / out["loads"], 3) if out["loads"] else None
+        out["avg_payload_bytes"] = (
+            round(out["payload_bytes"] / out["payload_sized"], 1) if out["payload_sized"] else None
+        )
+        return out
+
+
+cache_metrics = CacheMetrics()
@@ -1,12 +1,48 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Iterable, Optional, TypeVar
+import logging
+import math
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
 from django.core.cache import cache
+from django.db import connection, transaction
+
+from api.services import cache_codec
+from api.services import local_cache as l1
+from api.services.cache_metrics import cache_metrics
+from api.services.request_metrics import count_cache_call
+from api.utils.etag import tag
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_MISS = object()
+
+
+@dataclass(frozen=True)
+class _NegativeEntry:
+    """
+    Marker cached when a loader legitimately returned None, so the miss isn't re-queried.
+    """
+
+
+@dataclass(frozen=True)
+class _SoftEntry:
+    """
+    Envelope stored for soft-TTL reads: the value, when it goes stale and how long it took to build.
+    """
+
+    value: Any
+    soft_expires_at: float
+    compute_seconds: float
+
 
 @dataclass(frozen=True)
 class CacheKeys:
@@ -20,33 +56,49 @@ class CacheKeys:
         safe_parts = [self.namespace, *[str(p) for p in parts if p is not None]]
         return ":".join(safe_parts)
 
+    @staticmethod
+    def _gen(generation: Optional[int]) -> Optional[str]:
+        return f"g{generation}" if generation is not None else None
+
+    # ---- Generations ----
+    # Per-project counters embedded in versioned keys. Bumping a counter (one INCR)
+    # orphans every entry built with the previous value; those age out via their TTL.
+    GEN_TASKS = "tasks"
+    GEN_MEMBER_ITEMS = "member_items"
+    GEN_MEMBER_STATUS_EFFECTS = "member_status_effects"
+    GEN_LOGS = "logs"
+    GEN_STATUS = "status"
+
+    def project_generation(self, project_id: object, family: str) -> str:
+        return self.key("gen", family, project_id)
+
     # ---- Game ----
     def project_boss(self, project_id: object) -> str:
         return self.key("game", "project_boss", project_id)
 
-    def boss_status(self, project_id: object) -> str:
-        return self.key("game", "boss_status", project_id)
+    def boss_status(self, project_id: object, generation: Optional[int] = None) -> str:
+        return self.key("game", "boss_status", project_id, self._gen(generation))
 
-    def user_statuses(self, project_id: object) -> str:
-        return self.key("game", "user_statuses", project_id)
+    def user_statuses(self, project_id: object, generation: Optional[int] = None) -> str:
+        return self.key("game", "user_statuses", project_id, self._gen(generation))
 
-    def game_status(self, project_id: object) -> str:
-        return self.key("game", "game_status", project_id)
+    def game_status(self, project_id: object, generation: Optional[int] = None) -> str:
+        return self.key("game", "game_status", project_id, self._gen(generation))
 
     def all_bosses(self) -> str:
         return self.key("game", "all_bosses")
 
-    def project_member_items(self, project_id: object, project_member_id: object) -> str:
-        return self.key("game", "project_member", "items", project_id, project_member_id)
+    def project_member_items(
+        self, project_id: object, project_member_id: object, generation: Optional[int] = None
+    ) -> str:
+        return self.key("game", "project_member", "items", project_id, self._gen(generation), project_member_id)
 
-    def project_member_items_pattern(self, project_id: object) -> str:
-        return self.key("game", "project_member", "items", project_id, "*")
-
-    def project_member_status_effects(self, project_id: object, project_member_id: object) -> str:
-        return self.key("game", "project_member", "status_effects", project_id, project_member_id)
-
-    def project_member_status_effects_pattern(self, project_id: object) -> str:
-        return self.key("game", "project_member", "status_effects", project_id, "*")
+    def project_member_status_effects(
+        self, project_id: object, project_member_id: object, generation: Optional[int] = None
+    ) -> str:
+        return self.key(
+            "game", "project_member", "status_effects", project_id, self._gen(generation), project_member_id
+        )
 
     # ---- Projects ----
     def user_projects(self, user_id: object) -> str:
@@ -55,28 +107,30 @@ class CacheKeys:
     def project_members(self, project_id: object) -> str:
         return self.key("project", "members", project_id)
 
+    def project_member_ids(self, project_id: object) -> str:
+        return self.key("project", "member_ids", project_id)
+
     # ---- Logs ----
-    def project_game_logs(self, project_id: object) -> str:
-        return self.key("log", "project_game_logs", project_id)
+    def project_game_logs(self, project_id: object, page: object = None, generation: Optional[int] = None) -> str:
+        # page: "<limit>:<cursor or 'head'>[:<time_begin>]"
+        return self.key("log", "project_game_logs", project_id, self._gen(generation), page)
 
     def project_game_logs_grouped(self, project_id: object, group_by: object) -> str:
         # group_by: "event_type" | "category"
         return self.key("log", "project_game_logs_grouped", group_by, project_id)
 
     # ---- Tasks ----
-    def project_tasks(self, project_id: object, user_id: object) -> str:
-        return self.key("task", "project_tasks", project_id, user_id)
-
-    def task_detail(self, project_id: object, task_id: object, user_id: object) -> str:
-        return self.key("task", "task_detail", project_id, task_id, user_id)
+    def project_tasks(self, project_id: object, user_id: object, generation: Optional[int] = None) -> str:
+        return self.key("task", "project_tasks", project_id, self._gen(generation), user_id)
 
-    def project_tasks_pattern(self, project_id: object) -> str:
-        # wildcard user_id
-        return self.key("task", "project_tasks", project_id, "*")
+    def task_detail(
+        self, project_id: object, task_id: object, user_id: object, generation: Optional[int] = None
+    ) -> str:
+        return self.key("task", "task_detail", project_id, self._gen(generation), task_id, user_id)
 
-    def task_detail_pattern(self, project_id: object) -> str:
-        # wildcard task_id and user_id
-        return self.key("task", "task_detail", project_id, "*", "*")
+    # ---- Locks ----
+    def lock(self, key: str) -> str:
+        return f"{key}:lock"
 
      # ---- User ----
     def user_me(self, user_id: object) -> str:
@@ -86,6 +140,60 @@ class CacheKeys:
     def all_business_users(self) -> str:
         return self.key("user", "business_users", "all")
 
+    # ---- Auth ----
+    def revoked_token(self, jti: object) -> str:
+        return self.key("auth", "revoked", jti)
+
+    def tokens_revoked_before(self, user_id: object) -> str:
+        # Epoch seconds: the user's tokens issued earlier are rejected (password change, deactivation).
+        return self.key("auth", "revoked_before", user_id)
+
+
+@dataclass
+class _InvalidationBuffer:
+    """
+    Deletes and generation bumps collected during a request / atomic block, flushed once.
+    """
+
+    deletes: set[str] = field(default_factory=set)
+    bumps: set[str] = field(default_factory=set)
+
+    def flush(self) -> None:
+        deletes, bumps = sorted(self.deletes), sorted(self.bumps)
+        self.deletes.clear()
+        self.bumps.clear()
+        if not deletes and not bumps:
+            return
+        count_cache_call()
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            conn = get_redis_connection("default")
+        except Exception:
+            conn = None
+
+        if conn is None:
+            # Non-Redis backend (e.g. local dev): same effect, one call per op.
+            if deletes:
+                cache.delete_many(deletes)
+            for key in bumps:
+                CacheService._bump_now(key)
+        else:
+            # One round-trip. make_key() applies Django's prefix/version like cache.delete() would;
+            # a raw INCR on a missing counter creates it at 1, matching _bump_now().
+            pipe = conn.pipeline(transaction=False)
+            if deletes:
+                pipe.delete(*[cache.make_key(k) for k in deletes])
+            for key in bumps:
+                pipe.incr(cache.make_key(key))
+            pipe.execute()
+        CacheService._broadcast_eviction(deletes)
+
+
+_pending_invalidations: ContextVar[Optional[_InvalidationBuffer]] = ContextVar(
+    "workquest_pending_cache_invalidations", default=None
+)
+
 
 class CacheService:
     """
@@ -93,24 +201,134 @@ class CacheService:
 
     - Read-through: on cache miss, load from source and populate cache.
     - Write-through: on write, update cache immediately (we use this mainly as "set after compute" plus invalidations).
+    - L1 (optional, `CACHE_L1_ENABLED`): callers pass `local=True` for hot, rarely-changing keys to
+      also keep them in a per-worker LRU. delete()/delete_many() evict locally and broadcast the
+      keys over Redis pub/sub so the other workers evict theirs.
+    - Invalidations (delete/delete_many/bump_generation) are deferred until the surrounding
+      transaction commits, so a concurrent reader can't re-cache pre-commit data. Inside
+      `deferred_invalidation()` they are also deduped and flushed in one Redis pipeline.
     """
 
+    # Single-flight recompute lock: held at most this long if a worker dies mid-load.
+    LOCK_TTL_SECONDS = 10
+    # How long a cold-miss follower waits for the lock holder before loading itself.
+    LOCK_WAIT_SECONDS = 2.0
+    LOCK_POLL_SECONDS = 0.05
+    # XFetch beta: >1 refreshes earlier, <1 later; 0 disables early refresh.
+    EARLY_REFRESH_BETA = 1.0
+    # Game/boss/user status snapshots are written through by every game mutation and versioned
+    # by the project's status generation (see `write_game_status`), so the TTL only bounds memory.
+    GAME_STATUS_TTL_SECONDS = 30
+
     def __init__(self, *, keys: CacheKeys | None = None):
         self.keys = keys or CacheKeys()
 
     # -------- Core ops --------
-    def get(self, key: str) -> Optional[T]:
-        return cache.get(key)
+    def get(self, key: str, *, local: bool = False) -> Optional[T]:
+        local_cache = l1.get_local_cache() if local else None
+        if local_cache is not None:
+            value = local_cache.get(key)
+            if value is not l1.MISS:
+                cache_metrics.record_hit(key, l1=True)
+                return value
+        value = self._fetch(key)
+        if value is None:
+            cache_metrics.record_miss(key)
+        else:
+            cache_metrics.record_hit(key)
+        if local_cache is not None and value is not None:
+            local_cache.set(key, value)
+        return value
 
-    def set(self, key: str, value: T, *, ttl_seconds: int) -> T:
-        cache.set(key, value, timeout=ttl_seconds)
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Several keys in one round-trip (MGET); missing keys are left out of the result.
+        """
+        keys = list(keys)
+        count_cache_call()
+        raw = cache.get_many(keys)
+        found = {}
+        for key in keys:
+            value = self._decode(key, raw.get(key))
+            if value is None:
+                cache_metrics.record_miss(key)
+            else:
+                cache_metrics.record_hit(key)
+                found[key] = value
+        return found
+
+    def set(self, key: str, value: T, *, ttl_seconds: int, local: bool = False) -> T:
+        buffer = _pending_invalidations.get()
+        if buffer is not None:
+            # A write supersedes an earlier delete of the same key in this request.
+            buffer.deletes.discard(key)
+        self._store(key, value, ttl_seconds)
+        local_cache = l1.get_local_cache() if local else None
+        if local_cache is not None:
+            # Other workers may hold the previous value in their L1.
+            self._broadcast_eviction([key])
+            local_cache.set(key, value, ttl_seconds=ttl_seconds)
         return value
 
     def delete(self, key: str) -> None:
+        if self._defer(deletes=[key]):
+            return
+        count_cache_call()
         cache.delete(key)
+        self._broadcast_eviction([key])
 
     def delete_many(self, keys: Iterable[str]) -> None:
-        cache.delete_many(list(keys))
+        keys = list(keys)
+        if self._defer(deletes=keys):
+            return
+        count_cache_call()
+        cache.delete_many(keys)
+        self._broadcast_eviction(keys)
+
+    # -------- Deferred invalidation --------
+    @staticmethod
+    @contextmanager
+    def deferred_invalidation() -> Iterator[None]:
+        """
+        Buffer invalidations made inside the block and flush them once, deduped, in a single
+        Redis pipeline: on exit, or from `transaction.on_commit` if exited inside an atomic block.
+        Nested blocks join the outermost one.
+        """
+        if _pending_invalidations.get() is not None:
+            yield
+            return
+        buffer = _InvalidationBuffer()
+        token = _pending_invalidations.set(buffer)
+        try:
+            yield
+        finally:
+            _pending_invalidations.reset(token)
+            # Flush even on error: invalidating after a rollback is harmless, skipping it after a commit isn't.
+            if connection.in_atomic_block:
+                transaction.on_commit(buffer.flush)
+            else:
+                buffer.flush()
+
+    @staticmethod
+    def _defer(*, deletes: Iterable[str] = (), bumps: Iterable[str] = ()) -> bool:
+        buffer = _pending_invalidations.get()
+        if buffer is not None:
+            buffer.deletes.update(deletes)
+            buffer.bumps.update(bumps)
+            return True
+        if connection.in_atomic_block:
+            single = _InvalidationBuffer(deletes=set(deletes), bumps=set(bumps))
+            transaction.on_commit(single.flush)
+            return True
+        return False
+
+    @staticmethod
+    def _broadcast_eviction(keys: list[str]) -> None:
+        local_cache = l1.get_local_cache()
+        if local_cache is None:
+            return
+        local_cache.evict(keys)
+        l1.get_invalidation_listener().publish(keys)
 
     def delete_pattern(self, pattern: str) -> int:
         """
@@ -124,7 +342,9 @@ class CacheService:
             deleter = getattr(cache, "delete_pattern", None)
             if callable(deleter):
                 result = deleter(pattern)
-                return int(result) if result is not None else 0
+                deleted = int(result) if result is not None else 0
+                cache_metrics.record_pattern_delete(pattern, deleted)
+                return deleted
         except Exception:
             # Fall back to manual scanning below.
             pass
@@ -145,58 +365,369 @@ class CacheService:
             for key in conn.scan_iter(match=redis_pattern, count=500):
                 conn.delete(key)
                 deleted += 1
+            cache_metrics.record_pattern_delete(pattern, deleted)
             return deleted
         except Exception:
             return 0
 
+    # -------- Generations --------
+    def generation(self, key: str) -> int:
+        count_cache_call()
+        value = cache.get(key)
+        return int(value) if value is not None else 0
+
+    def bump_generation(self, key: str) -> Optional[int]:
+        """
+        Atomically advance a generation counter (single Redis INCR).
+
+        Counters never expire so a bump can't be lost to a TTL; the versioned
+        entries they guard keep their own short TTLs. Returns the new generation,
+        or None when the bump was deferred (see `deferred_invalidation`).
+        """
+        if self._defer(bumps=[key]):
+            return None
+        return self._bump_now(key)
+
+    @staticmethod
+    def _bump_now(key: str) -> int:
+        count_cache_call()
+        try:
+            return int(cache.incr(key))
+        except ValueError:
+            # Counter doesn't exist yet; if another worker creates it first, INCR theirs.
+            if cache.add(key, 1, timeout=None):
+                return 1
+            return int(cache.incr(key))
+
+    # -------- Versioned keys --------
+    def project_tasks_key(self, project_id: object, user_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_TASKS))
+        return self.keys.project_tasks(project_id, user_id, generation=gen)
+
+    def task_detail_key(self, project_id: object, task_id: object, user_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_TASKS))
+        return self.keys.task_detail(project_id, task_id, user_id, generation=gen)
+
+    def project_member_items_key(self, project_id: object, project_member_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_MEMBER_ITEMS))
+        return self.keys.project_member_items(project_id, project_member_id, generation=gen)
+
+    def project_member_status_effects_key(self, project_id: object, project_member_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_MEMBER_STATUS_EFFECTS))
+        return self.keys.project_member_status_effects(project_id, project_member_id, generation=gen)
+
+    def project_game_logs_key(
+        self, project_id: object, *, limit: int, cursor: Optional[str] = None, time_begin=None
+    ) -> str:
+        page = f"{limit}:{cursor or 'head'}"
+        if time_begin is not None:
+            page = f"{page}:{time_begin.isoformat()}"
+        if cursor:
+            # Everything after a cursor is older than it, so new logs don't change that page: no
+            # generation, and no GET for one. Callers keep the TTL short (late-committing rows).
+            return self.keys.project_game_logs(project_id, page)
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_LOGS))
+        return self.keys.project_game_logs(project_id, page, generation=gen)
+
+    def status_generation(self, project_id: object) -> Optional[int]:
+        """
+        Current status generation, read by a game mutation before it loads its domain and passed
+        to `write_game_status`. None when Redis can't be reached (the write then only invalidates).
+        """
+        try:
+            return self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
+        except Exception:
+            logger.warning("status generation read failed for project %s", project_id, exc_info=True)
+            return None
+
+    def boss_status_key(self, project_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
+        return self.keys.boss_status(project_id, generation=gen)
+
+    def user_statuses_key(self, project_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
+        return self.keys.user_statuses(project_id, generation=gen)
+
+    def game_status_key(self, project_id: object) -> str:
+        gen = self.generation(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
+        return self.keys.game_status(project_id, generation=gen)
+
     # -------- Strategies --------
-    def read_through(self, *, key: str, ttl_seconds: int, loader: Callable[[], T]) -> T:
-        cached = cache.get(key)
-        if cached is not None:
+    def read_through(
+        self,
+        *,
+        key: str,
+        ttl_seconds: int,
+        loader: Callable[[], T],
+        soft_ttl_seconds: Optional[float] = None,
+        single_flight: bool = False,
+        early_refresh_beta: Optional[float] = None,
+        negative_ttl_seconds: Optional[int] = None,
+        local: bool = False,
+    ) -> Optional[T]:
+        """
+        Return the cached value for `key`, loading and caching it on a miss.
+
+        - ttl_seconds: hard TTL; Redis drops the entry after this.
+        - soft_ttl_seconds: entries go stale after this but are kept until the hard TTL, so a
+          stale value can be served while it is refreshed (stale-while-revalidate). Refresh may
+          start slightly before the soft TTL, with a probability that grows as expiry nears
+          and with the loader's cost (XFetch), so pollers don't all expire at once.
+        - single_flight: only the worker holding a short Redis lock runs `loader`; the others
+          get the stale value, or on a cold miss wait briefly for the lock holder's result.
+        - negative_ttl_seconds: when set, a None result is cached as a negative entry for this
+          (short) TTL and returned as None without calling `loader`. Without it None is a miss.
+        - local: also serve/populate the per-worker L1 (bounded by CACHE_L1_TTL_SECONDS).
+
+        Hits, misses, loader time and payload size are recorded per key family (`cache_metrics`).
+        """
+        local_cache = l1.get_local_cache() if local else None
+        if local_cache is not None:
+            value = local_cache.get(key)
+            if value is not l1.MISS:
+                cache_metrics.record_hit(key, l1=True)
+                return value
+            value = self.read_through(
+                key=key,
+                ttl_seconds=ttl_seconds,
+                loader=loader,
+                soft_ttl_seconds=soft_ttl_seconds,
+                single_flight=single_flight,
+                early_refresh_beta=early_refresh_beta,
+                negative_ttl_seconds=negative_ttl_seconds,
+            )
+            if value is not None:
+                local_cache.set(key, value, ttl_seconds=ttl_seconds)
+            return value
+
+        cached = self._fetch(key)
+        if isinstance(cached, _NegativeEntry):
+            cache_metrics.record_hit(key)
+            return None
+
+        if soft_ttl_seconds is None and not single_flight:
+            if cached is not None:
+                cache_metrics.record_hit(key)
+                return cached
+            cache_metrics.record_miss(key)
+            return self._load_and_store(key, ttl_seconds, None, loader, negative_ttl_seconds)
+
+        beta = self.EARLY_REFRESH_BETA if early_refresh_beta is None else early_refresh_beta
+        stale = _MISS
+        if isinstance(cached, _SoftEntry):
+            if not self._needs_refresh(cached, beta):
+                cache_metrics.record_hit(key)
+                return cached.value
+            stale = cached.value
+        elif cached is not None:
+            cache_metrics.record_hit(key)
             return cached
-        value = loader()
-        cache.set(key, value, timeout=ttl_seconds)
-        return value
+
+        if stale is _MISS:
+            cache_metrics.record_miss(key)
+        else:
+            cache_metrics.incr(key, stale_refreshes=1)
+
+        if not single_flight:
+            return self._load_and_store(key, ttl_seconds, soft_ttl_seconds, loader, negative_ttl_seconds)
+
+        lock_key = self.keys.lock(key)
+        token = self._acquire_lock(lock_key)
+        if token is None:
+            if stale is not _MISS:
+                return stale
+            waited = self._wait_for(key)
+            if waited is not _MISS:
+                return waited
+            # Lock holder is slow or gone; load without the lock rather than fail the request.
+        try:
+            return self._load_and_store(key, ttl_seconds, soft_ttl_seconds, loader, negative_ttl_seconds)
+        finally:
+            if token is not None:
+                self._release_lock(lock_key, token)
 
     def write_through(self, *, key: str, value: T, ttl_seconds: int) -> T:
         return self.set(key, value, ttl_seconds=ttl_seconds)
 
+    def write_game_status(self, project_id: object, game_status: dict, *, generation: Optional[int]) -> None:
+        """
+        Write-through a fresh `GameService.get_game_status` payload plus the boss/user status
+        views derived from it, once the surrounding transaction commits.
+
+        `generation` is the status generation read before the mutation loaded its domain. On
+        commit the generation is bumped; the snapshot is stored under the new generation only
+        if no other mutation bumped it in between. Otherwise the snapshot may predate that
+        mutation's commit, so it is dropped and the next read rebuilds from the database.
+        Readers look up the current generation's keys, so an older snapshot is never served.
+        """
+
+        def _write() -> None:
+            try:
+                new = self._bump_now(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
+                if generation is None or new != generation + 1:
+                    return
+                entries = [
+                    # Served by the ETag-tagged get_game_status view.
+                    (self.keys.game_status(project_id, generation=new), tag(game_status)),
+                    (self.keys.boss_status(project_id, generation=new), game_status["boss_status"]),
+                    (
+                        self.keys.user_statuses(project_id, generation=new),
+                        {"project_id": game_status["project_id"], "user_statuses": game_status["user_statuses"]},
+                    ),
+                ]
+                for key, value in entries:
+                    self.set(key, value, ttl_seconds=self.GAME_STATUS_TTL_SECONDS)
+            except Exception:
+                # The mutation already committed; don't fail it over the cache.
+                logger.warning("game status write-through failed for project %s", project_id, exc_info=True)
+
+        if connection.in_atomic_block:
+            transaction.on_commit(_write)
+        else:
+            _write()
+
+    # -------- Read-through internals --------
+    @staticmethod
+    def _needs_refresh(entry: _SoftEntry, beta: float) -> bool:
+        # XFetch: -log(U) is >= 0, so the refresh point moves earlier by a random multiple of the build cost.
+        jitter = entry.compute_seconds * beta * -math.log(1.0 - random.random())
+        return time.time() + jitter >= entry.soft_expires_at
+
+    @staticmethod
+    def _load_and_store(
+        key: str,
+        ttl_seconds: int,
+        soft_ttl_seconds: Optional[float],
+        loader: Callable[[], T],
+        negative_ttl_seconds: Optional[int] = None,
+    ) -> Optional[T]:
+        started = time.monotonic()
+        value = loader()
+        elapsed = time.monotonic() - started
+        cache_metrics.record_load(key, elapsed)
+        if value is None:
+            if negative_ttl_seconds:
+                count_cache_call()
+                cache.set(key, _NegativeEntry(), timeout=negative_ttl_seconds)
+            return None
+        if soft_ttl_seconds is None:
+            CacheService._store(key, value, ttl_seconds)
+            return value
+        entry = _SoftEntry(
+            value=value,
+            soft_expires_at=time.time() + soft_ttl_seconds,
+            compute_seconds=elapsed,
+        )
+        CacheService._store(key, entry, ttl_seconds)
+        return value
+
+    # -------- Payload encoding --------
+    @staticmethod
+    def _store(key: str, entry: Any, ttl_seconds: int) -> None:
+        """
+        Write a value (or `_SoftEntry`) using the key family's codec (see `cache_codec`).
+        """
+        count_cache_call()
+        value = entry.value if isinstance(entry, _SoftEntry) else entry
+        codec = cache_codec.codec_for(key)
+        if codec is None:
+            cache.set(key, entry, timeout=ttl_seconds)
+            cache_metrics.record_payload(key, value)
+            return
+        soft = (entry.soft_expires_at, entry.compute_seconds) if isinstance(entry, _SoftEntry) else None
+        raw = cache_codec.encode(codec, value, soft=soft)
+        cache.set(key, raw, timeout=ttl_seconds)
+        cache_metrics.record_payload(key, value, size=len(raw))
+
+    @staticmethod
+    def _fetch(key: str) -> Any:
+        """
+        Read a value written by `_store`; plain (pickled) entries are returned unchanged.
+        """
+        count_cache_call()
+        return CacheService._decode(key, cache.get(key))
+
+    @staticmethod
+    def _decode(key: str, raw: Any) -> Any:
+        if not cache_codec.is_encoded(raw):
+            return raw
+        try:
+            value, soft = cache_codec.decode(raw)
+        except cache_codec.CodecError:
+            # e.g. written by a worker with an optional codec this one lacks; treat as a miss.
+            logger.warning("undecodable cache entry %s", key, exc_info=True)
+            return None
+        if soft is not None:
+            return _SoftEntry(value=value, soft_expires_at=soft[0], compute_seconds=soft[1])
+        return value
+
+    def _acquire_lock(self, lock_key: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        count_cache_call()
+        if cache.add(lock_key, token, timeout=self.LOCK_TTL_SECONDS):
+            return token
+        return None
+
+    @staticmethod
+    def _release_lock(lock_key: str, token: str) -> None:
+        # Don't release a lock that expired and was re-acquired by another worker.
+        count_cache_call()
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+    def _wait_for(self, key: str) -> Any:
+        deadline = time.monotonic() + self.LOCK_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(self.LOCK_POLL_SECONDS)
+            cached = self._fetch(key)
+            if isinstance(cached, _NegativeEntry):
+                return None
+            if isinstance(cached, _SoftEntry):
+                return cached.value
+            if cached is not None:
+                return cached
+        return _MISS
+
     # -------- Domain invalidation helpers --------
     def invalidate_project_game(self, project_id: object) -> None:
-        self.delete_many(
-            [
-                self.keys.project_boss(project_id),
-                self.keys.boss_status(project_id),
-                self.keys.user_statuses(project_id),
-                self.keys.game_status(project_id),
-            ]
-        )
+        self.delete(self.keys.project_boss(project_id))
+        self.invalidate_project_status(project_id)
+
+    def invalidate_project_status(self, project_id: object) -> None:
+        # Boss/user/game status snapshots share one generation: a single INCR drops them all.
+        self.bump_generation(self.keys.project_generation(project_id, CacheKeys.GEN_STATUS))
 
     def invalidate_project_member_items(self, project_id: object, project_member_id: Optional[object] = None) -> None:
         if project_member_id is not None:
-            self.delete(self.keys.project_member_items(project_id, project_member_id))
+            self.delete(self.project_member_items_key(project_id, project_member_id))
             return
-        self.delete_pattern(self.keys.project_member_items_pattern(project_id))
+        self.bump_generation(self.keys.project_generation(project_id, CacheKeys.GEN_MEMBER_ITEMS))
 
     def invalidate_project_member_status_effects(self, project_id: object, project_member_id: Optional[object] = None) -> None:
         if project_member_id is not None:
-            self.delete(self.keys.project_member_status_effects(project_id, project_member_id))
+            self.delete(self.project_member_status_effects_key(project_id, project_member_id))
             return
-        self.delete_pattern(self.keys.project_member_status_effects_pattern(project_id))
+        self.bump_generation(self.keys.project_generation(project_id, CacheKeys.GEN_MEMBER_STATUS_EFFECTS))
 
     def invalidate_project_members(self, project_id: object) -> None:
         self.delete(self.keys.project_members(project_id))
+        # Status snapshots list the members too.
+        self.invalidate_project_status(project_id)
 
     def invalidate_user_projects(self, user_id: object) -> None:
         self.delete(self.keys.user_projects(user_id))
 
     def invalidate_project_logs(self, project_id: object) -> None:
-        self.delete(self.keys.project_game_logs(project_id))
+        # Only head pages (any limit/time_begin) are versioned; cursor pages expire on a short TTL.
+        self.bump_generation(self.keys.project_generation(project_id, CacheKeys.GEN_LOGS))
 
     def invalidate_project_tasks(self, project_id: object) -> None:
-        # Clear per-user caches for this project's tasks list + task details.
-        self.delete_pattern(self.keys.project_tasks_pattern(project_id))
-        self.delete_pattern(self.keys.task_detail_pattern(project_id))
+        # Per-user task lists + task details share one generation: a single INCR drops them all.
+        self.bump_generation(self.keys.project_generation(project_id, CacheKeys.GEN_TASKS))
+
+    def invalidate_all_bosses(self) -> None:
+        # Also served from L1: delete() evicts locally and broadcasts to the other workers.
+        self.delete(self.keys.all_bosses())
 
     def invalidate_all_business_users(self) -> None:
         self.delete(self.keys.all_business_users())
@@ -10,8 +10,10 @@ from api.models.Boss import Boss
 from api.models.Project import Project as ProjectModel
 from api.models.ProjectMember import ProjectMember
 from api.models.Report import Report as ReportModel
+from api.models.TaskLog import TaskLog
 from api.models.UserEffect import UserEffect
 from api.models.UserItem import UserItem
+from api.services.cache_service import CacheService
 
 
 class GameService:
@@ -58,6 +60,9 @@ class GameService:
 
     def get_boss_status(self, project_id):
         project, domain = self._get_project_and_domain(project_id)
+        return self._boss_status_payload(project, domain)
+
+    def _boss_status_payload(self, project, domain):
         boss = domain.game.boss
         if boss is None:
             raise ValueError("Boss not initialized")
@@ -80,33 +85,48 @@ class GameService:
 
     def get_user_statuses(self, project_id):
         project, domain = self._get_project_and_domain(project_id)
-        members = domain.project_member_management.members
-
-        user_statuses = []
-        for member in members:
-            user_statuses.append(
-                {
-                    "project_member_id": str(member.project_member_id),
-                    "user_id": str(member.user.user_id),
-                    "username": member.user.auth_user.username,
-                    "hp": member.hp,
-                    "max_hp": member.max_hp,
-                    "score": member.score,
-                    "status": member.status,
-                }
-            )
+        return {"project_id": str(project.project_id), "user_statuses": self._user_statuses_payload(domain)}
 
-        return {"project_id": str(project.project_id), "user_statuses": user_statuses}
+    def _user_statuses_payload(self, domain):
+        return [
+            {
+                "project_member_id": str(member.project_member_id),
+                "user_id": str(member.user.user_id),
+                "username": member.user.auth_user.username,
+                "hp": member.hp,
+                "max_hp": member.max_hp,
+                "score": member.score,
+                "status": member.status,
+            }
+            for member in domain.project_member_management.members
+        ]
 
     def get_game_status(self, project_id):
-        boss_status = self.get_boss_status(project_id)
-        user_statuses = self.get_user_statuses(project_id)
+        project, domain = self._get_project_and_domain(project_id)
+        return self._game_status_payload(project, domain)
+
+    def _game_status_payload(self, project, domain):
         return {
-            "project_id": str(project_id),
-            "boss_status": boss_status,
-            "user_statuses": user_statuses["user_statuses"],
+            "project_id": str(project.project_id),
+            "boss_status": self._boss_status_payload(project, domain),
+            "user_statuses": self._user_statuses_payload(domain),
         }
 
+    def _write_status_snapshot(self, project, domain, status_generation):
+        """
+        Write-through the post-mutation game status built from the in-memory domain, so
+        status polls are served from cache instead of rebuilding it from Postgres.
+
+        `status_generation` must be read before the domain is loaded (see
+        `CacheService.write_game_status`).
+        """
+        try:
+            snapshot = self._game_status_payload(project, domain)
+        except ValueError:
+            CacheService().invalidate_project_game(project.project_id)
+            return
+        CacheService().write_game_status(project.project_id, snapshot, generation=status_generation)
+
     # -----------------
     # Game actions
     # -----------------
@@ -115,6 +135,7 @@ class GameService:
         """
         Resolve attacker(s) from task assignee(s) (UserTask) and perform one attack per assignee.
         """
+        status_gen = CacheService().status_generation(project_id)
         project, domain = self._get_project_and_domain(project_id)
         task = domain.TaskManagement.get_task(task_id)
         if not task:
@@ -131,7 +152,10 @@ class GameService:
         skipped = []
         total_damage = 0.0
 
-        with transaction.atomic():
+        with transaction.atomic(), TaskLog.batch():
+            # Attacks on one boss queue on its row lock, so each works off the previous one's
+            # hp, phase and status rather than the copy loaded above.
+            domain.game.boss.lock()
             for assignee in assignees:
                 pid = str(assignee.project_member_id)
                 try:
@@ -143,6 +167,7 @@ class GameService:
 
         if not attacks:
             raise ValueError("No assignees were able to attack")
+        self._write_status_snapshot(project, domain, status_gen)
 
         boss_hp = attacks[-1].get("boss_hp")
         boss_max_hp = attacks[-1].get("boss_max_hp")
@@ -161,21 +186,67 @@ class GameService:
         }
 
     def boss_attack(self, project_id, task_id):
+        status_gen = CacheService().status_generation(project_id)
         project, domain = self._get_project_and_domain(project_id)
         task = domain.TaskManagement.get_task(task_id)
         if not task:
             raise ValueError("Task not found")
         if domain.game.boss is None:
             raise ValueError("Boss not initialized")
-        return domain.game.boss_attack(task)
+        # Atomic so a failure rolls back the HP deltas together with the buffered logs/writes.
+        with transaction.atomic():
+            result = domain.game.boss_attack(task)
+        self._write_status_snapshot(project, domain, status_gen)
+        return result
+
+    def overdue_boss_attacks(self, project_id, tasks):
+        """
+        Boss-attack several of one project's tasks with a single ProjectDomain (one load of the
+        project, its tasks and members) and one status snapshot at the end.
+
+        `tasks` are Task rows, already locked by the caller. Returns (attacked rows, skipped)
+        where skipped maps task_id -> reason for tasks the game refused.
+        """
+        status_gen = CacheService().status_generation(project_id)
+        project, domain = self._get_project_and_domain(project_id)
+        if domain.game.boss is None:
+            raise ValueError("Boss not initialized")
+
+        by_id = {str(t.task_id): t for t in domain.TaskManagement.tasks}
+        attacked = []
+        skipped = {}
+        with TaskLog.batch():
+            for row in tasks:
+                task = by_id.get(str(row.task_id))
+                if task is None:
+                    skipped[str(row.task_id)] = "Task not found"
+                    continue
+                try:
+                    domain.game.boss_attack(task)
+                except ValueError as e:
+                    skipped[str(row.task_id)] = str(e)
+                    continue
+                attacked.append(row)
+
+        if attacked:
+            self._write_status_snapshot(project, domain, status_gen)
+        return attacked, skipped
 
     def player_heal(self, project_id, healer_id, player_id, heal_value):
+        status_gen = CacheService().status_generation(project_id)
         project, domain = self._get_project_and_domain(project_id)
-        return domain.game.player_heal(healer_id, player_id, heal_value)
+        with transaction.atomic():
+            result = domain.game.player_heal(healer_id, player_id, heal_value)
+        self._write_status_snapshot(project, domain, status_gen)
+        return result
 
     def revive_player(self, project_id, player_id):
+        status_gen = CacheService().status_generation(project_id)
         project, domain = self._get_project_and_domain(project_id)
-        return domain.game.player_revive(player_id)
+        with transaction.atomic():
+            result = domain.game.player_revive(player_id)
+        self._write_status_snapshot(project, domain, status_gen)
+        return result
 
     def player_support(self, project_id, report_id, business_user=None):
         project, domain = self._get_project_and_domain(project_id)
@@ -192,7 +263,9 @@ class GameService:
             raise ValueError("Report does not belong to this project")
 
         report_domain = ReportDomain(report_model)
-        return domain.game.player_support(report_domain)
+        # Atomic so a failed application also releases the report's idempotency claim.
+        with transaction.atomic():
+            return domain.game.player_support(report_domain)
 
     # -----------------
     # Items / effects
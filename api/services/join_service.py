@@ -157,7 +157,7 @@ class JoinService:
             }
 
         domain = ProjectDomain(project)
-        member_domain = domain._project_member_management.add_member(user)
+        member_domain = domain.project_member_management.add_member(user)
 
         invite.accepted_at = now
         invite.save(update_fields=["accepted_at"])
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Returned by LocalCache.get on a miss (None is a valid cached value).
+MISS = object()
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU with per-entry TTL (the L1 in front of Redis).
+
+    Each gunicorn worker has its own copy; cross-worker consistency comes from
+    `InvalidationListener` evicting keys that other workers deleted.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float):
+        self.max_entries = max(int(max_entries), 1)
+        self.ttl_seconds = float(ttl_seconds)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Return the value or `MISS`.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return MISS
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return MISS
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, *, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(float(ttl_seconds), self.ttl_seconds)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def evict(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class InvalidationListener:
+    """
+    Background Redis pub/sub subscriber that evicts keys deleted by other workers from the L1.
+
+    Started lazily (and re-started after a fork) the first time the L1 is used in a process.
+    """
+
+    RECONNECT_SECONDS = 1.0
+
+    def __init__(self, local: LocalCache, *, channel: str):
+        self.local = local
+        self.channel = channel
+        self._pid: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="cache-l1-invalidation", daemon=True)
+            self._thread.start()
+
+    def handle_message(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            keys = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if isinstance(keys, list):
+            self.local.evict(str(k) for k in keys)
+
+    def publish(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            get_redis_connection("default").publish(self.channel, json.dumps(keys))
+        except Exception:
+            # Best-effort: other workers' L1 entries still expire via the L1 TTL.
+            logger.warning("L1 invalidation publish failed", exc_info=True)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                from django_redis import get_redis_connection  # type: ignore
+
+                pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Messages may have been missed while disconnected; start clean.
+                self.local.clear()
+                for message in pubsub.listen():
+                    self.handle_message(message)
+            except Exception:
+                logger.warning("L1 invalidation listener disconnected; retrying", exc_info=True)
+                self.local.clear()
+                time.sleep(self.RECONNECT_SECONDS)
+
+
+_local_cache: Optional[LocalCache] = None
+_listener: Optional[InvalidationListener] = None
+_init_lock = threading.Lock()
+
+
+def get_local_cache() -> Optional[LocalCache]:
+    """
+    Return this process's L1 cache (starting its invalidation listener), or None when disabled.
+    """
+    global _local_cache, _listener
+    if not getattr(settings, "CACHE_L1_ENABLED", False):
+        return None
+    if _local_cache is None:
+        with _init_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache(
+                    max_entries=getattr(settings, "CACHE_L1_MAX_ENTRIES", 1024),
+                    ttl_seconds=getattr(settings, "CACHE_L1_TTL_SECONDS", 30),
+                )
+                _listener = InvalidationListener(
+                    _local_cache,
+                    channel=getattr(settings, "CACHE_L1_INVALIDATION_CHANNEL", "workquest:cache:l1:invalidate"),
+                )
+    _listener.ensure_started()
+    return _local_cache
+
+
+def get_invalidation_listener() -> Optional[InvalidationListener]:
+    return _listener if get_local_cache() is not None else None
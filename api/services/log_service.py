@@ -1,10 +1,38 @@
+import base64
+import binascii
+import uuid
 from collections import defaultdict
 from typing import Optional
-from django.db.models import QuerySet
-from api.dtos.log_dto import ProjectLogReadDTO
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from api.dtos.log_dto import ProjectLogPageDTO, ProjectLogReadDTO
 from api.models import TaskLog
 
 
+def encode_log_cursor(created_at, log_id) -> str:
+    """
+    Opaque cursor for the position (created_at, id) of the last log on a page.
+    """
+    raw = f"{created_at.isoformat()}|{log_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_log_cursor(cursor: str):
+    """
+    Inverse of `encode_log_cursor`; raises ValueError for anything it didn't produce.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_raw, log_id = raw.split("|", 1)
+        created_at = parse_datetime(created_raw)
+        log_id = uuid.UUID(log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if created_at is None:
+        raise ValueError("Invalid cursor.")
+    return created_at, log_id
+
+
 class TaskLogQueryService:
     """
     Read-only service.
@@ -23,18 +51,10 @@ class TaskLogQueryService:
         """
         # Only return game-related events for the "game logs" endpoint.
         # (Avoid task lifecycle noise like TASK_CREATED / TASK_UPDATED / etc.)
-        allowed_event_types = (
-            TaskLog.EventType.USER_ATTACK,
-            TaskLog.EventType.BOSS_ATTACK,
-            TaskLog.EventType.KILL_BOSS,
-            TaskLog.EventType.KILL_PLAYER,
-            TaskLog.EventType.BOSS_REVIVE,
-            TaskLog.EventType.USER_REVIVE,
-        )
         logs = (
             self._base_queryset()
             .filter(project_id=project_id)
-            .filter(event_type__in=allowed_event_types)
+            .filter(event_type__in=TaskLog.GAME_EVENT_TYPES)
         )
         
         # Filter by time if provided
@@ -43,18 +63,79 @@ class TaskLogQueryService:
         
         logs = logs.order_by("-created_at")
 
-        return [
-            ProjectLogReadDTO(
-                id=str(log.id),
-                project_id=str(log.project_id),
-                actor_type=log.actor_type,
-                actor_id=(str(log.actor_id) if log.actor_id else None),
-                event_type=log.event_type,
-                payload=(log.payload or {}),
-                created_at=log.created_at,
-            )
-            for log in logs
-        ]
+        return [self._to_dto(log) for log in logs]
+
+    def get_game_logs_page(
+        self, project_id: str, *, limit: int, cursor: Optional[str] = None, time_begin=None
+    ) -> ProjectLogPageDTO:
+        """
+        One page of game logs, newest first, continuing after `cursor`.
+
+        Keyset pagination on (created_at, id): a page costs the same however deep the client
+        pages, and logs written meanwhile don't shift later pages. With `event_type IN (...)` the
+        order can't come from (project_id, event_type, created_at); expect a backward scan of
+        (project_id, created_at) from the cursor, filtering event_type, stopping at limit + 1.
+        `next_cursor` is None on the last page.
+        """
+        logs = (
+            self._base_queryset()
+            .filter(project_id=project_id)
+            .filter(event_type__in=TaskLog.GAME_EVENT_TYPES)
+        )
+        if time_begin is not None:
+            logs = logs.filter(created_at__gt=time_begin)
+        if cursor:
+            created_at, log_id = decode_log_cursor(cursor)
+            logs = logs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=log_id))
+
+        # One extra row tells whether another page follows without a COUNT.
+        rows = list(logs.order_by("-created_at", "-id")[: limit + 1])
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_log_cursor(rows[-1].created_at, rows[-1].id)
+
+        return ProjectLogPageDTO(logs=[self._to_dto(log) for log in rows], next_cursor=next_cursor)
+
+    def get_game_logs_after(self, project_id: str, last_event_id: str, *, limit: int = 500) -> Optional[list[ProjectLogReadDTO]]:
+        """
+        Game logs written after the log `last_event_id`, oldest first (event stream resume).
+
+        Returns None when the anchor log isn't in this project, or more than `limit` logs
+        follow it; the client should then reload the full list instead.
+        """
+        anchor = (
+            self._base_queryset()
+            .filter(project_id=project_id, id=last_event_id)
+            .values_list("created_at", flat=True)
+            .first()
+        )
+        if anchor is None:
+            return None
+
+        # >= so logs sharing the anchor's timestamp aren't skipped (clients dedupe by id).
+        logs = list(
+            self._base_queryset()
+            .filter(project_id=project_id, event_type__in=TaskLog.GAME_EVENT_TYPES, created_at__gte=anchor)
+            .exclude(id=last_event_id)
+            .order_by("created_at", "id")[: limit + 1]
+        )
+        if len(logs) > limit:
+            return None
+
+        return [self._to_dto(log) for log in logs]
+
+    @staticmethod
+    def _to_dto(log: TaskLog) -> ProjectLogReadDTO:
+        return ProjectLogReadDTO(
+            id=str(log.id),
+            project_id=(str(log.project_id) if log.project_id else None),
+            actor_type=log.actor_type,
+            actor_id=(str(log.actor_id) if log.actor_id else None),
+            event_type=log.event_type,
+            payload=(log.payload or {}),
+            created_at=log.created_at,
+        )
 
     # ---------- Grouping helpers ----------
     @staticmethod
@@ -133,16 +214,5 @@ class TaskLogQueryService:
             logs = logs.filter(created_at__gt=time_begin)
         logs = logs.order_by("-created_at")
 
-        return [
-            ProjectLogReadDTO(
-                id=str(log.id),
-                project_id=(str(log.project_id) if log.project_id else None),
-                actor_type=log.actor_type,
-                actor_id=(str(log.actor_id) if log.actor_id else None),
-                event_type=log.event_type,
-                payload=(log.payload or {}),
-                created_at=log.created_at,
-            )
-            for log in logs
-        ]
+        return [self._to_dto(log) for log in logs]
   
\ No newline at end of file
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "workquest:tasklog:project:"
+
+
+def channel_for(project_id: object) -> str:
+    return f"{CHANNEL_PREFIX}{project_id}"
+
+
+def log_event(log: Any) -> dict:
+    """
+    Stream payload for a TaskLog; same shape as a `get_project_logs` row.
+    """
+    return {
+        "id": str(log.id),
+        "project_id": (str(log.project_id) if log.project_id else None),
+        "actor_type": log.actor_type,
+        "actor_id": (str(log.actor_id) if log.actor_id else None),
+        "event_type": log.event_type,
+        "payload": (log.payload or {}),
+        "created_at": log.created_at,
+    }
+
+
+def format_sse(event: dict) -> str:
+    data = json.dumps(event, cls=JSONEncoder, separators=(",", ":"))
+    return f"id: {event['id']}\nevent: {event.get('event_type') or 'message'}\ndata: {data}\n\n"
+
+
+class Subscription:
+    """
+    One stream's inbox. If the client falls too far behind it is marked overflowed and the
+    stream ends; the client reconnects with Last-Event-ID and catches up from the database.
+    """
+
+    def __init__(self, project_id: str, *, max_pending: int):
+        self.project_id = project_id
+        self.overflowed = False
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max_pending)
+
+    def put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: float) -> Optional[dict]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class StreamLimitReached(Exception):
+    """
+    This worker already holds TASKLOG_STREAM_MAX_PER_WORKER open streams.
+    """
+
+
+class TaskLogHub:
+    """
+    Per-process fan-out of project TaskLog events to open SSE streams.
+
+    With the "redis" broker one background thread pattern-subscribes to every project channel
+    and dispatches to local subscriptions, so each event costs one Redis message per worker
+    rather than one query per poller. The "memory" broker dispatches in-process (dev/tests).
+
+    Each open stream holds a server thread for its whole lifetime, so `max_streams` (when > 0)
+    caps subscriptions per process and leaves the rest of the thread pool for other requests.
+    """
+
+    RECONNECT_SECONDS = 1.0
+
+    def __init__(self, *, broker: str = "redis", max_pending: int = 1000, max_streams: int = 0):
+        self.broker = broker
+        self.max_pending = max_pending
+        self.max_streams = max_streams
+        self._subs: dict[str, set[Subscription]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # -------- Subscribers --------
+    def subscribe(self, project_id: object) -> Subscription:
+        if self.broker == "redis":
+            self._ensure_started()
+        sub = Subscription(str(project_id), max_pending=self.max_pending)
+        with self._lock:
+            if self.max_streams and self._count >= self.max_streams:
+                raise StreamLimitReached()
+            self._subs.setdefault(sub.project_id, set()).add(sub)
+            self._count += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.project_id)
+            if subs is not None and sub in subs:
+                subs.discard(sub)
+                self._count -= 1
+                if not subs:
+                    del self._subs[sub.project_id]
+
+    def dispatch(self, project_id: object, event: dict) -> None:
+        with self._lock:
+            subs = list(self._subs.get(str(project_id), ()))
+        for sub in subs:
+            sub.put(event)
+
+    # -------- Publisher --------
+    def publish(self, project_id: object, event: dict) -> None:
+        if self.broker != "redis":
+            self.dispatch(project_id, json.loads(json.dumps(event, cls=JSONEncoder)))
+            return
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            get_redis_connection("default").publish(channel_for(project_id), json.dumps(event, cls=JSONEncoder))
+        except Exception:
+            # Best-effort: streams catch up from the database on reconnect.
+            logger.warning("TaskLog publish failed for project %s", project_id, exc_info=True)
+
+    # -------- Redis listener --------
+    def handle_message(self, message: dict) -> None:
+        if message.get("type") != "pmessage":
+            return
+        channel, data = message.get("channel"), message.get("data")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            event = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        self.dispatch(str(channel)[len(CHANNEL_PREFIX):], event)
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="tasklog-stream", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                from django_redis import get_redis_connection  # type: ignore
+
+                pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                for message in pubsub.listen():
+                    self.handle_message(message)
+            except Exception:
+                logger.warning("TaskLog stream listener disconnected; retrying", exc_info=True)
+                time.sleep(self.RECONNECT_SECONDS)
+
+
+_hub: Optional[TaskLogHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_hub() -> TaskLogHub:
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = TaskLogHub(
+                    broker=getattr(settings, "TASKLOG_STREAM_BROKER", "redis"),
+                    max_pending=getattr(settings, "TASKLOG_STREAM_MAX_PENDING", 1000),
+                    max_streams=getattr(settings, "TASKLOG_STREAM_MAX_PER_WORKER", 0),
+                )
+    return _hub
+
+
+def publish_task_log(log: Any) -> None:
+    """
+    Publish a freshly written TaskLog to its project's stream once the transaction commits
+    (streams resume from the database, so they must never see uncommitted rows).
+    """
+    if not getattr(settings, "TASKLOG_STREAM_ENABLED", True) or not log.project_id:
+        return
+    event = log_event(log)
+    project_id = log.project_id
+
+    def _publish() -> None:
+        get_hub().publish(project_id, event)
+
+    if connection.in_atomic_block:
+        transaction.on_commit(_publish)
+    else:
+        _publish()
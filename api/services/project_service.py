@@ -38,7 +38,7 @@ class ProjectService:
 
         project_domain = ProjectDomain(project)
         # add owner as member
-        project_domain._project_member_management.add_member(user)
+        project_domain.project_member_management.add_member(user)
         return project_domain
 
     @transaction.atomic
@@ -118,7 +118,7 @@ class ProjectService:
             if ProjectMember.objects.filter(user=user, project=project).exists():
                 return {"error": "User is already a member of the project."}
 
-            member = domain._project_member_management.add_member(user)
+            member = domain.project_member_management.add_member(user)
 
             return {"member" : member, "message": "User successfully added to the project."}
         except Exception as e:
@@ -137,7 +137,7 @@ class ProjectService:
         # prevent removing non-members
         if project_members.exists():
             project_member = project_members.first()
-            member = domain._project_member_management.remove_member(project_member.project_member_id)
+            member = domain.project_member_management.remove_member(project_member.project_member_id)
             return True
         return False
     
@@ -161,7 +161,7 @@ class ProjectService:
         """
         project = ProjectModel.objects.get(project_id=project_id)
         domain = ProjectDomain(project)
-        members = domain._project_member_management.members
+        members = domain.project_member_management.members
         return members
 
     def get_project_end_summary(self, user, project_id):
@@ -228,7 +228,7 @@ class ProjectService:
             }
 
         domain = ProjectDomain(project)
-        members = domain._project_member_management.members
+        members = domain.project_member_management.members
 
         delay_days = None
         reduction_percent = None
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = ("requests", "errors", "db_queries", "cache_calls")
+FLOAT_FIELDS = ("seconds", "db_seconds")
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class RequestStats:
+    """
+    Counters for the request being served (see `current_stats()`).
+    """
+
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    cache_calls: int = 0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_metrics_current", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def count_cache_call() -> None:
+    """
+    Count one Redis round-trip against the current request (no-op outside a request).
+    """
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_calls += 1
+
+
+def bucket_field(upper_ms: Optional[float]) -> str:
+    return "le_inf" if upper_ms is None else f"le_{int(upper_ms)}"
+
+
+class RequestMetrics:
+    """
+    Per-view request counters and latency histograms (wall time, DB queries/time, cache calls).
+
+    Like `CacheMetrics`, counters are accumulated in-process and flushed to Redis hashes at most
+    every `REQUEST_METRICS_FLUSH_SECONDS` in one pipeline, so every worker contributes to a shared
+    view without a Redis write per request.
+    """
+
+    def __init__(self, *, prefix: str = "workquest:metrics:requests", flush_seconds: Optional[float] = None):
+        self.prefix = prefix
+        self.flush_seconds = (
+            float(getattr(settings, "REQUEST_METRICS_FLUSH_SECONDS", 10)) if flush_seconds is None else flush_seconds
+        )
+        self._pending: dict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(getattr(settings, "REQUEST_METRICS_ENABLED", True))
+
+    @property
+    def buckets_ms(self) -> tuple[float, ...]:
+        return tuple(sorted(getattr(settings, "REQUEST_METRICS_BUCKETS_MS", DEFAULT_BUCKETS_MS)))
+
+    def views_key(self) -> str:
+        return f"{self.prefix}:views"
+
+    def view_key(self, view: str) -> str:
+        return f"{self.prefix}:view:{view}"
+
+    # -------- Recording --------
+    def start(self) -> Token:
+        """
+        Begin counting for a request; pass the returned token to `finish()`.
+        """
+        return _current.set(RequestStats())
+
+    def finish(self, token: Token, view: str, seconds: float, *, error: bool = False) -> None:
+        stats = _current.get() or RequestStats()
+        _current.reset(token)
+        buckets = self.buckets_ms
+        idx = bisect.bisect_left(buckets, seconds * 1000)
+        bucket = bucket_field(buckets[idx] if idx < len(buckets) else None)
+        with self._lock:
+            fields = self._pending[view]
+            fields["requests"] += 1
+            fields["errors"] += int(error)
+            fields["seconds"] += seconds
+            fields["db_queries"] += stats.db_queries
+            fields["db_seconds"] += stats.db_seconds
+            fields["cache_calls"] += stats.cache_calls
+            fields[bucket] += 1
+            due = time.monotonic() - self._last_flush >= self.flush_seconds
+        if due:
+            self.flush()
+
+    # -------- Storage --------
+    def _take_pending(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            pending = {view: dict(fields) for view, fields in self._pending.items()}
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+        return pending
+
+    def flush(self) -> None:
+        pending = self._take_pending()
+        if not pending:
+            return
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            pipe = get_redis_connection("default").pipeline(transaction=False)
+            for view, fields in pending.items():
+                pipe.sadd(self.views_key(), view)
+                for name, amount in fields.items():
+                    if name in FLOAT_FIELDS:
+                        pipe.hincrbyfloat(self.view_key(view), name, amount)
+                    else:
+                        pipe.hincrby(self.view_key(view), name, int(amount))
+            pipe.execute()
+        except Exception:
+            # Metrics must never break requests; this batch is dropped.
+            logger.warning("request metrics flush failed", exc_info=True)
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Return aggregated counters and histogram per view (all workers), with averages and
+        percentile estimates (upper bound of the bucket the percentile falls in).
+        """
+        self.flush()
+        raw: dict[str, dict[str, float]] = {}
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            conn = get_redis_connection("default")
+            views = sorted(
+                v.decode("utf-8") if isinstance(v, bytes) else str(v) for v in conn.smembers(self.views_key())
+            )
+            pipe = conn.pipeline(transaction=False)
+            for view in views:
+                pipe.hgetall(self.view_key(view))
+            for view, fields in zip(views, pipe.execute()):
+                raw[view] = {
+                    (k.decode("utf-8") if isinstance(k, bytes) else str(k)): float(v) for k, v in fields.items()
+                }
+        except Exception:
+            logger.warning("request metrics snapshot failed", exc_info=True)
+        return {view: self._derive(fields) for view, fields in raw.items()}
+
+    def reset(self) -> None:
+        self._take_pending()
+        try:
+            from django_redis import get_redis_connection  # type: ignore
+
+            conn = get_redis_connection("default")
+            views = conn.smembers(self.views_key())
+            keys = [self.view_key(v.decode("utf-8") if isinstance(v, bytes) else str(v)) for v in views]
+            conn.delete(self.views_key(), *keys)
+        except Exception:
+            logger.warning("request metrics reset failed", exc_info=True)
+
+    def _derive(self, fields: dict[str, float]) -> dict:
+        out: dict = {name: int(fields.get(name, 0)) for name in COUNTER_FIELDS}
+        out.update({name: round(float(fields.get(name, 0.0)), 6) for name in FLOAT_FIELDS})
+        requests = out["requests"]
+        out["avg_ms"] = round(out["seconds"] * 1000 / requests, 3) if requests else None
+        out["avg_db_queries"] = round(out["db_queries"] / requests, 2) if requests else None
+        out["avg_db_ms"] = round(out["db_seconds"] * 1000 / requests, 3) if requests else None
+        out["avg_cache_calls"] = round(out["cache_calls"] / requests, 2) if requests else None
+
+        bounds = [*self.buckets_ms, None]
+        histogram = {bucket_field(b): int(fields.get(bucket_field(b), 0)) for b in bounds}
+        out["histogram_ms"] = histogram
+        total = sum(histogram.values())
+        for pct in PERCENTILES:
+            out[f"p{pct}_ms"] = None
+            if not total:
+                continue
+            seen = 0
+            for bound in bounds:
+                seen += histogram[bucket_field(bound)]
+                if seen >= total * pct / 100:
+                    out[f"p{pct}_ms"] = bound if bound is not None else "inf"
+                    break
+        return out
+
+
+request_metrics = RequestMetrics()
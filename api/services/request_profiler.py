@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Requests in flight in this process, and the captures running now. cProfile records calls from
+# every thread (on 3.12+ it's built on the interpreter-wide sys.monitoring), so a capture that
+# overlapped another request is mixed with that request's calls and is discarded.
+_lock = threading.Lock()
+_inflight = 0
+_active: dict[int, "ProfileCapture"] = {}
+
+PROFILE_SUFFIX = ".prof"
+META_SUFFIX = ".json"
+HEADER = "X-Profile"
+
+
+def profiler_dir() -> Path:
+    return Path(getattr(settings, "REQUEST_PROFILER_DIR", None) or Path(settings.BASE_DIR) / "profiles")
+
+
+def should_profile(request, view_name: Optional[str]) -> bool:
+    """
+    Profile this request? Restricted to REQUEST_PROFILER_VIEWS (when set), then sampled at
+    REQUEST_PROFILER_SAMPLE_RATE, or forced by an `X-Profile` header carrying the internal API key.
+    """
+    views = getattr(settings, "REQUEST_PROFILER_VIEWS", ())
+    if views and view_name not in views:
+        return False
+    api_key = os.getenv("INTERNAL_SERVICE_API_KEY")
+    if api_key and request.headers.get(HEADER) == api_key:
+        return True
+    rate = float(getattr(settings, "REQUEST_PROFILER_SAMPLE_RATE", 0.0))
+    return rate > 0 and random.random() < rate
+
+
+def request_started() -> None:
+    global _inflight
+    with _lock:
+        _inflight += 1
+        for capture in _active.values():
+            capture.overlapped = True
+
+
+def request_finished() -> None:
+    global _inflight
+    with _lock:
+        _inflight -= 1
+
+
+@dataclass
+class ProfileCapture:
+    """
+    cProfile plus captured SQL for one request; `start()` in process_view, `stop()` once the
+    response is built. `overlapped` is set when another request ran in this process meanwhile.
+    """
+
+    view_name: str
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    queries: list[dict[str, Any]] = field(default_factory=list)
+    started: float = 0.0
+    seconds: float = 0.0
+    overlapped: bool = False
+    _stack: ExitStack = field(default_factory=ExitStack)
+
+    def start(self) -> "ProfileCapture":
+        for conn in connections.all():
+            self._stack.enter_context(conn.execute_wrapper(self._capture_sql))
+        self.started = time.perf_counter()
+        try:
+            self.profile.enable()
+        except ValueError:
+            # Another profile is already running in this process.
+            self._stack.close()
+            raise
+        with _lock:
+            self.overlapped = _inflight > 1
+            _active[id(self)] = self
+        return self
+
+    def stop(self) -> None:
+        self.profile.disable()
+        with _lock:
+            _active.pop(id(self), None)
+        self.seconds = time.perf_counter() - self.started
+        self._stack.close()
+
+    def _capture_sql(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({"sql": sql, "ms": round((time.perf_counter() - started) * 1000, 3), "many": many})
+
+    def write(self, request, status_code: int) -> Optional[Path]:
+        """
+        Write `<stamp>-<view>.prof` (pstats format) and a `.json` sidecar with the request and
+        its SQL; prunes the oldest beyond REQUEST_PROFILER_MAX_PROFILES.
+        """
+        directory = profiler_dir()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            stem = f"{timezone.now():%Y%m%dT%H%M%S%f}-{_safe(self.view_name)}"
+            self.profile.dump_stats(str(directory / f"{stem}{PROFILE_SUFFIX}"))
+            meta = {
+                "view": self.view_name,
+                "method": request.method,
+                "path": request.path,
+                "status": status_code,
+                "ms": round(self.seconds * 1000, 3),
+                "query_count": len(self.queries),
+                "query_ms": round(sum(q["ms"] for q in self.queries), 3),
+                "queries": self.queries,
+                "created_at": timezone.now().isoformat(),
+            }
+            (directory / f"{stem}{META_SUFFIX}").write_text(json.dumps(meta, indent=1))
+            _prune(directory, int(getattr(settings, "REQUEST_PROFILER_MAX_PROFILES", 200)))
+            return directory / f"{stem}{PROFILE_SUFFIX}"
+        except OSError:
+            logger.warning("could not write request profile to %s", directory, exc_info=True)
+            return None
+
+
+def iter_profiles(directory: Optional[Path] = None) -> Iterator[tuple[Path, dict[str, Any]]]:
+    """
+    (profile path, sidecar metadata) for every complete profile in `directory`, newest first.
+    """
+    directory = directory or profiler_dir()
+    if not directory.is_dir():
+        return
+    for meta_path in sorted(directory.glob(f"*{META_SUFFIX}"), reverse=True):
+        prof_path = meta_path.with_suffix(PROFILE_SUFFIX)
+        if not prof_path.exists():
+            continue
+        try:
+            yield prof_path, json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            continue
+
+
+def _safe(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name or "unresolved")[:80]
+
+
+def _prune(directory: Path, keep: int) -> None:
+    metas = sorted(directory.glob(f"*{META_SUFFIX}"))
+    for meta_path in metas[: max(len(metas) - keep, 0)]:
+        meta_path.unlink(missing_ok=True)
+        meta_path.with_suffix(PROFILE_SUFFIX).unlink(missing_ok=True)
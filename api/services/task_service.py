@@ -5,7 +5,7 @@ class TaskService:
     def __init__(self, project_id, user):
         project = ProjectModel.objects.get(project_id=project_id)
         self._domain = Project(project)
-        self._task_management = self._domain._task_management
+        self._task_management = self._domain.TaskManagement
         self._user = user
 
     def get_all_tasks(self):
@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from api.services.auth_service import revoke_user_tokens
+
+_CREDENTIAL_FIELDS = {"password", "is_active"}
+
+
+@receiver(pre_save, sender=User, dispatch_uid="api.revoke_tokens_on_credential_change")
+def revoke_tokens_on_credential_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Revoke the user's tokens when their password changes or they are deactivated; claims-
+    authenticated views never load the user, so they rely on the revocation list for both.
+    """
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not _CREDENTIAL_FIELDS.intersection(update_fields):
+        # e.g. the last_login update on every login.
+        return
+    old = sender.objects.filter(pk=instance.pk).values("password", "is_active").first()
+    if old is None:
+        return
+    if old["password"] != instance.password or (old["is_active"] and not instance.is_active):
+        user_id = instance.pk
+        transaction.on_commit(lambda: revoke_user_tokens(user_id))
@@ -7,6 +7,7 @@ from api.views.log_view import *
 from api.views.review_view import *
 from api.views.ai_view import *
 from api.views.feedback_view import *
+from api.views.metrics_view import *
 import rest_framework.decorators
 
 urlpatterns = [
@@ -71,7 +72,11 @@ urlpatterns = [
     # ----- Log URLs -----
     path("project/<uuid:project_id>/logs/game/", get_project_logs, name="get_project_logs"),
     path("project/<uuid:project_id>/logs/game/grouped/", get_project_logs_grouped, name="get_project_logs_grouped"),
+    path("project/<uuid:project_id>/logs/game/stream/", stream_project_logs, name="stream_project_logs"),
     path("internal/logs/", get_all_task_logs, name="get_all_task_logs"),
+    # ----- Internal metrics URLs -----
+    path("internal/cache/stats/", get_cache_stats, name="get_cache_stats"),
+    path("internal/requests/stats/", get_request_stats, name="get_request_stats"),
     # ----- Review URLs -----
     path("project/<uuid:project_id>/review/report/", review_report, name="review_report"),
     path("project/<uuid:project_id>/review/get_all_review/", get_all_review, name="get_all_review"),
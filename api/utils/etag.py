@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+ETAG_FIELD = "_etag"
+VALUE_FIELD = "_value"
+
+
+def compute_etag(data: Any) -> Optional[str]:
+    """
+    Weak ETag for a payload (hash of its pickled form). Returns None when it can't be hashed.
+
+    Pickle output isn't canonical, so this is computed once when a cache entry is built and
+    stored with it (see `tag`), never per response.
+    """
+    try:
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return f'W/"{hashlib.blake2b(blob, digest_size=16).hexdigest()}"'
+
+
+def tag(value: Any) -> dict:
+    """
+    Cache entry carrying `value` and its ETag.
+    """
+    return {ETAG_FIELD: compute_etag(value), VALUE_FIELD: value}
+
+
+def tagged(loader: Callable[[], Any]) -> Callable[[], dict]:
+    """
+    Wrap a read-through loader so the cached entry carries its ETag (see `tagged_response`).
+    """
+    return lambda: tag(loader())
+
+
+def tagged_response(entry: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Response for a cache entry built by `tag`, with the stored ETag for `conditional_etag`.
+    Untagged entries (written before tagging) are returned without an ETag.
+    """
+    if isinstance(entry, dict) and entry.keys() == {ETAG_FIELD, VALUE_FIELD}:
+        response = Response(entry[VALUE_FIELD], status=status_code)
+        if entry[ETAG_FIELD]:
+            response["ETag"] = entry[ETAG_FIELD]
+        return response
+    return Response(entry, status=status_code)
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    candidates = parse_etags(if_none_match)
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(c.removeprefix("W/") == opaque for c in candidates)
+
+
+def conditional_etag(view):
+    """
+    Decorator for polled GET views: answer a matching `If-None-Match` with an empty 304 (no
+    rendering, no body). The ETag is the one the view set from its cache entry (see
+    `tagged_response`); responses without one pass through untouched.
+
+    Place it under `@api_view` / `@permission_classes` so auth still runs first.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD") or not isinstance(response, Response):
+            return response
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        etag = response.get("ETag")
+        if not etag:
+            return response
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and _matches(if_none_match, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = etag
+        # Let browsers keep the body but always revalidate it.
+        if not response.has_header("Cache-Control"):
+            response["Cache-Control"] = "private, no-cache"
+        return response
+
+    return wrapper
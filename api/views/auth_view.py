@@ -3,14 +3,17 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from api.services.auth_service import register_user, login_user
+from api.services.auth_service import register_user, login_user, revoke_token, is_token_revoked
 from rest_framework import status
 from api.models import BusinessUser
 from api.services.cache_service import CacheService
+import logging
 import requests
 import uuid
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 def _cookie_kwargs() -> dict:
     """
@@ -127,6 +130,12 @@ def login(request):
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])  
 def logout(request):
+    if request.auth is not None:
+        try:
+            revoke_token(request.auth)
+        except Exception:
+            # Cookies are still cleared; the token just stays usable on claims views until expiry.
+            logger.warning("could not revoke access token on logout", exc_info=True)
     response = Response({"message": "Logged out"})
     cookie_kwargs = _cookie_kwargs()
     response.delete_cookie("access", path=cookie_kwargs.get("path", "/"), domain=cookie_kwargs.get("domain"))
@@ -231,6 +240,9 @@ def refresh_token(request):
 
     try:
         refresh = RefreshToken(refresh_token)
+        # The new access token gets a fresh iat, so the user's revocation has to be checked here.
+        if is_token_revoked(refresh):
+            return Response({"error": "Invalid refresh token"}, status=401)
         access = str(refresh.access_token)
     except Exception:
         return Response({"error": "Invalid refresh token"}, status=401)
@@ -7,6 +7,7 @@ from api.models import BusinessUser
 from api.models.ProjectMember import ProjectMember
 from api.serializers.feedback_serializer import UserFeedbackSerializer
 from api.services.feedback_service import feedbackService
+from api.cookie_authentication import get_business_user
 
 
 @api_view(["GET"])
@@ -18,8 +19,7 @@ def get_project_feedback(request, project_id):
     Returns personalized feedback for the authenticated user's membership in the project.
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         requester_member = ProjectMember.objects.get(project_id=project_id, user=user)
         fb = feedbackService().get_feedback(requester_member.project_member_id, project_id)
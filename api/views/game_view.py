@@ -1,6 +1,6 @@
 # views/game_view.py
 
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
@@ -10,6 +10,8 @@ from api.models.ProjectMember import ProjectMember
 from api.services.game_service import GameService
 from api.serializers.game_serializer import BossSerializer, ProjectBossSerializer
 from api.services.cache_service import CacheService
+from api.utils.etag import conditional_etag, tagged, tagged_response
+from api.cookie_authentication import ClaimsJWTAuthentication, get_business_user
 
 # -------------------------
 # Boss Query
@@ -61,9 +63,14 @@ def get_all_bosses(request):
     """
     try:
         service = GameService()
-        bosses = service.get_all_bosses()
-        serializer = BossSerializer(bosses, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        cache_svc = CacheService()
+        data = cache_svc.read_through(
+            key=cache_svc.keys.all_bosses(),
+            ttl_seconds=300,
+            loader=lambda: list(BossSerializer(service.get_all_bosses(), many=True).data),
+            local=True,
+        )
+        return Response(data, status=status.HTTP_200_OK)
     except Exception as e:
         return Response(
             {"error": str(e)},
@@ -147,7 +154,7 @@ def player_attack(request, project_id):
         service = GameService()
         result = service.player_attack(project_id, task_id)
 
-        CacheService().invalidate_project_game(project_id)
+        # GameService writes the fresh game status through to the cache.
         CacheService().invalidate_project_logs(project_id)
         CacheService().invalidate_project_member_status_effects(project_id)
 
@@ -177,7 +184,7 @@ def boss_attack(request, project_id):
         service = GameService()
         result = service.boss_attack(project_id, task_id)
 
-        CacheService().invalidate_project_game(project_id)
+        # GameService writes the fresh game status through to the cache.
         CacheService().invalidate_project_logs(project_id)
         CacheService().invalidate_project_member_status_effects(project_id)
 
@@ -215,7 +222,7 @@ def player_heal(request, project_id):
         service = GameService()
         result = service.player_heal(project_id, healer_id, player_id, heal_value)
 
-        CacheService().invalidate_project_game(project_id)
+        # GameService writes the fresh game status through to the cache.
         CacheService().invalidate_project_logs(project_id)
 
         return Response({"message": "Player heal successful", "result": result}, status=status.HTTP_200_OK)
@@ -241,8 +248,7 @@ def player_support(request, project_id):
         if not report_id:
             return Response({"error": "report_id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         service = GameService()
         result = service.player_support(project_id, report_id, user)
@@ -280,7 +286,7 @@ def revive(request, project_id):
         service = GameService()
         service.revive_player(project_id, player_id)
 
-        CacheService().invalidate_project_game(project_id)
+        # GameService writes the fresh game status through to the cache.
         CacheService().invalidate_project_logs(project_id)
 
         return Response({"message": "Player revived successfully"}, status=status.HTTP_200_OK)
@@ -302,8 +308,8 @@ def get_boss_status(request, project_id):
         service = GameService()
         cache_svc = CacheService()
         data = cache_svc.read_through(
-            key=cache_svc.keys.boss_status(project_id),
-            ttl_seconds=5,
+            key=cache_svc.boss_status_key(project_id),
+            ttl_seconds=cache_svc.GAME_STATUS_TTL_SECONDS,
             loader=lambda: service.get_boss_status(project_id),
         )
         return Response(data, status=status.HTTP_200_OK)
@@ -320,8 +326,8 @@ def get_user_statuses(request, project_id):
         service = GameService()
         cache_svc = CacheService()
         data = cache_svc.read_through(
-            key=cache_svc.keys.user_statuses(project_id),
-            ttl_seconds=3,
+            key=cache_svc.user_statuses_key(project_id),
+            ttl_seconds=cache_svc.GAME_STATUS_TTL_SECONDS,
             loader=lambda: service.get_user_statuses(project_id),
         )
         return Response(data, status=status.HTTP_200_OK)
@@ -333,16 +339,18 @@ def get_user_statuses(request, project_id):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@authentication_classes([ClaimsJWTAuthentication])
+@conditional_etag
 def get_game_status(request, project_id):
     try:
         service = GameService()
         cache_svc = CacheService()
-        data = cache_svc.read_through(
-            key=cache_svc.keys.game_status(project_id),
-            ttl_seconds=3,
-            loader=lambda: service.get_game_status(project_id),
+        entry = cache_svc.read_through(
+            key=cache_svc.game_status_key(project_id),
+            ttl_seconds=cache_svc.GAME_STATUS_TTL_SECONDS,
+            loader=tagged(lambda: service.get_game_status(project_id)),
         )
-        return Response(data, status=status.HTTP_200_OK)
+        return tagged_response(entry, status.HTTP_200_OK)
     except ValueError as e:
         return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
@@ -376,8 +384,7 @@ def setup_special_boss(request, project_id):
 @permission_classes([IsAuthenticated])
 def get_project_member_items(request, project_id):
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         requester_member = ProjectMember.objects.get(project_id=project_id, user=user)
         target_member_id = str(requester_member.project_member_id)
@@ -389,7 +396,7 @@ def get_project_member_items(request, project_id):
             return service.get_project_member_items(project_id, user, player_id=target_member_id)
 
         data = cache_svc.read_through(
-            key=cache_svc.keys.project_member_items(project_id, target_member_id),
+            key=cache_svc.project_member_items_key(project_id, target_member_id),
             ttl_seconds=3,
             loader=_load,
         )
@@ -410,8 +417,7 @@ def get_project_member_items(request, project_id):
 @permission_classes([IsAuthenticated])
 def use_project_member_item(request, project_id):
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         item_id = request.data.get("item_id")
         player_id = request.data.get("player_id")
@@ -451,8 +457,7 @@ def use_project_member_item(request, project_id):
 @permission_classes([IsAuthenticated])
 def get_project_member_status_effects(request, project_id):
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         requester_member = ProjectMember.objects.get(project_id=project_id, user=user)
         target_member_id = str(requester_member.project_member_id)
@@ -460,7 +465,7 @@ def get_project_member_status_effects(request, project_id):
         service = GameService()
         cache_svc = CacheService()
         data = cache_svc.read_through(
-            key=cache_svc.keys.project_member_status_effects(project_id, target_member_id),
+            key=cache_svc.project_member_status_effects_key(project_id, target_member_id),
             ttl_seconds=3,
             loader=lambda: service.get_project_member_status_effects(project_id, user, player_id=target_member_id),
         )
@@ -1,18 +1,29 @@
 # views/log_view.py
+import json
+import time as monotonic_time
+import uuid
 from dataclasses import asdict
 from datetime import datetime, time
 
+from django.conf import settings
+from django.db import connection
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
 
 from api.models import BusinessUser, Project
 from api.services.log_service import TaskLogQueryService
 from api.domains.project import Project as ProjectDomain
 from api.services.cache_service import CacheService
+from api.services.log_stream import StreamLimitReached, format_sse, get_hub, log_event
+from api.utils.etag import conditional_etag, tagged, tagged_response
+from api.cookie_authentication import ClaimsJWTAuthentication, get_business_user
 
 
 def _parse_time_begin(raw):
@@ -41,24 +52,45 @@ def _parse_time_begin(raw):
     return dt
 
 
+def _parse_limit(raw):
+    """
+    Parse a `limit` query param: GAME_LOGS_PAGE_SIZE when absent, capped at GAME_LOGS_MAX_PAGE_SIZE.
+    """
+    default = int(getattr(settings, "GAME_LOGS_PAGE_SIZE", 100))
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValueError("Invalid limit. Use a positive integer.")
+    if limit < 1:
+        raise ValueError("Invalid limit. Use a positive integer.")
+    return min(limit, int(getattr(settings, "GAME_LOGS_MAX_PAGE_SIZE", 500)))
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@authentication_classes([ClaimsJWTAuthentication])
+@conditional_etag
 def get_project_logs(request, project_id):
     """
-    Get all logs for a specific project.
+    Get game logs for a specific project, newest first, one page at a time.
 
     Query params:
     - time_begin: ISO 8601 datetime or date string; filters created_at > time_begin
-    
-    Returns logs including task lifecycle events and game mechanics events.
+    - limit: page size (default GAME_LOGS_PAGE_SIZE, capped at GAME_LOGS_MAX_PAGE_SIZE)
+    - cursor: `next_cursor` from the previous page
+
+    `next_cursor` is null on the last page.
     """
     try:
-        # Parse time_begin query parameter
+        # Parse query parameters
         time_begin_raw = request.query_params.get("time_begin")
         time_begin = _parse_time_begin(time_begin_raw)
+        limit = _parse_limit(request.query_params.get("limit"))
+        cursor = (request.query_params.get("cursor") or "").strip() or None
         
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         
         # Check if user has access to the project
         project = Project.objects.get(project_id=project_id)
@@ -73,27 +105,34 @@ def get_project_logs(request, project_id):
 
         def _load() -> dict:
             log_service = TaskLogQueryService()
-            # get_game_logs includes logs related to the project through tasks, project_members, or project_bosses
-            logs = log_service.get_game_logs(project_id, time_begin=time_begin)
-            logs_data = [asdict(log) for log in logs]
+            page = log_service.get_game_logs_page(project_id, limit=limit, cursor=cursor, time_begin=time_begin)
+            logs_data = [asdict(log) for log in page.logs]
             return {
                 "project_id": str(project_id),
                 "logs": logs_data,
                 "count": len(logs_data),
+                "next_cursor": page.next_cursor,
             }
 
-        # Include time_begin in cache key if provided (different time_begin = different cache entry)
-        cache_key = cache_svc.keys.project_game_logs(project_id)
-        if time_begin is not None:
-            cache_key = f"{cache_key}:time_begin:{time_begin.isoformat()}"
-
-        payload = cache_svc.read_through(
-            key=cache_key,
-            ttl_seconds=5,
-            loader=_load,
-        )
+        # One entry per page (limit, cursor, time_begin); new logs bump the head page's generation.
+        cache_key = cache_svc.project_game_logs_key(project_id, limit=limit, cursor=cursor, time_begin=time_begin)
+
+        if cursor is None:
+            # Busy projects have many pollers on the first page: serve it stale while one worker refreshes it.
+            entry = cache_svc.read_through(
+                key=cache_key,
+                ttl_seconds=30,
+                soft_ttl_seconds=5,
+                single_flight=True,
+                loader=tagged(_load),
+            )
+        else:
+            # Older pages don't change with new logs, but a row written earlier inside a still-open
+            # transaction (TaskLog.batch()) can commit into one after it was cached; no generation
+            # reaches these keys, so only a short TTL bounds that.
+            entry = cache_svc.read_through(key=cache_key, ttl_seconds=30, loader=tagged(_load))
 
-        return Response(payload, status=status.HTTP_200_OK)
+        return tagged_response(entry, status.HTTP_200_OK)
     except ValueError as e:
         return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Project.DoesNotExist:
@@ -129,8 +168,7 @@ def get_project_logs_grouped(request, project_id):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
 
         # Check if user has access to the project
         project = Project.objects.get(project_id=project_id)
@@ -191,6 +229,150 @@ def get_project_logs_grouped(request, project_id):
         )
 
 
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets DRF accept `Accept: text/event-stream` (EventSource); only error bodies are rendered
+    through it, the stream itself is a StreamingHttpResponse.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, cls=JSONEncoder).encode("utf-8")
+
+
+def _event_stream(hub, sub, backlog):
+    max_seconds = float(getattr(settings, "TASKLOG_STREAM_MAX_SECONDS", 300))
+    heartbeat = float(getattr(settings, "TASKLOG_STREAM_HEARTBEAT_SECONDS", 15))
+    try:
+        yield "retry: 3000\n\n"
+        if backlog is None:
+            yield "event: resync\ndata: {}\n\n"
+        sent = set()
+        for log in backlog or ():
+            event = log_event(log)
+            sent.add(event["id"])
+            yield format_sse(event)
+
+        deadline = monotonic_time.monotonic() + max_seconds
+        while not sub.overflowed:
+            remaining = deadline - monotonic_time.monotonic()
+            if remaining <= 0:
+                break
+            event = sub.get(timeout=min(heartbeat, remaining))
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            if event.get("id") in sent:
+                continue
+            yield format_sse(event)
+    finally:
+        hub.unsubscribe(sub)
+
+
+class _EventStream:
+    """
+    `_event_stream` whose close() always releases the subscription (and its stream slot): a
+    generator closed before its first chunk never runs its `finally`.
+    """
+
+    def __init__(self, hub, sub, backlog):
+        self._hub = hub
+        self._sub = sub
+        self._events = _event_stream(hub, sub, backlog)
+
+    def __iter__(self):
+        return self._events
+
+    def close(self):
+        self._events.close()
+        self._hub.unsubscribe(self._sub)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def stream_project_logs(request, project_id):
+    """
+    Server-sent events stream of a project's game log events (same rows as get_project_logs),
+    pushed as they are written instead of polled.
+
+    Resume:
+    - `Last-Event-ID` header (sent by EventSource on reconnect) or `last_event_id` query param
+      (e.g. the newest id from get_project_logs) replays the events written since that log.
+    - A `resync` event means the gap can't be replayed; reload get_project_logs.
+
+    The stream ends after TASKLOG_STREAM_MAX_SECONDS (or if the client falls too far behind);
+    EventSource reconnects and resumes from the last id it received.
+
+    Each stream holds a server thread, so a worker serves at most TASKLOG_STREAM_MAX_PER_WORKER
+    at once and answers 503 (with Retry-After) beyond that; clients fall back to polling
+    get_project_logs.
+    """
+    try:
+        last_event_id = request.META.get("HTTP_LAST_EVENT_ID") or request.query_params.get("last_event_id")
+        if last_event_id:
+            try:
+                last_event_id = str(uuid.UUID(str(last_event_id)))
+            except ValueError:
+                raise ValueError("Invalid last_event_id.")
+
+        user = get_business_user(request)
+
+        project = Project.objects.get(project_id=project_id)
+        domain = ProjectDomain(project)
+        if not domain.check_access(user):
+            return Response(
+                {"error": "User does not have access to this project"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        hub = get_hub()
+        # Subscribe before reading the backlog so no event falls between the two.
+        try:
+            sub = hub.subscribe(project_id)
+        except StreamLimitReached:
+            response = Response(
+                {"error": "Too many open log streams; poll get_project_logs instead."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+            response["Retry-After"] = "30"
+            return response
+        try:
+            backlog = (
+                TaskLogQueryService().get_game_logs_after(str(project_id), last_event_id) if last_event_id else []
+            )
+        except Exception:
+            hub.unsubscribe(sub)
+            raise
+        # The stream itself never queries; Django would only release this connection when the
+        # stream ends (request_finished), idling it for up to TASKLOG_STREAM_MAX_SECONDS.
+        if not connection.in_atomic_block:
+            connection.close()
+
+        response = StreamingHttpResponse(_EventStream(hub, sub, backlog), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Don't let a reverse proxy buffer the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Project.DoesNotExist:
+        return Response(
+            {"error": "Project not found"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    except BusinessUser.DoesNotExist:
+        return Response(
+            {"error": "Business user profile not found"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    except Exception as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
 @api_view(["GET"])
 def get_all_task_logs(request):
     """
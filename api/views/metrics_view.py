@@ -0,0 +1,66 @@
+# views/metrics_view.py
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.decorators import api_view
+
+from api.services.cache_metrics import cache_metrics
+from api.services.request_metrics import request_metrics
+
+
+@api_view(["GET", "DELETE"])
+def get_cache_stats(request):
+    """
+    Per-key-family cache counters aggregated across workers (internal; X-API-KEY protected).
+
+    GET returns the counters; DELETE resets them.
+    """
+    try:
+        if request.method == "DELETE":
+            cache_metrics.reset()
+            return Response({"message": "Cache metrics reset."}, status=status.HTTP_200_OK)
+
+        families = cache_metrics.snapshot()
+        return Response(
+            {
+                "enabled": cache_metrics.enabled,
+                "families": families,
+                "count": len(families),
+            },
+            status=status.HTTP_200_OK,
+        )
+    except Exception as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(["GET", "DELETE"])
+def get_request_stats(request):
+    """
+    Per-view request latency histograms, DB and cache call counts aggregated across workers
+    (internal; X-API-KEY protected). Views are sorted slowest p99 first.
+
+    GET returns the stats; DELETE resets them.
+    """
+    try:
+        if request.method == "DELETE":
+            request_metrics.reset()
+            return Response({"message": "Request metrics reset."}, status=status.HTTP_200_OK)
+
+        views = request_metrics.snapshot()
+        ordered = sorted(
+            views.items(),
+            key=lambda item: (
+                float("inf") if item[1]["p99_ms"] == "inf" else (item[1]["p99_ms"] or 0),
+                item[1]["avg_ms"] or 0,
+            ),
+            reverse=True,
+        )
+        return Response(
+            {
+                "enabled": request_metrics.enabled,
+                "views": dict(ordered),
+                "count": len(views),
+            },
+            status=status.HTTP_200_OK,
+        )
+    except Exception as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -8,6 +8,7 @@ from api.models import BusinessUser, ProjectMember
 from api.services.cache_service import CacheService
 from api.services.project_service import ProjectService
 from api.services.achievement_service import get_overall_achievement_ids_for_user
+from api.cookie_authentication import get_business_user
 
 
 @api_view(["GET", "PATCH"])
@@ -178,6 +179,7 @@ def me(request):
         key=cache_svc.keys.user_me(user.id),
         ttl_seconds=30,
         loader=_load,
+        local=True,
     )
     return Response(data)
 
@@ -206,8 +208,7 @@ def get_user_finished_projects(request):
             finished_projects = project_service.get_user_finished_projects(user_id=user_id)
         else:
             # Use authenticated user (backward compatible)
-            cur_user = request.user
-            user = BusinessUser.objects.get(auth_user=cur_user)
+            user = get_business_user(request)
             project_service = ProjectService()
             finished_projects = project_service.get_user_finished_projects(user=user)
         
@@ -250,8 +251,7 @@ def get_user_profile_stats(request):
             stats = project_service.get_user_profile_stats(user_id=user_id)
         else:
             # Use authenticated user (backward compatible)
-            cur_user = request.user
-            user = BusinessUser.objects.get(auth_user=cur_user)
+            user = get_business_user(request)
             project_service = ProjectService()
             stats = project_service.get_user_profile_stats(user=user)
         
@@ -295,8 +295,7 @@ def get_user_defeated_bosses(request):
             defeated_bosses = project_service.get_user_defeated_bosses(user_id=user_id)
         else:
             # Use authenticated user (backward compatible)
-            cur_user = request.user
-            user = BusinessUser.objects.get(auth_user=cur_user)
+            user = get_business_user(request)
             project_service = ProjectService()
             defeated_bosses = project_service.get_user_defeated_bosses(user=user)
         
@@ -13,11 +13,13 @@ from api.services.project_service import ProjectService
 from api.services.join_service import JoinService
 from api.serializers.project_serializer import ProjectSerializer, ProjectMemberSerializer
 from api.services.cache_service import CacheService
+from api.utils.etag import conditional_etag, tagged, tagged_response
 from api.domains.project import Project as ProjectDomain
 from django.utils import timezone
 from datetime import timedelta
 from api.models.Task import Task
 from api.models.ProjectMember import ProjectMember
+from api.cookie_authentication import get_business_user
 
 # -------------------------
 # Project CRUD
@@ -40,8 +42,7 @@ def create_project(request):
 
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         domain = ProjectService().create_project(request.data, user)
         serializer = ProjectSerializer(domain.project)
         CacheService().invalidate_user_projects(user.user_id)
@@ -77,8 +78,7 @@ def edit_project(request, project_id):
     """
     try:
         print("Editing project:", project_id, request.data)
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         domain = ProjectService().edit_project(project_id, request.data, user)
         serializer = ProjectSerializer(domain.project)
         CacheService().invalidate_user_projects(user.user_id)
@@ -132,8 +132,7 @@ def batch_delete_projects(request):
 
     # Deleting projects changes the current user's project list.
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         CacheService().invalidate_user_projects(user.user_id)
     except Exception:
         pass
@@ -157,8 +156,7 @@ def get_projects(request):
     """
     Retrieve all projects of the authenticated user.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     cache_svc = CacheService()
     cache_key = cache_svc.keys.user_projects(user.user_id)
     cached = cache_svc.get(cache_key)
@@ -196,8 +194,7 @@ def join_project(request):
             "project_id": UUID
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     project_id = request.data.get("project_id")
     res = ProjectService().join_project(project_id, user)
 
@@ -238,8 +235,7 @@ def leave_project(request):
             "project_id": UUID
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     project_id = request.data.get("project_id")
     is_left = ProjectService().leave_project(project_id, user)
     if is_left:
@@ -271,8 +267,7 @@ def batch_invite(request, project_id):
             "expires_in_days": 2                               (optional)
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
 
     project = ProjectModel.objects.get(project_id=project_id)
     if project.owner != user:
@@ -324,8 +319,7 @@ def accept_invite(request):
             "token": "string"
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
 
     token = request.data.get("token") or request.query_params.get("token")
     payload = JoinService().accept_invite(token, user=user)
@@ -362,8 +356,7 @@ def close_project(request):
             "project_id": UUID  
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
 
     project_id = request.data.get("project_id")
     domain = ProjectService().close_project(project_id, user)
@@ -380,8 +373,7 @@ def check_project_access(request, project_id):
     """
     Check if the authenticated user has access to the specified project.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     has_access = ProjectService().check_project_access(project_id, user)
     if has_access is None:
         return Response(
@@ -400,6 +392,7 @@ def check_project_access(request, project_id):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional_etag
 def get_all_project_members(request, project_id):
     """
     Retrieve all members of a specified project.
@@ -422,16 +415,15 @@ def get_all_project_members(request, project_id):
             members_data.append(metadata)
         return members_data
 
-    members_data = cache_svc.read_through(
+    entry = cache_svc.read_through(
         key=cache_svc.keys.project_members(project_id),
-        ttl_seconds=10,
-        loader=_load,
+        ttl_seconds=60,
+        soft_ttl_seconds=10,
+        single_flight=True,
+        loader=tagged(_load),
     )
 
-    return Response(
-        members_data,
-        status=status.HTTP_200_OK
-    )
+    return tagged_response(entry, status.HTTP_200_OK)
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
@@ -441,8 +433,7 @@ def deadline_continue(request, project_id):
     Only updates the deadline_decision field, does not apply score reduction.
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         project = ProjectModel.objects.get(project_id=project_id)
         
         # Check if user is a member of the project
@@ -505,8 +496,7 @@ def get_project_end_summary(request, project_id):
     """
     Get project end summary data including user scores, score reductions, and boss defeats.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
 
     project_service = ProjectService()
 
@@ -522,8 +512,7 @@ def get_estimate_finish_time(request, project_id):
     Returns estimated days to complete remaining tasks, or null if no tasks have been completed yet.
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         project = ProjectModel.objects.get(project_id=project_id)
         
         # Check if user is a member of the project
@@ -591,8 +580,7 @@ def get_dashboard(request, project_id):
     Get dashboard visualization data including task status counts, burn down chart data, and project details.
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         project = ProjectModel.objects.get(project_id=project_id)
         
         # Check if user is a member of the project
@@ -9,6 +9,7 @@ from api.models import BusinessUser
 from api.serializers.report_serializer import UserReportResponseSerializer
 from api.services.review_service import ReviewService
 from api.services.cache_service import CacheService
+from api.cookie_authentication import get_business_user
 
 
 @api_view(["POST"])
@@ -27,8 +28,7 @@ def review_report(request, project_id):
     Returns: created Report + computed signals/scores + applied effect decision.
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         report, user_report = ReviewService().create_review_report(request.data, user, project_id)
         CacheService().invalidate_project_logs(project_id)
         data = UserReportResponseSerializer(user_report, many=True).data
@@ -51,8 +51,7 @@ def get_all_review(request, project_id):
     Returns: list[UserReport] (nested Report/Task + reviewer/receiver briefs)
     """
     try:
-        cur_user = request.user
-        user = BusinessUser.objects.get(auth_user=cur_user)
+        user = get_business_user(request)
         user_reports = ReviewService().get_all_reviews(user, project_id)
         data = UserReportResponseSerializer(user_reports, many=True).data
         return Response(data, status=status.HTTP_200_OK)
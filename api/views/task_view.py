@@ -1,30 +1,34 @@
 # views/task.py
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import IsAuthenticated
 from api.services.task_service import TaskService
 from api.serializers.task_serializer import TaskRequestSerializer, TaskResponseSerializer
-from api.models import BusinessUser
 from api.services.cache_service import CacheService
+from api.utils.etag import conditional_etag, tagged, tagged_response
+from api.cookie_authentication import ClaimsJWTAuthentication, get_business_user
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@authentication_classes([ClaimsJWTAuthentication])
+@conditional_etag
 def task_list(request, project_id):
     """
     Retrieve all tasks for a specific project.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     cache_svc = CacheService()
-    data = cache_svc.read_through(
-        key=cache_svc.keys.project_tasks(project_id, user.user_id),
-        ttl_seconds=15,
-        loader=lambda: list(TaskResponseSerializer(task_service.get_all_tasks(), many=True).data),
+    entry = cache_svc.read_through(
+        key=cache_svc.project_tasks_key(project_id, user.user_id),
+        ttl_seconds=60,
+        soft_ttl_seconds=15,
+        single_flight=True,
+        loader=tagged(lambda: list(TaskResponseSerializer(task_service.get_all_tasks(), many=True).data)),
     )
-    return Response(data)
+    return tagged_response(entry)
 
 
 @api_view(['POST'])
@@ -44,8 +48,7 @@ def task_create(request, project_id):
     """
     print("requser:",request.data)
 
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     serializer = TaskRequestSerializer(data=request.data)
     if serializer.is_valid():
@@ -63,8 +66,7 @@ def task_detail(request, project_id, task_id):
     """
     Retrieve details of a specific task within a project.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     cache_svc = CacheService()
 
@@ -75,8 +77,11 @@ def task_detail(request, project_id, task_id):
         return dict(TaskResponseSerializer(task).data)
 
     data = cache_svc.read_through(
-        key=cache_svc.keys.task_detail(project_id, task_id, user.user_id),
+        key=cache_svc.task_detail_key(project_id, task_id, user.user_id),
         ttl_seconds=15,
+        # Clients keep polling deleted tasks; remember the 404 briefly. The key carries the
+        # project's task generation, so invalidate_project_tasks drops these entries too.
+        negative_ttl_seconds=5,
         loader=_load,
     )
 
@@ -97,8 +102,7 @@ def task_move(request, project_id, task_id):
             "status": string,
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     task = task_service.get_task(task_id)
 
@@ -128,8 +132,7 @@ def task_update(request, project_id, task_id):
             "status": string
         }
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     task = task_service.get_task(task_id)
 
@@ -152,8 +155,7 @@ def task_delete(request, project_id, task_id):
     """
     Delete a specific task from a project.
     """
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     if task_service.delete_task(task_id):
         CacheService().invalidate_project_tasks(project_id)
@@ -179,8 +181,7 @@ def task_assign(request, project_id, task_id):
     if not project_member_id:
         return Response({"error": "project_member_id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     try:
         user_task, created = task_service.assign_user_to_task(task_id, project_member_id)
@@ -210,8 +211,7 @@ def task_unassign(request, project_id, task_id):
     if not project_member_id:
         return Response({"error": "project_member_id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-    cur_user = request.user
-    user = BusinessUser.objects.get(auth_user=cur_user)
+    user = get_business_user(request)
     task_service = TaskService(project_id, user)
     try:
         if task_service.unassign_user_from_task(task_id, project_member_id):
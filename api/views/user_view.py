@@ -19,6 +19,7 @@ def get_all_business_users(request):
         key=cache_svc.keys.all_business_users(),
         ttl_seconds=60,
         loader=UserService().get_all_business_users,
+        local=True,
     )
 
     return Response(data, status=status.HTTP_200_OK)
@@ -3,9 +3,14 @@ set -eu
 
 python manage.py migrate
 
+# Threaded workers: each open event stream (logs/game/stream/) holds one of a worker's threads
+# for up to TASKLOG_STREAM_MAX_SECONDS, so at most TASKLOG_STREAM_MAX_PER_WORKER (default 8) of
+# the GUNICORN_THREADS are given to streams; keep it well below the thread count.
 exec gunicorn Backend.wsgi:application \
   --bind 0.0.0.0:8000 \
   --workers 3 \
+  --worker-class gthread \
+  --threads "${GUNICORN_THREADS:-16}" \
   --timeout 120
 
 
@@ -0,0 +1,115 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase
+from django.utils import timezone
+
+from api.domains.atomic_update import apply_delta
+from api.domains.boss import Boss as BossDomain
+from api.domains.project_member import ProjectMember as ProjectMemberDomain
+from api.domains.unit_of_work import save_fields, unit_of_work
+from api.models import BusinessUser, Project, ProjectBoss, ProjectMember
+
+
+class ApplyDeltaInMemoryTest(SimpleTestCase):
+    def test_unsaved_model_is_clamped_in_python(self):
+        model = SimpleNamespace(hp=10, max_hp=100, save=MagicMock())
+        self.assertEqual(apply_delta(model, "hp", -25, floor=0, ceiling="max_hp"), 0)
+        self.assertEqual(apply_delta(model, "hp", 500, floor=0, ceiling="max_hp"), 100)
+        model.save.assert_called_with(update_fields=["hp"])
+
+    def test_delta_is_rounded_to_whole_points(self):
+        model = SimpleNamespace(score=1, save=MagicMock())
+        self.assertEqual(apply_delta(model, "score", 2.6), 4)
+
+
+class AtomicDeltaDatabaseTest(TransactionTestCase):
+    def setUp(self):
+        owner = BusinessUser.objects.create(
+            auth_user=User.objects.create(username="owner"),
+            name="Owner",
+            username="owner",
+            email="owner@example.com",
+        )
+        self.project = Project.objects.create(owner=owner, project_name="P")
+        self.boss = ProjectBoss.objects.create(project=self.project, hp=1000, max_hp=1000)
+        self.member = ProjectMember.objects.create(project=self.project, user=owner, hp=50, max_hp=100, score=0)
+
+    def test_attacked_clamps_in_sql_and_refreshes_model(self):
+        boss = BossDomain(self.boss)
+        boss.attacked(1500)
+        self.assertEqual(boss.hp, 0)
+        self.boss.refresh_from_db()
+        self.assertEqual(self.boss.hp, 0)
+
+    def test_stale_instance_does_not_overwrite_concurrent_damage(self):
+        stale = ProjectBoss.objects.get(pk=self.boss.pk)
+        BossDomain(self.boss).attacked(100)
+        BossDomain(stale).attacked(50)
+        self.assertEqual(stale.hp, 850)
+        self.assertEqual(ProjectBoss.objects.get(pk=self.boss.pk).hp, 850)
+
+    def test_heal_clamps_at_max_hp_and_score_at_zero(self):
+        member = ProjectMemberDomain(self.member)
+        member.heal(80)
+        member.add_score(-5)
+        self.member.refresh_from_db()
+        self.assertEqual((self.member.hp, self.member.score), (100, 0))
+
+    def test_pending_setter_write_is_flushed_before_delta(self):
+        with unit_of_work():
+            self.member.hp = 20
+            save_fields(self.member, "hp")
+            ProjectMemberDomain(self.member).attacked(5)
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.hp, 15)
+
+    def test_only_one_stale_copy_kills_the_player(self):
+        first, second = (ProjectMemberDomain(ProjectMember.objects.get(pk=self.member.pk)) for _ in range(2))
+        first.attacked(60)
+        second.attacked(60)
+
+        self.assertEqual((first.die(), second.die()), (True, False))
+        self.assertEqual(second.status, "Dead")
+
+    def test_only_one_stale_copy_advances_the_phase(self):
+        ProjectBoss.objects.filter(pk=self.boss.pk).update(hp=0)
+        first, second, third = (BossDomain(ProjectBoss.objects.get(pk=self.boss.pk)) for _ in range(3))
+        now = timezone.now()
+
+        self.assertTrue(first.advance_phase(1, 500, now))
+        self.assertFalse(second.advance_phase(1, 500, now))
+        self.assertEqual((second.phase, second.hp), (2, 500))
+        # A blow that saw phase 1 at 0 HP must not kill the boss phase 2 just set up.
+        self.assertFalse(third.die())
+        self.assertEqual(ProjectBoss.objects.get(pk=self.boss.pk).status, "Alive")
+
+    def test_concurrent_attacks_do_not_lose_damage(self):
+        self._hammer()
+
+    def _hammer(self, threads=8, hits=25, damage=3):
+        errors = []
+        start = threading.Barrier(threads)
+
+        def worker():
+            try:
+                start.wait()
+                for _ in range(hits):
+                    # Each hit works off its own (stale) copy, like separate requests would.
+                    BossDomain(ProjectBoss.objects.get(pk=self.boss.pk)).attacked(damage)
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+            finally:
+                connection.close()
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(ProjectBoss.objects.get(pk=self.boss.pk).hp, 1000 - threads * hits * damage)
@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.contrib.admin.sites import AdminSite
+from django.test import SimpleTestCase, override_settings
+
+from api.admin import EffectAdmin
+from api.domains import catalog
+from api.domains.catalog import BAD, COMMON, EPIC, GOOD, RARE, Catalog
+from api.domains.review import Review
+from api.models.Effect import Effect
+
+
+def _effect(pk, polarity=GOOD, rare=None):
+    return SimpleNamespace(pk=pk, effect_polarity=polarity, rare_level=rare)
+
+
+def _item(pk, effect_id):
+    return SimpleNamespace(pk=pk, effects_id=effect_id)
+
+
+class CatalogTest(SimpleTestCase):
+    def test_buckets_match_review_rarity_rules(self):
+        effects = [
+            _effect("g1"),
+            _effect("g2", rare=2),
+            _effect("g3", rare=3),
+            _effect("b1", BAD, 1),
+            _effect("b3", BAD, 3),
+        ]
+        cat = Catalog(effects, [])
+
+        self.assertEqual([e.pk for e in cat.bucket(GOOD, COMMON)], ["g1"])
+        self.assertEqual([e.pk for e in cat.bucket(GOOD, RARE)], ["g2"])
+        self.assertEqual([e.pk for e in cat.bucket(GOOD, EPIC)], ["g3"])
+        self.assertEqual([e.pk for e in cat.bucket(BAD, COMMON)], ["b1"])
+        self.assertEqual([e.pk for e in cat.bucket(BAD, RARE)], ["b3"])
+        self.assertEqual(cat.bucket(BAD, EPIC), ())
+
+    def test_item_for_returns_first_item_per_effect(self):
+        cat = Catalog([], [_item("i1", "e1"), _item("i2", "e1"), _item("i3", "e2")])
+        self.assertEqual(cat.item_for(_effect("e1")).pk, "i1")
+        self.assertEqual(cat.item_for(_effect("e2")).pk, "i3")
+        self.assertIsNone(cat.item_for(_effect("e9")))
+        self.assertIsNone(cat.item_for(None))
+
+    def test_review_uses_catalog_buckets(self):
+        cat = Catalog([_effect("g1"), _effect("b1", BAD)], [])
+        with patch("api.domains.review.get_catalog", return_value=cat):
+            review = Review()
+            review._load_effects()
+        self.assertEqual([e.pk for e in review.good_common_effects], ["g1"])
+        self.assertEqual([e.pk for e in review.bad_common_effects], ["b1"])
+
+
+@override_settings(CATALOG_VERSION_CHECK_SECONDS=0, CATALOG_MAX_AGE_SECONDS=300)
+@patch("api.domains.catalog.cache")
+class CatalogCacheTest(SimpleTestCase):
+    def setUp(self):
+        catalog.reset_catalog()
+        self.addCleanup(catalog.reset_catalog)
+
+    def test_loaded_once_while_version_unchanged(self, mock_cache):
+        mock_cache.get.return_value = 3
+        with patch.object(Catalog, "load", side_effect=lambda version: Catalog([], [], version=version)) as load:
+            first = catalog.get_catalog()
+            second = catalog.get_catalog()
+
+        self.assertIs(first, second)
+        load.assert_called_once_with(version=3)
+
+    def test_reloads_when_version_moves(self, mock_cache):
+        mock_cache.get.side_effect = [1, 2]
+        with patch.object(Catalog, "load", side_effect=lambda version: Catalog([], [], version=version)) as load:
+            catalog.get_catalog()
+            self.assertEqual(catalog.get_catalog().version, 2)
+        self.assertEqual(load.call_count, 2)
+
+    def test_keeps_local_copy_when_redis_is_down(self, mock_cache):
+        mock_cache.get.side_effect = [1, ConnectionError("down")]
+        with patch.object(Catalog, "load", side_effect=lambda version: Catalog([], [], version=version)) as load:
+            catalog.get_catalog()
+            with self.assertLogs("api.domains.catalog", level="WARNING"):
+                self.assertEqual(catalog.get_catalog().version, 1)
+        load.assert_called_once()
+
+    def test_bump_increments_shared_version_and_drops_local_copy(self, mock_cache):
+        mock_cache.incr.side_effect = ValueError("missing")
+        mock_cache.add.return_value = True
+        with patch.object(catalog, "connection", MagicMock(in_atomic_block=False)), patch.object(
+            catalog, "reset_catalog"
+        ) as reset:
+            catalog.bump_catalog_version()
+
+        reset.assert_called_once_with()
+        mock_cache.add.assert_called_once_with(catalog.VERSION_KEY, 1, timeout=None)
+
+    def test_admin_save_bumps_version(self, mock_cache):
+        admin = EffectAdmin(Effect, AdminSite())
+        obj = MagicMock()
+        with patch("api.admin.bump_catalog_version") as bump:
+            admin.save_model(MagicMock(), obj, MagicMock(), True)
+        obj.save.assert_called_once_with()
+        bump.assert_called_once_with()
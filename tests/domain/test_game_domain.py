@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timedelta, timezone as dt_tz
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from django.test import SimpleTestCase
 
@@ -11,6 +11,7 @@ from api.domains.project_member import ProjectMember
 from api.domains.task import Task as TaskDomain
 
 PID = str(uuid.uuid4())
+NO_EFFECTS = {"select_related.return_value.filter.return_value": []}
 
 
 class GameDomainTest(SimpleTestCase):
@@ -71,6 +72,20 @@ class GameDomainTest(SimpleTestCase):
         with self.assertRaises(ValueError):
             game.player_revive("m1")
 
+    def test_construction_defers_members_and_review(self):
+        pd = MagicMock()
+        pd.project = SimpleNamespace(project_id=PID)
+        members = PropertyMock(return_value=["p1"])
+        type(pd.project_member_management).members = members
+        with patch("api.domains.game.Review") as review_cls:
+            game = Game(pd)
+            review_cls.assert_not_called()
+            members.assert_not_called()
+
+            self.assertEqual(game.players, ["p1"])
+            self.assertIs(game.review, game.review)
+        review_cls.assert_called_once_with()
+
     def test_boss_property_none_when_no_project_boss(self):
         pd = self._pd(self._player(), [])
         with patch("api.domains.game.ProjectBoss.objects") as pb:
@@ -120,7 +135,7 @@ class GameDomainTest(SimpleTestCase):
         now = created + timedelta(hours=12)
 
         with patch("api.domains.game.TaskLog.write"), patch(
-            "api.domains.project_member.UserEffect.objects.filter", return_value=[]
+            "api.domains.project_member.UserEffect.objects", **NO_EFFECTS
         ), patch("api.domains.game.timezone.now", return_value=now):
             game = Game(pd)
             game._boss = BossDomain(boss_inner)
@@ -208,13 +223,71 @@ class GameDomainTest(SimpleTestCase):
         with patch.object(TaskDomain, "get_assigned_members", return_value=[alive]), patch.object(
             TaskDomain, "is_completed", return_value=False
         ), patch("api.domains.game.TaskLog.write"), patch(
-            "api.domains.project_member.UserEffect.objects.filter", return_value=[]
+            "api.domains.project_member.UserEffect.objects", **NO_EFFECTS
         ):
             game = Game(pd)
             game._boss = BossDomain(boss_inner)
             out = game.boss_attack(task)
             self.assertEqual(out["task_id"], "t2")
 
+    def test_boss_attack_updates_project_member_list_objects(self):
+        member = self._player(mid="m1")
+        detached = self._player(mid="m1")
+        boss_inner = SimpleNamespace(
+            hp=10,
+            max_hp=10,
+            phase=1,
+            status="Alive",
+            updated_at=datetime.now(dt_tz.utc),
+            boss=SimpleNamespace(boss_type="normal"),
+            project_boss_id="pb",
+            save=lambda **_: None,
+        )
+        pd = self._pd(member, [])
+        task = TaskDomain(SimpleNamespace(task_id="t2", priority=2, status="open", save=lambda **_: None))
+
+        with patch.object(TaskDomain, "get_assigned_members", return_value=[detached]), patch(
+            "api.domains.game.TaskLog.write"
+        ), patch("api.domains.project_member.UserEffect.objects", **NO_EFFECTS):
+            game = Game(pd)
+            game._boss = BossDomain(boss_inner)
+            game.boss_attack(task)
+
+        self.assertEqual(member.hp, 80)
+        self.assertEqual(detached.hp, 100)
+
+    def test_boss_attack_loads_and_consumes_effects_in_batch(self):
+        m1, m2 = self._player(mid="m1"), self._player(mid="m2")
+        boss_inner = SimpleNamespace(
+            hp=10,
+            max_hp=10,
+            phase=1,
+            status="Alive",
+            updated_at=datetime.now(dt_tz.utc),
+            boss=SimpleNamespace(boss_type="normal"),
+            project_boss_id="pb",
+            save=lambda **_: None,
+        )
+        pd = self._pd(m1, [])
+        pd.project_member_management.get_member = {"m1": m1, "m2": m2}.get
+        task = TaskDomain(SimpleNamespace(task_id="t2", priority=2, status="open", save=lambda **_: None))
+        buff = SimpleNamespace(pk="e1", project_member_id="m1", effect=SimpleNamespace(effect_type="DEFENCE_BUFF", value=0.5))
+        debuff = SimpleNamespace(pk="e2", project_member_id="m2", effect=SimpleNamespace(effect_type="DEFENCE_DEBUFF", value=0.5))
+
+        with patch.object(TaskDomain, "get_assigned_members", return_value=[m1, m2]), patch(
+            "api.domains.game.TaskLog.write"
+        ), patch("api.domains.project_member.UserEffect.objects") as objects:
+            objects.select_related.return_value.filter.return_value = [buff, debuff]
+            game = Game(pd)
+            game._boss = BossDomain(boss_inner)
+            game.boss_attack(task)
+
+        objects.select_related.assert_called_once_with("effect")
+        objects.select_related.return_value.filter.assert_called_once()
+        objects.filter.assert_called_once_with(pk__in=["e1", "e2"])
+        objects.filter.return_value.delete.assert_called_once_with()
+        self.assertEqual((m1.hp, m2.hp), (90, 70))
+
     def test_player_heal(self):
         healer = self._player(mid="h1")
         target = self._player(mid="t1", hp=10, max_hp=100)
@@ -0,0 +1,75 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.domains.project import Project as ProjectDomain
+from api.models import Boss, BusinessUser, Project, ProjectBoss, ProjectMember
+
+
+class PhaseCounterTest(TransactionTestCase):
+    def setUp(self):
+        self.user = BusinessUser.objects.create(
+            auth_user=User.objects.create(username="owner"),
+            name="Owner",
+            username="owner",
+            email="owner@example.com",
+        )
+        self.project = Project.objects.create(owner=self.user, project_name="P")
+        ProjectMember.objects.create(project=self.project, user=self.user, hp=100, max_hp=100)
+        boss = Boss.objects.create(boss_name="B", boss_image="b.png")
+        self.boss = ProjectBoss.objects.create(project=self.project, boss=boss, hp=0, max_hp=1000)
+
+    def _counters(self):
+        return ProjectBoss.objects.filter(pk=self.boss.pk).values_list(
+            "added_tasks", "added_priority", "deleted_priority"
+        ).get()
+
+    def test_create_and_delete_task_maintain_counters(self):
+        tm = ProjectDomain(self.project).TaskManagement
+        first = tm.create_task({"task_name": "a", "priority": 3}, self.user)
+        tm.create_task({"task_name": "b", "priority": 2}, self.user)
+        tm.delete_task(first.task_id, self.user)
+
+        self.assertEqual(self._counters(), (2, 5, 3))
+
+    def test_counter_goes_to_latest_boss_only(self):
+        newer = ProjectBoss.objects.create(project=self.project, hp=10, max_hp=10)
+        ProjectDomain(self.project).TaskManagement.create_task({"task_name": "a", "priority": 4}, self.user)
+
+        self.assertEqual(self._counters(), (0, 0, 0))
+        self.assertEqual(ProjectBoss.objects.get(pk=newer.pk).added_priority, 4)
+
+    def test_next_phase_reads_counters_without_scanning_logs(self):
+        tm = ProjectDomain(self.project).TaskManagement
+        tm.create_task({"task_name": "a", "priority": 3}, self.user)
+        tm.create_task({"task_name": "b", "priority": 1}, self.user)
+
+        game = ProjectDomain(self.project).game
+        with CaptureQueriesContext(connection) as queries:
+            result = game.next_phase_boss_setup()
+
+        self.assertFalse(any("api_tasklog" in q["sql"] for q in queries))
+        self.assertEqual((result["added_priority"], result["net_priority_change"]), (4, 4))
+        self.assertEqual(result["to_phase"], 2)
+        self.assertEqual(self._counters(), (0, 0, 0))
+        self.assertIsNone(ProjectDomain(self.project).game.next_phase_boss_setup())
+
+    def test_changes_landing_after_read_carry_over(self):
+        ProjectDomain(self.project).TaskManagement.create_task({"task_name": "a", "priority": 3}, self.user)
+        game = ProjectDomain(self.project).game
+        game.boss  # loads the boss (and its counters) before the concurrent change
+
+        ProjectDomain(self.project).TaskManagement.create_task({"task_name": "b", "priority": 2}, self.user)
+        result = game.next_phase_boss_setup()
+
+        self.assertEqual(result["added_priority"], 3)
+        self.assertEqual(self._counters(), (1, 2, 0))
+
+    def test_no_phase_when_net_priority_not_positive(self):
+        tm = ProjectDomain(self.project).TaskManagement
+        task = tm.create_task({"task_name": "a", "priority": 2}, self.user)
+        tm.delete_task(task.task_id, self.user)
+
+        self.assertIsNone(ProjectDomain(self.project).game.next_phase_boss_setup())
+        self.assertEqual(self._counters(), (1, 2, 2))
@@ -25,6 +25,24 @@ class ProjectDomainTest(SimpleTestCase):
         mock_task_mgmt.assert_called_once_with(project_model)
         mock_game.assert_called_once_with(domain)
 
+    @patch("api.domains.project.Game")
+    @patch("api.domains.project.TaskManagement")
+    @patch("api.domains.project.ProjectMemberManagement")
+    def test_components_are_built_on_first_use_only(
+        self, mock_member_mgmt, mock_task_mgmt, mock_game
+    ):
+        domain = Project(object())
+
+        mock_member_mgmt.assert_not_called()
+        mock_task_mgmt.assert_not_called()
+        mock_game.assert_not_called()
+
+        member_mgmt = domain.project_member_management
+        self.assertIs(domain.project_member_management, member_mgmt)
+        mock_member_mgmt.assert_called_once()
+        mock_task_mgmt.assert_not_called()
+        mock_game.assert_not_called()
+
     def test_edit_project_metadata_updates_fields_and_saves(self):
         project_model = SimpleNamespace(
             project_name="Old",
@@ -1,7 +1,7 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
 from api.domains.project_member import ProjectMember as ProjectMemberDomain
 from api.domains.project_member_management import ProjectMemberManagement
@@ -33,6 +33,7 @@ class ProjectMemberManagementDomainTest(SimpleTestCase):
         self.assertEqual(len(first), 1)
         self.assertEqual(str(first[0].project_member_id), "abc-123")
 
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=0)
     @patch("api.domains.project_member_management.ProjectMemberModel.objects.create")
     def test_add_member_creates_alive_member_and_clears_cache(self, mock_create):
         member_model = SimpleNamespace(
@@ -130,9 +131,10 @@ class ProjectMemberManagementDomainTest(SimpleTestCase):
 
         self.assertIsNone(pmm.edit_member("missing-id", {"hp": 80}))
 
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=0)
     def test_remove_member_deletes_matching_member(self):
         deleted = []
-        member = SimpleNamespace(id="member-1", delete=lambda: deleted.append(True))
+        member = SimpleNamespace(project_member_id="member-1", delete=lambda: deleted.append(True))
         pmm = ProjectMemberManagement.__new__(ProjectMemberManagement)
         pmm.project = object()
         pmm._members = [member]
@@ -151,3 +153,59 @@ class ProjectMemberManagementDomainTest(SimpleTestCase):
 
         self.assertTrue(pmm.is_member(user))
         self.assertFalse(pmm.is_member(object()))
+
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=0)
+    @patch("api.domains.project_member_management.ProjectMemberModel.objects.filter")
+    def test_is_member_uses_exists_query_when_members_not_loaded(self, mock_filter):
+        mock_filter.return_value.exists.return_value = True
+        project = object()
+        pmm = ProjectMemberManagement(project)
+
+        self.assertTrue(pmm.is_member(SimpleNamespace(pk="u1")))
+
+        mock_filter.assert_called_once_with(project=project, user_id="u1")
+        self.assertIsNone(pmm._members)
+
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=60)
+    @patch("api.services.cache_service.CacheService")
+    @patch("api.domains.project_member_management.ProjectMemberModel.objects.filter")
+    def test_is_member_loads_and_caches_member_id_set(self, mock_filter, mock_cache_cls):
+        cache_svc = mock_cache_cls.return_value
+        cache_svc.keys.project_member_ids.return_value = "k"
+        cache_svc.get.return_value = None
+        mock_filter.return_value.values_list.return_value = ["u1", "u2"]
+        pmm = ProjectMemberManagement(SimpleNamespace(pk="p1"))
+
+        self.assertTrue(pmm.is_member(SimpleNamespace(pk="u2")))
+        cache_svc.set.assert_called_once_with("k", frozenset({"u1", "u2"}), ttl_seconds=60)
+
+        cache_svc.get.return_value = frozenset({"u1"})
+        self.assertFalse(pmm.is_member(SimpleNamespace(pk="u2")))
+        mock_filter.assert_called_once()
+
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=60)
+    @patch("api.services.cache_service.CacheService")
+    @patch("api.domains.project_member_management.ProjectMemberModel.objects.filter")
+    def test_is_member_falls_back_to_exists_when_cache_is_down(self, mock_filter, mock_cache_cls):
+        mock_cache_cls.return_value.get.side_effect = ConnectionError("down")
+        mock_filter.return_value.exists.return_value = False
+        pmm = ProjectMemberManagement(SimpleNamespace(pk="p1"))
+
+        with self.assertLogs("api.domains.project_member_management", level="WARNING"):
+            self.assertFalse(pmm.is_member(SimpleNamespace(pk="u1")))
+        mock_filter.return_value.exists.assert_called_once_with()
+
+    @override_settings(PROJECT_MEMBER_CACHE_SECONDS=60)
+    @patch("api.services.cache_service.CacheService")
+    @patch("api.domains.project_member_management.ProjectMemberModel.objects.create")
+    def test_add_and_remove_member_invalidate_member_id_set(self, mock_create, mock_cache_cls):
+        cache_svc = mock_cache_cls.return_value
+        cache_svc.keys.project_member_ids.return_value = "k"
+        mock_create.return_value = SimpleNamespace(project_member_id="m1", delete=lambda: None)
+        pmm = ProjectMemberManagement(SimpleNamespace(pk="p1"))
+
+        pmm.add_member(object())
+        pmm._members = [ProjectMemberDomain(mock_create.return_value)]
+        pmm.remove_member("m1")
+
+        self.assertEqual(cache_svc.delete.call_args_list, [(("k",),), (("k",),)])
@@ -0,0 +1,142 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from api.domains.boss import Boss as BossDomain
+from api.domains.game import Game
+from api.domains.project_member import ProjectMember
+from api.domains.task import Task as TaskDomain
+from api.domains.unit_of_work import save_fields, unit_of_work
+
+PID = str(uuid.uuid4())
+
+
+def _model(**kwargs):
+    return SimpleNamespace(save=MagicMock(), **kwargs)
+
+
+class UnitOfWorkTest(SimpleTestCase):
+    def test_save_fields_outside_unit_of_work_saves_immediately(self):
+        m = _model()
+        save_fields(m, "hp")
+        m.save.assert_called_once_with(update_fields=["hp"])
+
+    def test_writes_are_coalesced_into_one_save_per_row(self):
+        a, b = _model(), _model()
+        with unit_of_work() as uow:
+            save_fields(a, "hp")
+            save_fields(a, "status", "hp")
+            save_fields(b, "score")
+            self.assertEqual(uow.dirty_fields(a), {"hp", "status"})
+            a.save.assert_not_called()
+        a.save.assert_called_once_with(update_fields=["hp", "status"])
+        b.save.assert_called_once_with(update_fields=["score"])
+
+    def test_nested_blocks_flush_once_at_outermost_exit(self):
+        m = _model()
+        with unit_of_work() as outer:
+            with unit_of_work() as inner:
+                self.assertIs(inner, outer)
+                save_fields(m, "hp")
+            m.save.assert_not_called()
+            save_fields(m, "score")
+        m.save.assert_called_once_with(update_fields=["hp", "score"])
+
+    def test_exception_discards_pending_writes(self):
+        m = _model()
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                save_fields(m, "hp")
+                raise ValueError("boom")
+        m.save.assert_not_called()
+        save_fields(m, "hp")
+        m.save.assert_called_once_with(update_fields=["hp"])
+
+    def test_usable_as_decorator(self):
+        m = _model()
+
+        @unit_of_work()
+        def op():
+            save_fields(m, "hp")
+            save_fields(m, "status")
+
+        op()
+        m.save.assert_called_once_with(update_fields=["hp", "status"])
+
+
+class DomainSaveCountTest(SimpleTestCase):
+    """One UPDATE per touched row for each domain operation."""
+
+    def _member(self, mid="m1", **kwargs):
+        defaults = dict(
+            hp=100,
+            max_hp=100,
+            score=0,
+            status="Alive",
+            project_member_id=mid,
+            user=SimpleNamespace(username="u", user_id="uid1", name="N"),
+            project=MagicMock(),
+        )
+        defaults.update(kwargs)
+        model = _model(**defaults)
+        return model, ProjectMember(model)
+
+    def _game(self, *players):
+        by_id = {p.project_member_id: p for p in players}
+        pd = MagicMock()
+        pd.project = SimpleNamespace(project_id=PID)
+        pd.project_member_management = MagicMock()
+        pd.project_member_management.members = list(players)
+        pd.project_member_management.get_member = by_id.get
+        return Game(pd)
+
+    def test_player_revive_issues_single_update(self):
+        model, player = self._member(hp=0, score=100, status="Dead")
+        game = self._game(player)
+
+        with patch("api.domains.game.TaskLog.write"):
+            game.player_revive("m1")
+
+        model.save.assert_called_once_with(update_fields=["hp", "score", "status"])
+
+    def test_player_heal_issues_single_update(self):
+        model, player = self._member(hp=40)
+        healer_model, healer = self._member("m2")
+        game = self._game(player, healer)
+
+        with patch("api.domains.game.TaskLog.write"):
+            game.player_heal("m2", "m1", 10)
+
+        model.save.assert_called_once_with(update_fields=["hp"])
+        healer_model.save.assert_not_called()
+
+    def test_member_die_issues_single_update(self):
+        model, player = self._member()
+        player.die()
+        model.save.assert_called_once_with(update_fields=["hp", "status"])
+
+    def test_boss_die_issues_single_update(self):
+        model = _model(hp=50, max_hp=100, status="Alive", phase=1)
+        BossDomain(model).die()
+        model.save.assert_called_once_with(update_fields=["hp", "status"])
+
+    def test_boss_attacked_then_die_coalesce(self):
+        model = _model(hp=10, max_hp=100, status="Alive", phase=1)
+        boss = BossDomain(model)
+        with unit_of_work():
+            boss.attacked(30)
+            if boss.hp <= 0:
+                boss.die()
+        model.save.assert_called_once_with(update_fields=["hp", "status"])
+
+    def test_task_edit_setters_issue_single_update(self):
+        model = _model(priority=1, task_name="a", description="", status="todo", deadline=None)
+        task = TaskDomain(model)
+        with unit_of_work():
+            task.priority = 3
+            task.task_name = "b"
+            task.description = "d"
+            task.status = "doing"
+        model.save.assert_called_once_with(update_fields=["description", "priority", "status", "task_name"])
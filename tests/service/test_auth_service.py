@@ -1,8 +1,17 @@
+import time
 from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
 
-from api.services.auth_service import login_user
+from api.services.auth_service import (
+    BUSINESS_USER_ID_CLAIM,
+    is_token_revoked,
+    login_user,
+    revoke_token,
+    revoke_user_tokens,
+)
+from api.services.cache_service import CacheKeys
 
 
 class AuthServiceTest(SimpleTestCase):
@@ -33,3 +42,84 @@ class AuthServiceTest(SimpleTestCase):
             tokens,
             {"access": "access-jwt", "refresh": "refresh-jwt"},
         )
+        mock_refresh.__setitem__.assert_called_once_with(
+            BUSINESS_USER_ID_CLAIM, str(mock_user.business_profile.pk)
+        )
+
+    @patch("api.services.auth_service.CacheService")
+    def test_revoke_token_lists_jti_until_expiry(self, mock_cache_cls):
+        cache_svc = mock_cache_cls.return_value
+        cache_svc.keys.revoked_token.return_value = "k"
+
+        revoke_token({"jti": "j1", "exp": time.time() + 600})
+
+        cache_svc.keys.revoked_token.assert_called_once_with("j1")
+        key, value = cache_svc.set.call_args.args
+        self.assertEqual((key, value), ("k", 1))
+        self.assertAlmostEqual(cache_svc.set.call_args.kwargs["ttl_seconds"], 600, delta=2)
+
+    @patch("api.services.auth_service.CacheService")
+    def test_revoke_skips_expired_token(self, mock_cache_cls):
+        revoke_token({"jti": "j1", "exp": time.time() - 5})
+        mock_cache_cls.return_value.set.assert_not_called()
+
+    @patch("api.services.auth_service.CacheService")
+    def test_is_token_revoked_reports_unknown_when_cache_down(self, mock_cache_cls):
+        mock_cache_cls.return_value.keys = keys = CacheKeys()
+        mock_cache_cls.return_value.get_many.side_effect = ConnectionError("down")
+        with self.assertLogs("api.services.auth_service", level="WARNING"):
+            self.assertIsNone(is_token_revoked({"jti": "j1"}))
+
+        mock_cache_cls.return_value.get_many.side_effect = None
+        mock_cache_cls.return_value.get_many.return_value = {keys.revoked_token("j1"): 1}
+        self.assertTrue(is_token_revoked({"jti": "j1"}))
+
+    @patch("api.services.auth_service.CacheService")
+    def test_tokens_issued_before_user_revocation_are_rejected_in_one_lookup(self, mock_cache_cls):
+        cache_svc = mock_cache_cls.return_value
+        cache_svc.keys = keys = CacheKeys()
+        cache_svc.get_many.return_value = {keys.tokens_revoked_before(7): 1000}
+
+        self.assertTrue(is_token_revoked({"jti": "j1", "user_id": 7, "iat": 999}))
+        self.assertFalse(is_token_revoked({"jti": "j2", "user_id": 7, "iat": 1000}))
+        cache_svc.get_many.assert_called_with([keys.revoked_token("j2"), keys.tokens_revoked_before(7)])
+        self.assertEqual(cache_svc.get_many.call_count, 2)
+
+    @patch("api.services.auth_service.CacheService")
+    def test_revoke_user_tokens_records_now_for_a_refresh_lifetime(self, mock_cache_cls):
+        cache_svc = mock_cache_cls.return_value
+        cache_svc.keys = keys = CacheKeys()
+
+        revoke_user_tokens(7)
+
+        key, value = cache_svc.set.call_args.args
+        self.assertEqual(key, keys.tokens_revoked_before(7))
+        self.assertAlmostEqual(value, time.time(), delta=2)
+        self.assertEqual(cache_svc.set.call_args.kwargs["ttl_seconds"], 7 * 24 * 3600)
+
+
+@patch("api.signals.revoke_user_tokens")
+class RevokeOnCredentialChangeTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="u1", password="old")
+
+    def _save(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(**kwargs)
+
+    def test_password_change_revokes(self, revoke):
+        self.user.set_password("new")
+        self._save()
+        revoke.assert_called_once_with(self.user.pk)
+
+    def test_deactivation_revokes(self, revoke):
+        self.user.is_active = False
+        self._save(update_fields=["is_active"])
+        revoke.assert_called_once_with(self.user.pk)
+
+    def test_other_saves_do_not_revoke(self, revoke):
+        self.user.first_name = "U"
+        self._save()
+        self._save(update_fields=["last_login"])
+        User.objects.create_user(username="u2", password="pw")
+        revoke.assert_not_called()
@@ -0,0 +1,93 @@
+import io
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from api.services import cache_codec
+from api.services.cache_service import CacheService, _SoftEntry
+
+
+class CacheCodecTest(SimpleTestCase):
+    def test_json_round_trips_tagged_types(self):
+        value = {
+            "created_at": datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc),
+            "id": uuid.UUID("12345678123456781234567812345678"),
+            "amount": Decimal("1.50"),
+            "rows": [1, "a", None, True],
+        }
+        raw = cache_codec.encode(cache_codec.CODECS["json"], value)
+        self.assertTrue(cache_codec.is_encoded(raw))
+        self.assertEqual(cache_codec.decode(raw), (value, None))
+
+    def test_msgpack_is_installed_and_round_trips_tagged_types(self):
+        codec = cache_codec.CODECS["msgpack"]
+        self.assertIsInstance(codec, cache_codec.MsgpackCodec)
+        value = {
+            "created_at": datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc),
+            "id": uuid.UUID("12345678123456781234567812345678"),
+            "amount": Decimal("1.50"),
+            "rows": [1, "a", None, True, b"\x00"],
+        }
+        raw = cache_codec.encode(codec, value)
+        self.assertEqual(raw[3], codec.ident)
+        self.assertEqual(cache_codec.decode(raw), (value, None))
+
+    def test_log_and_task_families_use_msgpack(self):
+        for key in ("workquest:log:project_game_logs:p", "workquest:task:project_tasks:p:g1:u"):
+            self.assertEqual(cache_codec.codec_for(key).name, "msgpack")
+
+    @override_settings(CACHE_COMPRESS_MIN_BYTES=64)
+    def test_large_bodies_are_compressed(self):
+        value = [{"event_type": "USER_ATTACK", "damage": 10}] * 50
+        raw = cache_codec.encode(cache_codec.CODECS["json"], value)
+        self.assertTrue(raw[4] & cache_codec.FLAG_ZLIB)
+        self.assertLess(len(raw), len(cache_codec.CODECS["json"].dumps(value)))
+        self.assertEqual(cache_codec.decode(raw)[0], value)
+
+    def test_soft_envelope_round_trips(self):
+        raw = cache_codec.encode(cache_codec.CODECS["pickle"], {"a": 1}, soft=(123.5, 0.25))
+        self.assertEqual(cache_codec.decode(raw), ({"a": 1}, (123.5, 0.25)))
+
+    def test_unsupported_value_falls_back_to_pickle(self):
+        raw = cache_codec.encode(cache_codec.CODECS["json"], {"s": {1, 2}})
+        self.assertEqual(raw[3], cache_codec.CODECS["pickle"].ident)
+        self.assertEqual(cache_codec.decode(raw)[0], {"s": {1, 2}})
+
+    def test_unknown_codec_id_raises(self):
+        with self.assertRaises(cache_codec.CodecError):
+            cache_codec.decode(cache_codec.MAGIC + bytes((99, 0)) + b"x")
+
+    @override_settings(CACHE_CODECS={"log": "json", "task:task_detail": "pickle"}, CACHE_DEFAULT_CODEC="raw")
+    def test_codec_for_uses_family_then_prefix_then_default(self):
+        self.assertEqual(cache_codec.codec_for("workquest:task:task_detail:p:t:u").name, "pickle")
+        self.assertEqual(cache_codec.codec_for("workquest:log:project_game_logs:p").name, "json")
+        self.assertIsNone(cache_codec.codec_for("workquest:user:me:1"))
+
+    @override_settings(CACHE_CODECS={"log": "json"}, CACHE_COMPRESS_MIN_BYTES=1)
+    @patch("api.services.cache_service.cache")
+    def test_cache_service_stores_encoded_soft_entries(self, mock_cache):
+        store = {}
+        mock_cache.set.side_effect = lambda k, v, timeout=None: store.__setitem__(k, v)
+        mock_cache.get.side_effect = lambda k: store.get(k)
+        key = "workquest:log:project_game_logs:p1"
+
+        CacheService._store(key, _SoftEntry(value=[{"id": "1"}], soft_expires_at=99.0, compute_seconds=0.5), 30)
+
+        self.assertTrue(cache_codec.is_encoded(store[key]))
+        self.assertEqual(CacheService._fetch(key), _SoftEntry(value=[{"id": "1"}], soft_expires_at=99.0, compute_seconds=0.5))
+
+    @patch("api.services.cache_service.cache")
+    def test_undecodable_entry_is_a_miss(self, mock_cache):
+        mock_cache.get.return_value = cache_codec.MAGIC + bytes((99, 0)) + b"x"
+        with self.assertLogs("api.services.cache_service", level="WARNING"):
+            self.assertIsNone(CacheService._fetch("workquest:log:project_game_logs:p1"))
+
+    def test_benchmark_command_reports_each_codec(self):
+        out = io.StringIO()
+        call_command("cache_codec_bench", logs=5, iterations=1, stdout=out)
+        self.assertIn("pickle (current)", out.getvalue())
+        self.assertIn("json+compress", out.getvalue())
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services.cache_metrics import CacheMetrics, key_family
+from api.services.cache_service import CacheService
+
+
+class CacheMetricsTest(SimpleTestCase):
+    def test_key_family_drops_ids_and_generation(self):
+        self.assertEqual(key_family("workquest:task:project_tasks:p1:g3:u1"), "task:project_tasks")
+        self.assertEqual(key_family("workquest:user:*"), "user:*")
+        self.assertEqual(key_family("plain"), "plain")
+
+    def test_flush_pipelines_counters_per_family(self):
+        metrics = CacheMetrics(flush_seconds=3600)
+        metrics.record_hit("workquest:task:detail:p1:t1")
+        metrics.record_hit("workquest:task:detail:p1:t2", l1=True)
+        metrics.record_miss("workquest:task:detail:p1:t3")
+        metrics.record_load("workquest:task:detail:p1:t3", 0.25)
+
+        conn = MagicMock()
+        pipe = conn.pipeline.return_value
+        with patch("django_redis.get_redis_connection", return_value=conn):
+            metrics.flush()
+
+        pipe.sadd.assert_called_once_with("workquest:metrics:cache:families", "task:detail")
+        ints = {c.args[1]: c.args[2] for c in pipe.hincrby.call_args_list}
+        self.assertEqual(ints, {"hits": 2, "l1_hits": 1, "misses": 1, "loads": 1})
+        pipe.hincrbyfloat.assert_called_once_with("workquest:metrics:cache:family:task:detail", "loader_seconds", 0.25)
+        pipe.execute.assert_called_once()
+
+    def test_flush_failure_is_swallowed(self):
+        metrics = CacheMetrics(flush_seconds=3600)
+        metrics.record_miss("workquest:user:1")
+        with patch("django_redis.get_redis_connection", side_effect=RuntimeError("down")):
+            with self.assertLogs("api.services.cache_metrics", level="WARNING"):
+                metrics.flush()
+        self.assertEqual(metrics._take_pending(), {})
+
+    @override_settings(CACHE_METRICS_ENABLED=False)
+    def test_disabled_records_nothing(self):
+        metrics = CacheMetrics(flush_seconds=3600)
+        metrics.record_hit("workquest:user:1")
+        metrics.record_payload("workquest:user:1", {"a": 1})
+        self.assertEqual(metrics._take_pending(), {})
+
+    @override_settings(CACHE_METRICS_PAYLOAD_SAMPLE_RATE=0)
+    def test_unsized_payload_is_not_pickled_unless_sampled(self):
+        metrics = CacheMetrics(flush_seconds=3600)
+        with patch("api.services.cache_metrics.payload_size") as size:
+            metrics.record_payload("workquest:user:1", {"a": 1})
+            metrics.record_payload("workquest:user:1", {"a": 1}, size=40)
+        size.assert_not_called()
+        fields = metrics._take_pending()["user:1"]
+        self.assertEqual((fields["payload_writes"], fields["payload_sized"], fields["payload_bytes"]), (2, 1, 40))
+
+    @override_settings(CACHE_METRICS_PAYLOAD_SAMPLE_RATE=1)
+    def test_sampled_payload_is_measured(self):
+        metrics = CacheMetrics(flush_seconds=3600)
+        metrics.record_payload("workquest:user:1", {"a": 1})
+        self.assertEqual(metrics._take_pending()["user:1"]["payload_sized"], 1)
+
+    def test_derive_computes_ratios(self):
+        out = CacheMetrics._derive(
+            {
+                "hits": 3,
+                "misses": 1,
+                "loads": 2,
+                "loader_seconds": 0.5,
+                "payload_writes": 5,
+                "payload_sized": 2,
+                "payload_bytes": 100,
+            }
+        )
+        self.assertEqual(out["hit_ratio"], 0.75)
+        self.assertEqual(out["avg_loader_ms"], 250.0)
+        self.assertEqual(out["avg_payload_bytes"], 50.0)
+        self.assertIsNone(CacheMetrics._derive({})["hit_ratio"])
+
+    @patch("api.services.cache_service.cache_metrics")
+    @patch("api.services.cache_service.cache")
+    def test_read_through_records_miss_load_then_hit(self, mock_cache, mock_metrics):
+        mock_cache.get.return_value = None
+        CacheService().read_through(key="workquest:user:1", ttl_seconds=10, loader=lambda: {"x": 1})
+        mock_metrics.record_miss.assert_called_once_with("workquest:user:1")
+        mock_metrics.record_load.assert_called_once()
+        mock_metrics.record_payload.assert_called_once_with("workquest:user:1", {"x": 1})
+
+        mock_cache.get.return_value = {"x": 1}
+        CacheService().read_through(key="workquest:user:1", ttl_seconds=10, loader=lambda: {"x": 2})
+        mock_metrics.record_hit.assert_called_once_with("workquest:user:1")
+
+    @patch("api.services.cache_service.cache_metrics")
+    @patch("api.services.cache_service.cache")
+    def test_delete_pattern_records_deleted_count(self, mock_cache, mock_metrics):
+        mock_cache.delete_pattern.return_value = 4
+        self.assertEqual(CacheService().delete_pattern("workquest:user:*"), 4)
+        mock_metrics.record_pattern_delete.assert_called_once_with("workquest:user:*", 4)
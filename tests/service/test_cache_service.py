@@ -1,8 +1,11 @@
+import time
 from unittest.mock import MagicMock, patch
 
 from django.test import SimpleTestCase
 
-from api.services.cache_service import CacheKeys, CacheService
+from api.services.cache_service import CacheKeys, CacheService, _NegativeEntry, _SoftEntry
+from api.services.local_cache import LocalCache
+from api.utils.etag import tag
 
 
 class CacheServiceTest(SimpleTestCase):
@@ -35,6 +38,14 @@ class CacheServiceTest(SimpleTestCase):
         svc.delete_many(["a", "b"])
         mock_cache.delete_many.assert_called_once_with(["a", "b"])
 
+    @patch("api.services.cache_service.cache")
+    def test_get_many_is_one_call_and_omits_misses(self, mock_cache):
+        mock_cache.get_many.return_value = {"a": 1}
+
+        self.assertEqual(CacheService().get_many(["a", "b"]), {"a": 1})
+        mock_cache.get_many.assert_called_once_with(["a", "b"])
+        mock_cache.get.assert_not_called()
+
     @patch("api.services.cache_service.cache")
     def test_delete_pattern_uses_backend_deleter(self, mock_cache):
         mock_cache.delete_pattern = MagicMock(return_value=3)
@@ -82,3 +93,259 @@ class CacheServiceTest(SimpleTestCase):
         svc.invalidate_project_tasks("pid")
         svc.invalidate_all_business_users()
         self.assertTrue(mock_cache.delete.called or mock_cache.delete_many.called)
+
+    @patch("api.services.cache_service.cache")
+    def test_invalidate_project_tasks_bumps_generation_without_scan(self, mock_cache):
+        mock_cache.incr.return_value = 4
+        mock_cache.delete_pattern = MagicMock()
+        svc = CacheService()
+
+        svc.invalidate_project_tasks("pid")
+
+        mock_cache.incr.assert_called_once_with(svc.keys.project_generation("pid", CacheKeys.GEN_TASKS))
+        mock_cache.delete_pattern.assert_not_called()
+
+    @patch("api.services.cache_service.cache")
+    def test_project_game_logs_key_versions_only_the_head_page(self, mock_cache):
+        mock_cache.get.return_value = 7
+        svc = CacheService()
+
+        older = svc.project_game_logs_key("pid", limit=100, cursor="abc")
+        mock_cache.get.assert_not_called()
+        head = svc.project_game_logs_key("pid", limit=100)
+
+        self.assertIn(":g7:", head)
+        self.assertNotIn(":g7:", older)
+        self.assertTrue(older.endswith(":pid:100:abc"))
+        mock_cache.get.assert_called_once_with(svc.keys.project_generation("pid", CacheKeys.GEN_LOGS))
+
+    @patch("api.services.cache_service.cache")
+    def test_bump_generation_initializes_missing_counter(self, mock_cache):
+        mock_cache.incr.side_effect = ValueError("missing")
+        mock_cache.add.return_value = True
+
+        self.assertEqual(CacheService().bump_generation("g"), 1)
+        mock_cache.add.assert_called_once_with("g", 1, timeout=None)
+
+    @patch("api.services.cache_service.cache")
+    def test_versioned_keys_embed_current_generation(self, mock_cache):
+        svc = CacheService(keys=CacheKeys(namespace="ns"))
+        mock_cache.get.return_value = None
+        self.assertEqual(svc.project_tasks_key("p", "u"), "ns:task:project_tasks:p:g0:u")
+
+        mock_cache.get.return_value = 7
+        self.assertEqual(svc.task_detail_key("p", "t", "u"), "ns:task:task_detail:p:g7:t:u")
+        self.assertEqual(svc.project_member_items_key("p", "m"), "ns:game:project_member:items:p:g7:m")
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_soft_ttl_fresh_entry_skips_loader(self, mock_cache):
+        loader = MagicMock()
+        mock_cache.get.return_value = _SoftEntry(value={"v": 1}, soft_expires_at=time.time() + 60, compute_seconds=0.0)
+
+        out = CacheService().read_through(key="k", ttl_seconds=60, soft_ttl_seconds=5, single_flight=True, loader=loader)
+
+        self.assertEqual(out, {"v": 1})
+        loader.assert_not_called()
+        mock_cache.add.assert_not_called()
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_stale_entry_served_while_other_worker_refreshes(self, mock_cache):
+        loader = MagicMock()
+        mock_cache.get.return_value = _SoftEntry(value="old", soft_expires_at=time.time() - 1, compute_seconds=0.1)
+        mock_cache.add.return_value = False  # lock held elsewhere
+
+        out = CacheService().read_through(key="k", ttl_seconds=60, soft_ttl_seconds=5, single_flight=True, loader=loader)
+
+        self.assertEqual(out, "old")
+        loader.assert_not_called()
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_lock_holder_refreshes_and_releases(self, mock_cache):
+        mock_cache.get.return_value = _SoftEntry(value="old", soft_expires_at=time.time() - 1, compute_seconds=0.1)
+        mock_cache.add.return_value = True
+
+        out = CacheService().read_through(key="k", ttl_seconds=60, soft_ttl_seconds=5, single_flight=True, loader=lambda: "new")
+
+        self.assertEqual(out, "new")
+        stored_key, stored = mock_cache.set.call_args.args
+        self.assertEqual(stored_key, "k")
+        self.assertIsInstance(stored, _SoftEntry)
+        self.assertEqual(stored.value, "new")
+        self.assertEqual(mock_cache.set.call_args.kwargs, {"timeout": 60})
+        lock_key = mock_cache.add.call_args.args[0]
+        self.assertEqual(lock_key, "k:lock")
+
+    @patch("api.services.cache_service.time.sleep")
+    @patch("api.services.cache_service.cache")
+    def test_read_through_cold_miss_follower_waits_for_leader(self, mock_cache, _sleep):
+        loader = MagicMock()
+        leader_entry = _SoftEntry(value="fresh", soft_expires_at=time.time() + 5, compute_seconds=0.0)
+        mock_cache.get.side_effect = [None, leader_entry]
+        mock_cache.add.return_value = False
+
+        out = CacheService().read_through(key="k", ttl_seconds=60, soft_ttl_seconds=5, single_flight=True, loader=loader)
+
+        self.assertEqual(out, "fresh")
+        loader.assert_not_called()
+
+    @patch("api.services.cache_service.random.random", return_value=0.999999)
+    def test_early_refresh_probability_grows_with_compute_cost(self, _rand):
+        near_expiry = _SoftEntry(value=1, soft_expires_at=time.time() + 1, compute_seconds=0.5)
+        self.assertTrue(CacheService._needs_refresh(near_expiry, beta=1.0))
+        self.assertFalse(CacheService._needs_refresh(near_expiry, beta=0.0))
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_caches_none_as_negative_entry(self, mock_cache):
+        mock_cache.get.return_value = None
+
+        out = CacheService().read_through(key="k", ttl_seconds=15, negative_ttl_seconds=5, loader=lambda: None)
+
+        self.assertIsNone(out)
+        mock_cache.set.assert_called_once_with("k", _NegativeEntry(), timeout=5)
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_negative_hit_skips_loader(self, mock_cache):
+        loader = MagicMock()
+        mock_cache.get.return_value = _NegativeEntry()
+
+        self.assertIsNone(CacheService().read_through(key="k", ttl_seconds=15, negative_ttl_seconds=5, loader=loader))
+        loader.assert_not_called()
+
+    @patch("api.services.cache_service.cache")
+    def test_read_through_none_not_cached_without_negative_ttl(self, mock_cache):
+        mock_cache.get.return_value = None
+
+        self.assertIsNone(CacheService().read_through(key="k", ttl_seconds=15, loader=lambda: None))
+        mock_cache.set.assert_not_called()
+
+    @patch("api.services.cache_service.l1")
+    @patch("api.services.cache_service.cache")
+    def test_read_through_local_hit_skips_redis(self, mock_cache, mock_l1):
+        local = LocalCache(max_entries=10, ttl_seconds=30)
+        local.set("k", ["hot"])
+        mock_l1.get_local_cache.return_value = local
+        mock_l1.MISS = object()
+
+        self.assertEqual(CacheService().read_through(key="k", ttl_seconds=60, loader=MagicMock(), local=True), ["hot"])
+        mock_cache.get.assert_not_called()
+
+    @patch("api.services.cache_service.l1")
+    @patch("api.services.cache_service.cache")
+    def test_read_through_local_miss_populates_l1(self, mock_cache, mock_l1):
+        from api.services.local_cache import MISS
+
+        local = LocalCache(max_entries=10, ttl_seconds=30)
+        mock_l1.get_local_cache.return_value = local
+        mock_l1.MISS = MISS
+        mock_cache.get.return_value = None
+
+        CacheService().read_through(key="k", ttl_seconds=60, loader=lambda: {"v": 1}, local=True)
+
+        self.assertEqual(local.get("k"), {"v": 1})
+
+    @patch("api.services.cache_service.l1")
+    @patch("api.services.cache_service.cache")
+    def test_delete_evicts_l1_and_broadcasts(self, mock_cache, mock_l1):
+        local = LocalCache(max_entries=10, ttl_seconds=30)
+        local.set("k", 1)
+        mock_l1.get_local_cache.return_value = local
+
+        CacheService().delete_many(["k", "other"])
+
+        mock_cache.delete_many.assert_called_once_with(["k", "other"])
+        self.assertEqual(len(local), 0)
+        mock_l1.get_invalidation_listener.return_value.publish.assert_called_once_with(["k", "other"])
+
+    @patch("api.services.cache_service.cache")
+    def test_deferred_invalidation_dedupes_into_one_pipeline(self, mock_cache):
+        mock_cache.make_key = lambda k: f"px:{k}"
+        conn = MagicMock()
+        pipe = conn.pipeline.return_value
+        svc = CacheService()
+        with patch("django_redis.get_redis_connection", return_value=conn):
+            with CacheService.deferred_invalidation():
+                svc.invalidate_project_tasks("pid")
+                svc.invalidate_project_logs("pid")
+                svc.invalidate_project_tasks("pid")
+                svc.invalidate_project_logs("pid")
+                conn.pipeline.assert_not_called()
+
+        mock_cache.delete.assert_not_called()
+        mock_cache.incr.assert_not_called()
+        conn.pipeline.assert_called_once_with(transaction=False)
+        pipe.delete.assert_not_called()
+        self.assertEqual(
+            sorted(c.args[0] for c in pipe.incr.call_args_list),
+            sorted(
+                f"px:{svc.keys.project_generation('pid', family)}" for family in (CacheKeys.GEN_TASKS, CacheKeys.GEN_LOGS)
+            ),
+        )
+        pipe.execute.assert_called_once()
+
+    @patch("api.services.cache_service.transaction.on_commit")
+    @patch("api.services.cache_service.connection")
+    @patch("api.services.cache_service.cache")
+    def test_invalidation_inside_atomic_waits_for_commit(self, mock_cache, mock_conn, mock_on_commit):
+        mock_conn.in_atomic_block = True
+
+        CacheService().delete("k")
+
+        mock_cache.delete.assert_not_called()
+        mock_on_commit.assert_called_once()
+        with patch("django_redis.get_redis_connection", side_effect=NotImplementedError):
+            mock_on_commit.call_args.args[0]()
+        mock_cache.delete_many.assert_called_once_with(["k"])
+
+    @patch("api.services.cache_service.cache")
+    def test_write_game_status_writes_derived_views_under_next_generation(self, mock_cache):
+        mock_cache.incr.return_value = 4
+        svc = CacheService()
+        snapshot = {"project_id": "pid", "boss_status": {"hp": 5}, "user_statuses": [{"hp": 9}]}
+
+        svc.write_game_status("pid", snapshot, generation=3)
+
+        mock_cache.incr.assert_called_once_with(svc.keys.project_generation("pid", CacheKeys.GEN_STATUS))
+        written = {c.args[0]: c.args[1] for c in mock_cache.set.call_args_list}
+        self.assertEqual(written[svc.keys.game_status("pid", generation=4)], tag(snapshot))
+        self.assertEqual(written[svc.keys.boss_status("pid", generation=4)], {"hp": 5})
+        self.assertEqual(
+            written[svc.keys.user_statuses("pid", generation=4)], {"project_id": "pid", "user_statuses": [{"hp": 9}]}
+        )
+
+    @patch("api.services.cache_service.cache")
+    def test_write_game_status_drops_snapshot_after_concurrent_mutation(self, mock_cache):
+        # Another mutation bumped the generation after this one loaded its domain.
+        mock_cache.incr.return_value = 5
+        svc = CacheService()
+        snapshot = {"project_id": "pid", "boss_status": {"hp": 5}, "user_statuses": []}
+
+        svc.write_game_status("pid", snapshot, generation=3)
+        svc.write_game_status("pid", snapshot, generation=None)
+
+        self.assertEqual(mock_cache.incr.call_count, 2)
+        mock_cache.set.assert_not_called()
+
+    @patch("api.services.cache_service.cache")
+    def test_status_keys_follow_current_generation(self, mock_cache):
+        mock_cache.get.return_value = 7
+        svc = CacheService()
+        self.assertEqual(svc.game_status_key("pid"), svc.keys.game_status("pid", generation=7))
+        self.assertEqual(svc.boss_status_key("pid"), svc.keys.boss_status("pid", generation=7))
+        self.assertEqual(svc.user_statuses_key("pid"), svc.keys.user_statuses("pid", generation=7))
+
+        mock_cache.get.side_effect = ConnectionError("down")
+        with self.assertLogs("api.services.cache_service", level="WARNING"):
+            self.assertIsNone(svc.status_generation("pid"))
+
+    @patch("api.services.cache_service.cache")
+    def test_set_cancels_pending_delete_of_same_key(self, mock_cache):
+        svc = CacheService()
+        with patch("django_redis.get_redis_connection", side_effect=NotImplementedError):
+            with CacheService.deferred_invalidation():
+                svc.invalidate_user_projects("uid")
+                svc.invalidate_project_game("pid")
+                svc.set(svc.keys.project_boss("pid"), {"fresh": True}, ttl_seconds=30)
+
+        deleted = mock_cache.delete_many.call_args.args[0]
+        self.assertNotIn(svc.keys.project_boss("pid"), deleted)
+        self.assertIn(svc.keys.user_projects("uid"), deleted)
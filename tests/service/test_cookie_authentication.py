@@ -1,10 +1,17 @@
+import uuid
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
 
-from api.cookie_authentication import CookieJWTAuthentication
+from api.cookie_authentication import ClaimsJWTAuthentication, CookieJWTAuthentication, get_business_user
+from api.models import BusinessUser
 
 
 class CookieJWTAuthenticationTest(SimpleTestCase):
@@ -48,17 +55,18 @@ class CookieJWTAuthenticationTest(SimpleTestCase):
             return_value=None,
         ), patch("api.cookie_authentication.RefreshToken") as RT:
             rt_inst = MagicMock()
-            rt_inst.access_token = "newacc"
+            rt_inst.access_token.__str__.return_value = "newacc"
             RT.return_value = rt_inst
-            validated = MagicMock()
             user = MagicMock()
-            with patch.object(auth, "get_validated_token", return_value=validated), patch.object(
+            with patch.object(auth, "get_validated_token") as gv, patch.object(
                 auth, "get_user", return_value=user
-            ):
+            ) as gu:
                 out = auth.authenticate(request)
 
-        self.assertEqual(out, (user, validated))
+        self.assertEqual(out, (user, rt_inst.access_token))
         self.assertEqual(request._new_access_token, "newacc")
+        gu.assert_called_once_with(rt_inst.access_token)
+        gv.assert_not_called()
 
     def test_refresh_missing_returns_none(self):
         auth = CookieJWTAuthentication()
@@ -92,3 +100,89 @@ class CookieJWTAuthenticationTest(SimpleTestCase):
             return_value=None,
         ):
             self.assertIsNone(auth.authenticate(request))
+
+    def test_authenticate_attaches_business_user(self):
+        auth = CookieJWTAuthentication()
+        request = MagicMock()
+        request.COOKIES = {"access": "access-token"}
+        user = MagicMock()
+
+        with patch.object(auth, "get_validated_token"), patch.object(auth, "get_user", return_value=user):
+            auth.authenticate(request)
+
+        self.assertIs(request.business_user, user.business_profile)
+
+
+class GetBusinessUserTest(SimpleTestCase):
+    def test_prefers_user_attached_by_authentication(self):
+        request = SimpleNamespace(business_user="bu", user="auth-user")
+        with patch("api.cookie_authentication.BusinessUser.objects.get") as get:
+            self.assertEqual(get_business_user(request), "bu")
+        get.assert_not_called()
+
+    def test_falls_back_to_lookup(self):
+        request = SimpleNamespace(user="auth-user")
+        with patch("api.cookie_authentication.BusinessUser.objects.get", return_value="bu") as get:
+            self.assertEqual(get_business_user(request), "bu")
+        get.assert_called_once_with(auth_user="auth-user")
+
+
+class GetUserQueryTest(TransactionTestCase):
+    def test_get_user_loads_business_user_in_one_query(self):
+        auth_user = User.objects.create(username="u1")
+        BusinessUser.objects.create(auth_user=auth_user, name="U", username="u1", email="u1@example.com")
+        token = AccessToken.for_user(auth_user)
+        auth = CookieJWTAuthentication()
+
+        with CaptureQueriesContext(connection) as queries:
+            user = auth.get_user(token)
+            self.assertEqual(user.business_profile.username, "u1")
+        self.assertEqual(len(queries), 1)
+
+
+@override_settings(CLAIMS_AUTH_ENABLED=True)
+class ClaimsJWTAuthenticationTest(SimpleTestCase):
+    BU_ID = uuid.uuid4()
+
+    def _token(self, **claims):
+        return {"user_id": 7, "business_user_id": str(self.BU_ID), "jti": "j1", **claims}
+
+    @patch("api.cookie_authentication.is_token_revoked", return_value=False)
+    def test_builds_user_and_business_user_from_claims_without_queries(self, _revoked):
+        user = ClaimsJWTAuthentication().get_user(self._token())
+
+        self.assertEqual(user.pk, 7)
+        self.assertTrue(user.is_authenticated)
+        self.assertEqual(user.business_profile.pk, self.BU_ID)
+        self.assertIs(user.business_profile.auth_user, user)
+
+    @patch("api.cookie_authentication.is_token_revoked", return_value=True)
+    def test_revoked_token_is_rejected(self, _revoked):
+        with self.assertRaises(AuthenticationFailed):
+            ClaimsJWTAuthentication().get_user(self._token())
+
+    @patch("api.cookie_authentication.is_token_revoked", return_value=None)
+    def test_unreachable_revocation_list_falls_back_to_lookup(self, _revoked):
+        with patch.object(CookieJWTAuthentication, "get_user", return_value="db-user") as lookup:
+            self.assertEqual(ClaimsJWTAuthentication().get_user(self._token()), "db-user")
+        lookup.assert_called_once()
+
+    @patch("api.cookie_authentication.is_token_revoked")
+    def test_token_without_business_claim_falls_back_to_lookup(self, revoked):
+        with patch.object(CookieJWTAuthentication, "get_user", return_value="db-user"):
+            self.assertEqual(ClaimsJWTAuthentication().get_user(self._token(business_user_id=None)), "db-user")
+        revoked.assert_not_called()
+
+    @patch("api.cookie_authentication.is_token_revoked")
+    def test_token_minted_from_refresh_cookie_is_checked_in_database(self, revoked):
+        with patch.object(CookieJWTAuthentication, "get_user", return_value="db-user") as lookup:
+            self.assertEqual(ClaimsJWTAuthentication().get_refreshed_user(self._token()), "db-user")
+        lookup.assert_called_once()
+        revoked.assert_not_called()
+
+    @override_settings(CLAIMS_AUTH_ENABLED=False)
+    @patch("api.cookie_authentication.is_token_revoked")
+    def test_disabled_uses_lookup(self, revoked):
+        with patch.object(CookieJWTAuthentication, "get_user", return_value="db-user"):
+            self.assertEqual(ClaimsJWTAuthentication().get_user(self._token()), "db-user")
+        revoked.assert_not_called()
@@ -0,0 +1,80 @@
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from api.services import cache_codec
+from api.utils.etag import compute_etag, conditional_etag, tag, tagged, tagged_response
+
+PAYLOAD = {"id": uuid.UUID(int=1), "at": datetime(2026, 3, 1, tzinfo=dt_timezone.utc), "rows": [1, 2]}
+
+
+@api_view(["GET"])
+@conditional_etag
+def _poll(request):
+    return tagged_response(tag(dict(PAYLOAD)))
+
+
+@api_view(["GET"])
+@conditional_etag
+def _untagged(request):
+    return Response(dict(PAYLOAD))
+
+
+@api_view(["GET"])
+@conditional_etag
+def _missing(request):
+    return Response({"error": "nope"}, status=status.HTTP_404_NOT_FOUND)
+
+
+class ConditionalETagTest(SimpleTestCase):
+    def test_compute_etag_is_stable_and_content_sensitive(self):
+        self.assertEqual(compute_etag(dict(PAYLOAD)), compute_etag(dict(PAYLOAD)))
+        self.assertNotEqual(compute_etag(dict(PAYLOAD)), compute_etag({**PAYLOAD, "rows": [1]}))
+        self.assertTrue(compute_etag(PAYLOAD).startswith('W/"'))
+
+    def test_first_poll_gets_body_and_etag(self):
+        resp = _poll(APIRequestFactory().get("/poll/"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["ETag"], compute_etag(PAYLOAD))
+        self.assertEqual(resp["Cache-Control"], "private, no-cache")
+
+    def test_matching_if_none_match_returns_304_without_body(self):
+        etag = compute_etag(PAYLOAD)
+        resp = _poll(APIRequestFactory().get("/poll/", HTTP_IF_NONE_MATCH=f'"other", {etag}'))
+        self.assertEqual(resp.status_code, 304)
+        self.assertIsNone(resp.data)
+        self.assertEqual(resp["ETag"], etag)
+
+    def test_weak_comparison_and_wildcard(self):
+        strong = compute_etag(PAYLOAD).removeprefix("W/")
+        self.assertEqual(_poll(APIRequestFactory().get("/poll/", HTTP_IF_NONE_MATCH=strong)).status_code, 304)
+        self.assertEqual(_poll(APIRequestFactory().get("/poll/", HTTP_IF_NONE_MATCH="*")).status_code, 304)
+
+    def test_stale_etag_gets_full_response(self):
+        resp = _poll(APIRequestFactory().get("/poll/", HTTP_IF_NONE_MATCH='W/"stale"'))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["rows"], [1, 2])
+
+    def test_etag_is_stored_with_the_entry(self):
+        entry = tagged(lambda: dict(PAYLOAD))()
+        decoded, _soft = cache_codec.decode(cache_codec.encode(cache_codec.CODECS["msgpack"], entry))
+        # The decoded copy is served with the ETag computed when the entry was built.
+        self.assertEqual(tagged_response(decoded)["ETag"], compute_etag(PAYLOAD))
+        self.assertEqual(tagged_response(decoded).data, PAYLOAD)
+
+    def test_untagged_responses_pass_through(self):
+        with self.assertNoLogs(level="WARNING"):
+            resp = _untagged(APIRequestFactory().get("/poll/", HTTP_IF_NONE_MATCH="*"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertFalse(resp.has_header("ETag"))
+        self.assertFalse(tagged_response([1, 2]).has_header("ETag"))
+
+    def test_errors_are_not_tagged(self):
+        resp = _missing(APIRequestFactory().get("/missing/", HTTP_IF_NONE_MATCH="*"))
+        self.assertEqual(resp.status_code, 404)
+        self.assertFalse(resp.has_header("ETag"))
@@ -0,0 +1,105 @@
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from api.models import Boss, BusinessUser, Project, ProjectBoss, ProjectMember, Task, TaskLog, UserTask
+from api.services.game_service import GameService
+
+
+@override_settings(TASKLOG_STREAM_ENABLED=False)
+@patch("api.services.game_service.CacheService")
+class ConcurrentKillingBlowTest(TransactionTestCase):
+    """
+    Several requests landing the killing blow at once must run the transition (and log it) once.
+    """
+
+    THREADS = 4
+
+    def setUp(self):
+        users = [
+            BusinessUser.objects.create(
+                auth_user=User.objects.create(username=f"u{i}"),
+                name=f"U{i}",
+                username=f"u{i}",
+                email=f"u{i}@example.com",
+            )
+            for i in range(self.THREADS)
+        ]
+        self.project = Project.objects.create(owner=users[0], project_name="P")
+        self.members = [
+            ProjectMember.objects.create(project=self.project, user=u, hp=100, max_hp=100) for u in users
+        ]
+        boss = Boss.objects.create(boss_name="B", boss_image="b.png", boss_type="Normal")
+        self.boss = ProjectBoss.objects.create(project=self.project, boss=boss, hp=1, max_hp=1000)
+
+    def _tasks(self, status, assignees):
+        tasks = []
+        for i, member in enumerate(assignees):
+            task = Task.objects.create(
+                project=self.project,
+                task_name=f"t{i}",
+                priority=1,
+                status=status,
+                deadline=timezone.now() + timedelta(days=1),
+            )
+            UserTask.objects.create(project_member=member, task=task)
+            tasks.append(task)
+        return tasks
+
+    def _race(self, action, tasks):
+        errors = []
+        start = threading.Barrier(len(tasks))
+
+        def worker(task):
+            try:
+                start.wait()
+                action(self.project.project_id, task.task_id)
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+            finally:
+                connection.close()
+
+        pool = [threading.Thread(target=worker, args=(task,)) for task in tasks]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def _count(self, event_type):
+        return TaskLog.objects.filter(event_type=event_type).count()
+
+    def test_boss_is_killed_once(self, mock_cache):
+        self._race(GameService().player_attack, self._tasks("done", self.members))
+
+        boss = ProjectBoss.objects.get(pk=self.boss.pk)
+        self.assertEqual((boss.status, boss.hp, boss.phase), ("Dead", 0, 1))
+        self.assertEqual(self._count(TaskLog.EventType.KILL_BOSS), 1)
+        self.assertEqual(self._count(TaskLog.EventType.USER_ATTACK), self.THREADS)
+
+    def test_phase_advances_once(self, mock_cache):
+        ProjectBoss.objects.filter(pk=self.boss.pk).update(added_tasks=1, added_priority=50)
+
+        self._race(GameService().player_attack, self._tasks("done", self.members))
+
+        boss = ProjectBoss.objects.get(pk=self.boss.pk)
+        self.assertEqual((boss.status, boss.phase), ("Alive", 2))
+        self.assertLess(boss.hp, boss.max_hp)
+        self.assertEqual((boss.added_tasks, boss.added_priority), (0, 0))
+        self.assertEqual(self._count(TaskLog.EventType.BOSS_NEXT_PHASE_SETUP), 1)
+        self.assertEqual(self._count(TaskLog.EventType.KILL_BOSS), 0)
+
+    def test_player_is_killed_once(self, mock_cache):
+        target = self.members[0]
+        ProjectMember.objects.filter(pk=target.pk).update(hp=1)
+
+        self._race(GameService().boss_attack, self._tasks("todo", [target] * self.THREADS))
+
+        target.refresh_from_db()
+        self.assertEqual((target.status, target.hp), ("Dead", 0))
+        self.assertEqual(self._count(TaskLog.EventType.KILL_PLAYER), 1)
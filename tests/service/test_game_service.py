@@ -47,3 +47,43 @@ class GameServiceTest(SimpleTestCase):
         mock_objects.get.return_value = MagicMock(project_id="p1")
         out = GameService().get_boss_status("00000000-0000-0000-0000-000000000001")
         self.assertEqual(out["hp"], 1)
+
+    @patch("api.services.game_service.transaction.atomic")
+    @patch("api.services.game_service.CacheService")
+    @patch("api.services.game_service.ProjectDomain")
+    @patch("api.services.game_service.ProjectModel.objects")
+    def test_player_heal_writes_status_snapshot_through(self, mock_objects, mock_dom_cls, mock_cache_cls, _atomic):
+        member = MagicMock(project_member_id="m1", hp=60, max_hp=100, score=3, status="Alive")
+        member.user.user_id = "u1"
+        member.user.auth_user.username = "alice"
+        domain = MagicMock()
+        domain.game.boss.hp = 40
+        domain.project_member_management.members = [member]
+        mock_dom_cls.return_value = domain
+        mock_objects.get.return_value = MagicMock(project_id="p1")
+        mock_cache_cls.return_value.status_generation.return_value = 6
+
+        GameService().player_heal("p1", "m2", "m1", 10)
+
+        write = mock_cache_cls.return_value.write_game_status.call_args
+        project_id, snapshot = write.args
+        self.assertEqual(project_id, "p1")
+        self.assertEqual(write.kwargs["generation"], 6)
+        self.assertEqual(snapshot["boss_status"]["hp"], 40)
+        self.assertEqual(snapshot["user_statuses"][0]["username"], "alice")
+        self.assertEqual(snapshot["user_statuses"][0]["hp"], 60)
+
+    @patch("api.services.game_service.transaction.atomic")
+    @patch("api.services.game_service.CacheService")
+    @patch("api.services.game_service.ProjectDomain")
+    @patch("api.services.game_service.ProjectModel.objects")
+    def test_revive_without_boss_falls_back_to_invalidation(self, mock_objects, mock_dom_cls, mock_cache_cls, _atomic):
+        domain = MagicMock()
+        domain.game.boss = None
+        mock_dom_cls.return_value = domain
+        mock_objects.get.return_value = MagicMock(project_id="p1")
+
+        GameService().revive_player("p1", "m1")
+
+        mock_cache_cls.return_value.write_game_status.assert_not_called()
+        mock_cache_cls.return_value.invalidate_project_game.assert_called_once_with("p1")
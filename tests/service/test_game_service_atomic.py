@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+
+from api.models import Boss, BusinessUser, Project, ProjectBoss, ProjectMember, Task, TaskLog, UserTask
+from api.services.game_service import GameService
+
+
+@override_settings(TASKLOG_STREAM_ENABLED=False)
+@patch("api.services.game_service.CacheService")
+class GameActionAtomicityTest(TransactionTestCase):
+    """
+    A game action that fails after its F() deltas ran must leave neither the deltas nor logs.
+    """
+
+    def setUp(self):
+        users = [
+            BusinessUser.objects.create(
+                auth_user=User.objects.create(username=f"u{i}"),
+                name=f"U{i}",
+                username=f"u{i}",
+                email=f"u{i}@example.com",
+            )
+            for i in range(2)
+        ]
+        self.project = Project.objects.create(owner=users[0], project_name="P")
+        boss = Boss.objects.create(boss_name="B", boss_image="b.png")
+        ProjectBoss.objects.create(project=self.project, boss=boss, hp=1000, max_hp=1000)
+        self.healer = ProjectMember.objects.create(project=self.project, user=users[0], hp=100, max_hp=100)
+        self.player = ProjectMember.objects.create(project=self.project, user=users[1], hp=50, max_hp=100)
+        self.task = Task.objects.create(project=self.project, task_name="t", priority=2, status="todo")
+        UserTask.objects.create(project_member=self.player, task=self.task)
+
+    def _player_hp(self):
+        return ProjectMember.objects.get(pk=self.player.pk).hp
+
+    def test_failed_heal_rolls_back_hp_delta(self, mock_cache):
+        with patch("api.domains.game.project_member_snapshot", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                GameService().player_heal(
+                    self.project.project_id, str(self.healer.project_member_id), str(self.player.project_member_id), 20
+                )
+
+        self.assertEqual(self._player_hp(), 50)
+        self.assertFalse(TaskLog.objects.exists())
+        mock_cache.return_value.write_game_status.assert_not_called()
+
+    def test_failed_boss_attack_rolls_back_hp_delta_and_logs(self, mock_cache):
+        with patch("api.domains.game.ProjectMemberDomain.clear_effects", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                GameService().boss_attack(self.project.project_id, self.task.task_id)
+
+        self.assertEqual(self._player_hp(), 50)
+        self.assertFalse(TaskLog.objects.exists())
+
+    def test_successful_boss_attack_commits(self, mock_cache):
+        GameService().boss_attack(self.project.project_id, self.task.task_id)
+
+        self.assertLess(self._player_hp(), 50)
+        self.assertTrue(TaskLog.objects.filter(event_type=TaskLog.EventType.BOSS_ATTACK).exists())
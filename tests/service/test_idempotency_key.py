@@ -0,0 +1,46 @@
+import uuid
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.models import IdempotencyKey
+
+KIND = IdempotencyKey.Kind.OVERDUE_BOSS_ATTACK
+
+
+class IdempotencyKeyTest(TransactionTestCase):
+    def test_claim_succeeds_once_with_a_single_statement(self):
+        key = uuid.uuid4()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(IdempotencyKey.claim(KIND, key))
+        self.assertEqual(len(queries), 1)
+        self.assertIn("ON CONFLICT", queries[0]["sql"])
+
+        self.assertFalse(IdempotencyKey.claim(KIND, key))
+        self.assertTrue(IdempotencyKey.claim(IdempotencyKey.Kind.REPORT_SUPPORT, key))
+
+    def test_claim_many_returns_only_new_keys(self):
+        pid = uuid.uuid4()
+        IdempotencyKey.claim(KIND, "a", project_id=pid)
+
+        claimed = IdempotencyKey.claim_many(KIND, {"a": pid, "b": pid, "c": None})
+
+        self.assertEqual(claimed, {"b", "c"})
+        self.assertEqual(IdempotencyKey.objects.filter(kind=KIND).count(), 3)
+
+    def test_claim_many_chunks_large_batches(self):
+        keys = {str(i): None for i in range(IdempotencyKey.CLAIM_CHUNK * 2 + 5)}
+        self.assertEqual(IdempotencyKey.claim_many(KIND, keys), set(keys))
+
+    def test_release_allows_reclaim(self):
+        IdempotencyKey.claim(KIND, "a")
+        IdempotencyKey.release(KIND, ["a"])
+        self.assertTrue(IdempotencyKey.claim(KIND, "a"))
+
+    def test_claim_rolls_back_with_transaction(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.assertTrue(IdempotencyKey.claim(KIND, "a"))
+                raise RuntimeError("action failed")
+        self.assertTrue(IdempotencyKey.claim(KIND, "a"))
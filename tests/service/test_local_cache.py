@@ -0,0 +1,52 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from api.services.local_cache import MISS, InvalidationListener, LocalCache
+
+
+class LocalCacheTest(SimpleTestCase):
+    def test_lru_evicts_least_recently_used(self):
+        lc = LocalCache(max_entries=2, ttl_seconds=60)
+        lc.set("a", 1)
+        lc.set("b", 2)
+        self.assertEqual(lc.get("a"), 1)  # "b" is now least recently used
+        lc.set("c", 3)
+
+        self.assertIs(lc.get("b"), MISS)
+        self.assertEqual(lc.get("a"), 1)
+        self.assertEqual(lc.get("c"), 3)
+
+    @patch("api.services.local_cache.time.monotonic")
+    def test_entries_expire_at_min_of_l1_and_caller_ttl(self, mock_now):
+        mock_now.return_value = 100.0
+        lc = LocalCache(max_entries=10, ttl_seconds=30)
+        lc.set("short", "x", ttl_seconds=5)
+        lc.set("long", "y", ttl_seconds=300)
+
+        mock_now.return_value = 106.0
+        self.assertIs(lc.get("short"), MISS)
+        self.assertEqual(lc.get("long"), "y")
+
+        mock_now.return_value = 131.0
+        self.assertIs(lc.get("long"), MISS)
+
+    def test_listener_evicts_published_keys(self):
+        lc = LocalCache(max_entries=10, ttl_seconds=60)
+        lc.set("k1", 1)
+        lc.set("k2", 2)
+        listener = InvalidationListener(lc, channel="ch")
+
+        listener.handle_message({"type": "message", "data": json.dumps(["k1"]).encode()})
+        listener.handle_message({"type": "message", "data": b"not-json"})
+
+        self.assertIs(lc.get("k1"), MISS)
+        self.assertEqual(lc.get("k2"), 2)
+
+    def test_publish_sends_keys_on_channel(self):
+        listener = InvalidationListener(LocalCache(max_entries=1, ttl_seconds=1), channel="ch")
+        conn = MagicMock()
+        with patch("django_redis.get_redis_connection", return_value=conn):
+            listener.publish(["a", "b"])
+        conn.publish.assert_called_once_with("ch", json.dumps(["a", "b"]))
@@ -1,10 +1,13 @@
+import uuid
+from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TransactionTestCase
+from django.utils import timezone
 
 from api.models import TaskLog
-from api.services.log_service import TaskLogQueryService
+from api.services.log_service import TaskLogQueryService, decode_log_cursor, encode_log_cursor
 
 
 class LogServiceTest(SimpleTestCase):
@@ -39,3 +42,75 @@ class LogServiceTest(SimpleTestCase):
         qs.filter.return_value = qs
         qs.order_by.return_value = []
         self.assertEqual(TaskLogQueryService().get_all_logs(time_begin=None), [])
+
+    @patch.object(TaskLogQueryService, "_base_queryset")
+    def test_get_game_logs_after_unknown_anchor_returns_none(self, mock_bq):
+        qs = MagicMock()
+        mock_bq.return_value = qs
+        qs.filter.return_value = qs
+        qs.values_list.return_value.first.return_value = None
+        self.assertIsNone(TaskLogQueryService().get_game_logs_after("p1", "00000000-0000-0000-0000-000000000002"))
+
+    @patch.object(TaskLogQueryService, "_base_queryset")
+    def test_get_game_logs_after_returns_none_past_limit(self, mock_bq):
+        qs = MagicMock()
+        mock_bq.return_value = qs
+        qs.filter.return_value = qs
+        qs.exclude.return_value = qs
+        qs.values_list.return_value.first.return_value = "anchor-ts"
+        log = SimpleNamespace(
+            id="l1", project_id="p1", actor_type="user", actor_id=None, event_type="USER_ATTACK", payload={}, created_at=None
+        )
+        qs.order_by.return_value = [log, log]
+        self.assertIsNone(TaskLogQueryService().get_game_logs_after("p1", "a", limit=1))
+        out = TaskLogQueryService().get_game_logs_after("p1", "a", limit=2)
+        self.assertEqual([dto.id for dto in out], ["l1", "l1"])
+
+    def test_log_cursor_round_trip(self):
+        created_at = timezone.now()
+        log_id = uuid.uuid4()
+        self.assertEqual(decode_log_cursor(encode_log_cursor(created_at, log_id)), (created_at, log_id))
+
+    def test_decode_log_cursor_rejects_garbage(self):
+        for cursor in ("not-a-cursor", encode_log_cursor(timezone.now(), "nope"), "fA"):
+            with self.assertRaises(ValueError):
+                decode_log_cursor(cursor)
+
+
+class GameLogPageTest(TransactionTestCase):
+    def setUp(self):
+        self.project_id = uuid.uuid4()
+        base = timezone.now()
+        # Pairs share a timestamp so pages must break ties on id.
+        self.logs = TaskLog.objects.bulk_create(
+            [
+                TaskLog(
+                    project_id=self.project_id,
+                    event_type=TaskLog.EventType.USER_ATTACK,
+                    created_at=base - timedelta(seconds=i // 2),
+                )
+                for i in range(7)
+            ]
+            + [TaskLog(project_id=self.project_id, event_type=TaskLog.EventType.TASK_CREATED, created_at=base)]
+        )
+
+    def test_pages_walk_history_newest_first_without_gaps(self):
+        svc = TaskLogQueryService()
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = svc.get_game_logs_page(str(self.project_id), limit=3, cursor=cursor)
+            seen.extend(log.id for log in page.logs)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        game_logs = [log for log in self.logs if log.event_type == TaskLog.EventType.USER_ATTACK]
+        expected = [str(log.id) for log in sorted(game_logs, key=lambda l: (l.created_at, l.id), reverse=True)]
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 3)
+
+    def test_last_full_page_has_no_cursor(self):
+        page = TaskLogQueryService().get_game_logs_page(str(self.project_id), limit=7)
+        self.assertEqual(len(page.logs), 7)
+        self.assertIsNone(page.next_cursor)
@@ -0,0 +1,107 @@
+import json
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from api.models import TaskLog
+from api.services import log_stream
+from api.services.log_stream import StreamLimitReached, TaskLogHub, format_sse, log_event
+
+PID = "00000000-0000-0000-0000-000000000001"
+
+
+def _log(**kwargs):
+    defaults = dict(
+        id=uuid.UUID(int=7),
+        project_id=uuid.UUID(PID),
+        actor_type="user",
+        actor_id=None,
+        event_type="USER_ATTACK",
+        payload={"damage": 3},
+        created_at=datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc),
+    )
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+class TaskLogHubTest(SimpleTestCase):
+    def test_format_sse_uses_log_id_and_event_type(self):
+        frame = format_sse(log_event(_log()))
+        lines = frame.split("\n")
+        self.assertEqual(lines[0], f"id: {uuid.UUID(int=7)}")
+        self.assertEqual(lines[1], "event: USER_ATTACK")
+        data = json.loads(lines[2].removeprefix("data: "))
+        self.assertEqual(data["created_at"], "2026-03-01T12:00:00Z")
+        self.assertTrue(frame.endswith("\n\n"))
+
+    def test_max_streams_caps_open_subscriptions(self):
+        hub = TaskLogHub(broker="memory", max_streams=2)
+        first = hub.subscribe(PID)
+        hub.subscribe("other")
+        with self.assertRaises(StreamLimitReached):
+            hub.subscribe(PID)
+
+        hub.unsubscribe(first)
+        hub.unsubscribe(first)  # double unsubscribe must not free a second slot
+        hub.subscribe(PID)
+        with self.assertRaises(StreamLimitReached):
+            hub.subscribe(PID)
+
+    def test_memory_broker_fans_out_to_project_subscribers_only(self):
+        hub = TaskLogHub(broker="memory")
+        a, b = hub.subscribe(PID), hub.subscribe(PID)
+        other = hub.subscribe("other")
+
+        hub.publish(PID, log_event(_log()))
+
+        self.assertEqual(a.get(timeout=0)["id"], str(uuid.UUID(int=7)))
+        self.assertEqual(b.get(timeout=0)["payload"], {"damage": 3})
+        self.assertIsNone(other.get(timeout=0))
+
+        hub.unsubscribe(a)
+        hub.publish(PID, log_event(_log()))
+        self.assertIsNone(a.get(timeout=0))
+
+    def test_slow_subscriber_is_marked_overflowed(self):
+        hub = TaskLogHub(broker="memory", max_pending=1)
+        sub = hub.subscribe(PID)
+        hub.dispatch(PID, {"id": "1"})
+        hub.dispatch(PID, {"id": "2"})
+        self.assertTrue(sub.overflowed)
+
+    def test_redis_message_is_dispatched_by_channel(self):
+        hub = TaskLogHub(broker="memory")
+        sub = hub.subscribe(PID)
+        hub.handle_message(
+            {"type": "pmessage", "channel": log_stream.channel_for(PID).encode(), "data": b'{"id": "x"}'}
+        )
+        self.assertEqual(sub.get(timeout=0), {"id": "x"})
+
+    @override_settings(TASKLOG_STREAM_BROKER="redis")
+    def test_redis_publish_failure_is_swallowed(self):
+        hub = TaskLogHub(broker="redis")
+        with patch("django_redis.get_redis_connection", side_effect=RuntimeError("down")):
+            with self.assertLogs("api.services.log_stream", level="WARNING"):
+                hub.publish(PID, {"id": "x"})
+
+    @patch("api.services.log_stream.transaction.on_commit")
+    @patch("api.services.log_stream.connection")
+    @patch("api.services.log_stream.get_hub")
+    def test_publish_task_log_waits_for_commit(self, mock_hub, mock_conn, mock_on_commit):
+        mock_conn.in_atomic_block = True
+        log_stream.publish_task_log(_log())
+
+        mock_hub.return_value.publish.assert_not_called()
+        mock_on_commit.call_args.args[0]()
+        mock_hub.return_value.publish.assert_called_once()
+
+    @patch("api.services.log_stream.publish_task_log")
+    @patch.object(TaskLog.objects, "create")
+    def test_task_log_write_publishes_game_events_only(self, mock_create, mock_publish):
+        mock_create.side_effect = lambda **kw: _log(**kw)
+        TaskLog.write(project_id=PID, actor_type="user", event_type=TaskLog.EventType.USER_ATTACK)
+        TaskLog.write(project_id=PID, actor_type="user", event_type=TaskLog.EventType.TASK_CREATED)
+        self.assertEqual(mock_publish.call_count, 1)
@@ -2,9 +2,15 @@ import os
 from unittest.mock import MagicMock, patch
 
 from django.http import HttpResponse, JsonResponse
-from django.test import SimpleTestCase, override_settings
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
 
-from api.middleware import InternalAPIKeyMiddleware, RefreshTokenMiddleware
+from api.middleware import (
+    DeferredCacheInvalidationMiddleware,
+    InternalAPIKeyMiddleware,
+    RefreshTokenMiddleware,
+    RequestMetricsMiddleware,
+)
 
 
 class RefreshTokenMiddlewareTest(SimpleTestCase):
@@ -79,3 +85,69 @@ class InternalAPIKeyMiddlewareTest(SimpleTestCase):
 
         inner.assert_called_once_with(request)
         self.assertEqual(response.content, b"y")
+
+
+class DeferredCacheInvalidationMiddlewareTest(SimpleTestCase):
+    @patch("api.services.cache_service.cache")
+    def test_flushes_request_invalidations_once_after_response(self, mock_cache):
+        from api.services.cache_service import CacheService
+
+        def view(_request):
+            CacheService().delete("a")
+            CacheService().delete("a")
+            CacheService().delete("b")
+            mock_cache.delete.assert_not_called()
+            return HttpResponse("ok")
+
+        with patch("django_redis.get_redis_connection", side_effect=NotImplementedError):
+            response = DeferredCacheInvalidationMiddleware(view)(MagicMock())
+
+        self.assertEqual(response.content, b"ok")
+        mock_cache.delete_many.assert_called_once_with(["a", "b"])
+
+
+class RequestMetricsMiddlewareTest(TransactionTestCase):
+    @patch("api.middleware.request_metrics")
+    def test_records_queries_and_cache_calls_under_url_name(self, mock_metrics):
+        from api.services.request_metrics import RequestMetrics, count_cache_call
+
+        metrics = RequestMetrics(flush_seconds=3600)
+        mock_metrics.enabled = True
+        mock_metrics.start.side_effect = metrics.start
+        mock_metrics.finish.side_effect = metrics.finish
+
+        def view(request):
+            User.objects.count()
+            User.objects.exists()
+            count_cache_call()
+            request.resolver_match = MagicMock(url_name="task_list")
+            return HttpResponse("ok")
+
+        response = RequestMetricsMiddleware(view)(MagicMock(spec=[]))
+
+        self.assertEqual(response.content, b"ok")
+        fields = metrics._take_pending()["task_list"]
+        self.assertEqual((fields["requests"], fields["errors"]), (1, 0))
+        self.assertEqual((fields["db_queries"], fields["cache_calls"]), (2, 1))
+        self.assertGreater(fields["db_seconds"], 0)
+
+    @patch("api.middleware.request_metrics")
+    def test_exception_is_recorded_as_error_and_reraised(self, mock_metrics):
+        mock_metrics.enabled = True
+
+        def view(_request):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            RequestMetricsMiddleware(view)(MagicMock(spec=[]))
+
+        _token, view_name, _seconds = mock_metrics.finish.call_args.args
+        self.assertEqual(view_name, "unresolved")
+        self.assertTrue(mock_metrics.finish.call_args.kwargs["error"])
+
+    @patch("api.middleware.request_metrics")
+    def test_disabled_passes_through(self, mock_metrics):
+        mock_metrics.enabled = False
+        response = RequestMetricsMiddleware(lambda _r: HttpResponse("x"))(MagicMock())
+        self.assertEqual(response.content, b"x")
+        mock_metrics.start.assert_not_called()
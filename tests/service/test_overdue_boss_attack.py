@@ -0,0 +1,89 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.models import Boss, BusinessUser, Project, ProjectBoss, ProjectMember, Task, TaskLog, UserTask
+from api.services.game_service import GameService
+
+
+@override_settings(TASKLOG_STREAM_ENABLED=False)
+@patch("api.services.game_service.CacheService")
+class OverdueBossAttackCommandTest(TransactionTestCase):
+    def setUp(self):
+        boss = Boss.objects.create(boss_name="B", boss_image="b.png")
+        overdue = timezone.now() - timedelta(days=1)
+        self.members = []
+        for i in range(2):
+            owner = BusinessUser.objects.create(
+                auth_user=User.objects.create(username=f"u{i}"),
+                name=f"U{i}",
+                username=f"u{i}",
+                email=f"u{i}@example.com",
+            )
+            project = Project.objects.create(owner=owner, project_name=f"P{i}")
+            ProjectBoss.objects.create(project=project, boss=boss, hp=1000, max_hp=1000)
+            member = ProjectMember.objects.create(project=project, user=owner, hp=100, max_hp=100)
+            self.members.append(member)
+            for n in range(3):
+                task = Task.objects.create(project=project, task_name=f"t{n}", priority=2, status="todo", deadline=overdue)
+                UserTask.objects.create(project_member=member, task=task)
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("overdue_boss_attack", *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+
+    def _hp(self):
+        return [ProjectMember.objects.get(pk=m.pk).hp for m in self.members]
+
+    def test_batch_mode_attacks_each_task_once(self, mock_cache):
+        out = self._run("--batch")
+
+        self.assertIn("attacked=6", out)
+        self.assertIn("tasks/sec", out)
+        self.assertEqual(self._hp(), [40, 40])
+        markers = TaskLog.objects.filter(actor_type=TaskLog.ActorType.SYSTEM, event_type=TaskLog.EventType.BOSS_ATTACK)
+        self.assertEqual(markers.count(), 6)
+
+        self.assertIn("attacked=0", self._run("--batch"))
+        self.assertEqual(self._hp(), [40, 40])
+
+    def test_batch_mode_skips_tasks_marked_by_per_task_mode(self, mock_cache):
+        self._run("--limit", "2")
+        self.assertIn("attacked=4", self._run("--batch"))
+        self.assertEqual(self._hp(), [40, 40])
+
+    def test_batch_mode_issues_fewer_queries(self, mock_cache):
+        with CaptureQueriesContext(connection) as per_task:
+            self._run("--project-id", str(self.members[0].project_id))
+        with CaptureQueriesContext(connection) as batched:
+            self._run("--batch", "--project-id", str(self.members[1].project_id))
+
+        self.assertEqual(self._hp(), [40, 40])
+        self.assertLess(len(batched), len(per_task))
+
+    def test_batch_mode_commits_per_project(self, mock_cache):
+        failing = str(self.members[0].project_id)
+        original = GameService.overdue_boss_attacks
+
+        def attack(svc, project_id, tasks):
+            if project_id == failing:
+                raise RuntimeError("boom")
+            return original(svc, project_id, tasks)
+
+        with patch.object(GameService, "overdue_boss_attacks", attack):
+            out = self._run("--batch")
+
+        self.assertIn("attacked=3", out)
+        self.assertIn("failed=3", out)
+        self.assertEqual(self._hp(), [100, 40])
+        # The failed project's claims were rolled back with it, so the next run retries them.
+        self.assertIn("attacked=3", self._run("--batch"))
+        self.assertEqual(self._hp(), [40, 40])
@@ -27,7 +27,7 @@ class ProjectServiceBulkTest(SimpleTestCase):
     @patch("api.services.project_service.ProjectModel.objects")
     def test_get_all_project_members(self, mock_proj, mock_dom):
         mock_proj.get.return_value = MagicMock()
-        mock_dom.return_value._project_member_management.members = [MagicMock()]
+        mock_dom.return_value.project_member_management.members = [MagicMock()]
         mems = ProjectService().get_all_project_members("pid")
         self.assertEqual(len(mems), 1)
 
@@ -66,7 +66,7 @@ class ProjectServiceBulkTest(SimpleTestCase):
         member.score = 10
         member.status = "Alive"
         domain = MagicMock()
-        domain._project_member_management.members = [member]
+        domain.project_member_management.members = [member]
         mock_dom.return_value = domain
         mock_log.filter.return_value.values_list.return_value = [{"damage": 1}]
         boss_qs = MagicMock()
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from api.services.request_metrics import RequestMetrics, count_cache_call, current_stats
+
+
+@override_settings(REQUEST_METRICS_BUCKETS_MS=(10, 100))
+class RequestMetricsTest(SimpleTestCase):
+    def test_finish_buckets_latency_and_totals_counters(self):
+        metrics = RequestMetrics(flush_seconds=3600)
+        for seconds in (0.005, 0.05, 0.5):
+            token = metrics.start()
+            current_stats().db_queries += 2
+            count_cache_call()
+            metrics.finish(token, "task_list", seconds, error=seconds > 0.1)
+
+        fields = metrics._take_pending()["task_list"]
+        self.assertEqual((fields["le_10"], fields["le_100"], fields["le_inf"]), (1, 1, 1))
+        self.assertEqual((fields["requests"], fields["errors"]), (3, 1))
+        self.assertEqual((fields["db_queries"], fields["cache_calls"]), (6, 3))
+        self.assertIsNone(current_stats())
+
+    def test_cache_calls_outside_a_request_are_ignored(self):
+        count_cache_call()
+        self.assertIsNone(current_stats())
+
+    def test_derive_estimates_percentiles_from_histogram(self):
+        out = RequestMetrics()._derive(
+            {"requests": 100, "seconds": 5.0, "db_queries": 300, "le_10": 90, "le_100": 9, "le_inf": 1}
+        )
+        self.assertEqual(out["avg_ms"], 50.0)
+        self.assertEqual(out["avg_db_queries"], 3.0)
+        self.assertEqual((out["p50_ms"], out["p95_ms"], out["p99_ms"]), (10, 100, 100))
+        self.assertEqual(out["histogram_ms"], {"le_10": 90, "le_100": 9, "le_inf": 1})
+        self.assertIsNone(RequestMetrics()._derive({})["p99_ms"])
+
+    def test_flush_pipelines_counters_per_view(self):
+        metrics = RequestMetrics(flush_seconds=3600)
+        metrics.finish(metrics.start(), "get_dashboard", 0.02)
+
+        conn = MagicMock()
+        pipe = conn.pipeline.return_value
+        with patch("django_redis.get_redis_connection", return_value=conn):
+            metrics.flush()
+
+        pipe.sadd.assert_called_once_with("workquest:metrics:requests:views", "get_dashboard")
+        ints = {c.args[1]: c.args[2] for c in pipe.hincrby.call_args_list}
+        self.assertEqual(ints["requests"], 1)
+        self.assertEqual(ints["le_100"], 1)
+        pipe.execute.assert_called_once()
+
+    def test_flush_failure_is_swallowed(self):
+        metrics = RequestMetrics(flush_seconds=3600)
+        metrics.finish(metrics.start(), "task_list", 0.01)
+        with patch("django_redis.get_redis_connection", side_effect=RuntimeError("down")):
+            with self.assertLogs("api.services.request_metrics", level="WARNING"):
+                metrics.flush()
+        self.assertEqual(metrics._take_pending(), {})
@@ -0,0 +1,128 @@
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+
+from api.middleware import RequestProfilerMiddleware
+from api.services import request_profiler
+from api.services.request_profiler import iter_profiles, should_profile
+
+
+def _request(headers=None, url_name="get_dashboard"):
+    request = RequestFactory().get("/api/dashboard/", headers=headers or {})
+    request.resolver_match = MagicMock(url_name=url_name)
+    return request
+
+
+class ShouldProfileTest(SimpleTestCase):
+    @override_settings(REQUEST_PROFILER_SAMPLE_RATE=0.0, REQUEST_PROFILER_VIEWS=())
+    def test_rate_zero_never_samples(self):
+        self.assertFalse(should_profile(_request(), "get_dashboard"))
+
+    @override_settings(REQUEST_PROFILER_SAMPLE_RATE=1.0, REQUEST_PROFILER_VIEWS=("get_dashboard",))
+    def test_only_listed_views_are_sampled(self):
+        self.assertTrue(should_profile(_request(), "get_dashboard"))
+        self.assertFalse(should_profile(_request(), "task_list"))
+
+    @override_settings(REQUEST_PROFILER_SAMPLE_RATE=0.0, REQUEST_PROFILER_VIEWS=())
+    @patch.dict(os.environ, {"INTERNAL_SERVICE_API_KEY": "secret"}, clear=False)
+    def test_header_with_internal_key_forces_profile(self):
+        self.assertTrue(should_profile(_request({"X-Profile": "secret"}), "task_list"))
+        self.assertFalse(should_profile(_request({"X-Profile": "guess"}), "task_list"))
+
+    @override_settings(REQUEST_PROFILER_ENABLED=False)
+    def test_disabled_middleware_is_removed_from_the_stack(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestProfilerMiddleware(lambda r: HttpResponse())
+
+
+class RequestProfilerMiddlewareTest(TransactionTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def _run(self, request, concurrent=False):
+        def view(_request):
+            User.objects.count()
+            if concurrent:
+                # Another worker thread serving a request while this one is profiled.
+                request_profiler.request_started()
+                request_profiler.request_finished()
+            return HttpResponse("ok")
+
+        def get_response(r):
+            # Django runs process_view inside get_response, after __call__ counted the request.
+            mw.process_view(r, view, (), {})
+            return view(r)
+
+        mw = RequestProfilerMiddleware(get_response)
+        return mw(request)
+
+    def test_writes_profile_with_captured_sql_and_report_summarizes_it(self):
+        with self.settings(
+            REQUEST_PROFILER_ENABLED=True,
+            REQUEST_PROFILER_SAMPLE_RATE=1.0,
+            REQUEST_PROFILER_VIEWS=(),
+            REQUEST_PROFILER_DIR=self.dir,
+        ):
+            response = self._run(_request())
+
+            [(path, meta)] = list(iter_profiles(self.dir))
+            self.assertEqual(response["X-Profile-Id"], path.stem)
+            self.assertEqual((meta["view"], meta["status"], meta["query_count"]), ("get_dashboard", 200, 1))
+            self.assertIn("auth_user", meta["queries"][0]["sql"])
+
+            out = StringIO()
+            call_command("profile_report", stdout=out)
+        report = out.getvalue()
+        self.assertIn(path.stem, report)
+        self.assertIn("auth_user", report)
+
+    def test_keeps_only_the_newest_profiles(self):
+        with self.settings(
+            REQUEST_PROFILER_ENABLED=True,
+            REQUEST_PROFILER_SAMPLE_RATE=1.0,
+            REQUEST_PROFILER_VIEWS=(),
+            REQUEST_PROFILER_DIR=self.dir,
+            REQUEST_PROFILER_MAX_PROFILES=2,
+        ):
+            for _ in range(3):
+                self._run(_request())
+
+        self.assertEqual(len(list(iter_profiles(self.dir))), 2)
+        self.assertEqual(len(list(self.dir.glob("*.prof"))), 2)
+
+    def test_profile_overlapping_another_request_is_discarded(self):
+        with self.settings(
+            REQUEST_PROFILER_ENABLED=True,
+            REQUEST_PROFILER_SAMPLE_RATE=1.0,
+            REQUEST_PROFILER_VIEWS=(),
+            REQUEST_PROFILER_DIR=self.dir,
+        ):
+            with self.assertLogs("api.middleware", level="INFO"):
+                response = self._run(_request(), concurrent=True)
+            self.assertNotIn("X-Profile-Id", response)
+            self.assertEqual(list(self.dir.iterdir()), [])
+
+            # The in-flight count is back to this request alone: the next profile is kept.
+            self.assertIn("X-Profile-Id", self._run(_request()))
+        self.assertEqual(request_profiler._inflight, 0)
+        self.assertEqual(request_profiler._active, {})
+
+    def test_unsampled_request_writes_nothing(self):
+        with self.settings(
+            REQUEST_PROFILER_ENABLED=True,
+            REQUEST_PROFILER_SAMPLE_RATE=0.0,
+            REQUEST_PROFILER_DIR=self.dir,
+        ):
+            response = self._run(_request())
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(list(self.dir.iterdir()), [])
@@ -0,0 +1,77 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from api.models import TaskLog
+
+PID = str(uuid.uuid4())
+
+
+def _write(event_type=TaskLog.EventType.TASK_UPDATED, **payload):
+    return TaskLog.write(project_id=PID, actor_type="user", event_type=event_type, payload=payload)
+
+
+@patch("api.services.log_stream.publish_task_log")
+@patch.object(TaskLog.objects, "bulk_create")
+@patch.object(TaskLog.objects, "create")
+class TaskLogBatchTest(SimpleTestCase):
+    def test_writes_are_inserted_once_in_order(self, mock_create, mock_bulk, mock_publish):
+        with TaskLog.batch():
+            first = _write(n=1)
+            second = _write(n=2)
+            mock_bulk.assert_not_called()
+
+        mock_create.assert_not_called()
+        mock_bulk.assert_called_once()
+        self.assertEqual([log.payload["n"] for log in mock_bulk.call_args.args[0]], [1, 2])
+        self.assertIsNotNone(first.id)
+        self.assertLessEqual(first.created_at, second.created_at)
+
+    def test_writes_outside_batch_insert_immediately(self, mock_create, mock_bulk, mock_publish):
+        _write()
+        mock_create.assert_called_once()
+        mock_bulk.assert_not_called()
+
+    def test_nested_batches_insert_at_outermost_exit(self, mock_create, mock_bulk, mock_publish):
+        with TaskLog.batch():
+            _write(n=1)
+            with TaskLog.batch():
+                _write(n=2)
+            mock_bulk.assert_not_called()
+
+        self.assertEqual(len(mock_bulk.call_args.args[0]), 2)
+
+    def test_failed_nested_block_drops_only_its_logs(self, mock_create, mock_bulk, mock_publish):
+        with TaskLog.batch():
+            _write(n=1)
+            with self.assertRaises(ValueError):
+                with TaskLog.batch():
+                    _write(n=2)
+                    raise ValueError("skip")
+            _write(n=3)
+
+        self.assertEqual([log.payload["n"] for log in mock_bulk.call_args.args[0]], [1, 3])
+
+    def test_exception_discards_buffer(self, mock_create, mock_bulk, mock_publish):
+        with self.assertRaises(ValueError):
+            with TaskLog.batch():
+                _write()
+                raise ValueError("boom")
+        mock_bulk.assert_not_called()
+        mock_create.assert_not_called()
+
+    def test_game_events_published_after_insert(self, mock_create, mock_bulk, mock_publish):
+        mock_bulk.side_effect = lambda logs: mock_publish.assert_not_called() or logs
+
+        @TaskLog.batch()
+        def op():
+            _write(TaskLog.EventType.USER_ATTACK)
+            _write(TaskLog.EventType.TASK_UPDATED)
+            _write(TaskLog.EventType.KILL_BOSS)
+
+        op()
+        self.assertEqual(
+            [c.args[0].event_type for c in mock_publish.call_args_list],
+            [TaskLog.EventType.USER_ATTACK, TaskLog.EventType.KILL_BOSS],
+        )
@@ -32,7 +32,7 @@ class TaskServiceTest(SimpleTestCase):
         tm.get_all_tasks.return_value = mock_chain
         domain = MagicMock()
         domain.check_access.return_value = True
-        domain._task_management = tm
+        domain.TaskManagement = tm
         mock_project_cls.return_value = domain
 
         svc = TaskService("00000000-0000-0000-0000-000000000000", user=MagicMock())
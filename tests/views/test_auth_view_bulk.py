@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 from django.contrib.auth.models import AnonymousUser
 from django.test import SimpleTestCase
-from rest_framework.test import APIRequestFactory
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 from tests.drf_helpers import attach_authenticated_user
 
@@ -78,6 +78,14 @@ class AuthViewBulkTest(SimpleTestCase):
         resp = logout(req)
         self.assertEqual(resp.status_code, 200)
 
+    @patch("api.views.auth_view.revoke_token")
+    def test_logout_revokes_access_token(self, mock_revoke):
+        req = APIRequestFactory().post("/out", {}, format="json")
+        force_authenticate(req, user=MagicMock(), token={"jti": "j1"})
+        resp = logout(req)
+        self.assertEqual(resp.status_code, 200)
+        mock_revoke.assert_called_once_with({"jti": "j1"})
+
     def test_check_auth_authenticated(self):
         req = APIRequestFactory().get("/check")
         attach_authenticated_user(req)
@@ -157,8 +165,18 @@ class AuthViewBulkTest(SimpleTestCase):
         resp = refresh_token(req)
         self.assertEqual(resp.status_code, 401)
 
+    @patch.object(auth_view_module, "is_token_revoked", return_value=True)
+    @patch.object(auth_view_module, "RefreshToken")
+    def test_refresh_rejects_revoked_token(self, mock_rt_cls, _revoked):
+        req = APIRequestFactory().post(
+            "/ref", {"refresh": "good"}, format="json"
+        )
+        resp = refresh_token(req)
+        self.assertEqual(resp.status_code, 401)
+
+    @patch.object(auth_view_module, "is_token_revoked", return_value=False)
     @patch.object(auth_view_module, "RefreshToken")
-    def test_refresh_ok(self, mock_rt_cls):
+    def test_refresh_ok(self, mock_rt_cls, _revoked):
         rt = MagicMock()
         rt.access_token = "at"
         mock_rt_cls.return_value = rt
@@ -1,11 +1,13 @@
 from unittest.mock import MagicMock, patch
 
+from django.contrib.admin.sites import AdminSite
 from django.test import SimpleTestCase
 from rest_framework.test import APIRequestFactory
 
 from tests.drf_helpers import attach_authenticated_user
 
-from api.models import BusinessUser
+from api.admin import BossAdmin
+from api.models import Boss, BusinessUser
 from api.models.ProjectMember import ProjectMember
 from api.views import game_view as gv
 
@@ -58,16 +60,28 @@ class GameViewTest(SimpleTestCase):
         response = gv.get_project_boss(request, project_id="pid")
         self.assertEqual(response.status_code, 400)
 
+    @patch("api.views.game_view.CacheService")
     @patch("api.views.game_view.BossSerializer")
     @patch("api.views.game_view.GameService")
-    def test_get_all_bosses(self, mock_gs, mock_ser):
+    def test_get_all_bosses(self, mock_gs, mock_ser, mock_cache_cls):
         mock_gs.return_value.get_all_bosses.return_value = [MagicMock()]
         mock_ser.return_value.data = [{"id": 1}]
+        mock_cache_cls.return_value.read_through.side_effect = lambda **kw: kw["loader"]()
         request = self.factory.get("/bosses/")
         attach_authenticated_user(request)
         response = gv.get_all_bosses(request)
         self.assertEqual(response.status_code, 200)
 
+    def test_boss_admin_changes_invalidate_boss_list(self):
+        admin = BossAdmin(Boss, AdminSite())
+        obj = MagicMock()
+        with patch("api.admin.CacheService") as mock_cache_cls:
+            admin.save_model(MagicMock(), obj, MagicMock(), True)
+            with patch("django.contrib.admin.ModelAdmin.delete_model"):
+                admin.delete_model(MagicMock(), obj)
+        obj.save.assert_called_once_with()
+        self.assertEqual(mock_cache_cls.return_value.invalidate_all_bosses.call_count, 2)
+
     @patch("api.views.game_view.CacheService")
     @patch("api.views.game_view.GameService")
     def test_setup_project_boss_success(self, mock_gs, mock_cache):
@@ -189,7 +203,7 @@ class GameViewTest(SimpleTestCase):
     @patch("api.views.game_view.GameService")
     def test_get_boss_status_cached(self, mock_gs, mock_cache_cls):
         mock_cache = MagicMock()
-        mock_cache.keys.boss_status.return_value = "k"
+        mock_cache.boss_status_key.return_value = "k"
         mock_cache.read_through.return_value = {"s": 1}
         mock_cache_cls.return_value = mock_cache
         request = self.factory.get("/st/")
@@ -202,7 +216,7 @@ class GameViewTest(SimpleTestCase):
     @patch("api.views.game_view.GameService")
     def test_get_user_statuses(self, mock_gs, mock_cache_cls):
         mock_cache = MagicMock()
-        mock_cache.keys.user_statuses.return_value = "k"
+        mock_cache.user_statuses_key.return_value = "k"
         mock_cache.read_through.return_value = []
         mock_cache_cls.return_value = mock_cache
         request = self.factory.get("/us/")
@@ -213,7 +227,7 @@ class GameViewTest(SimpleTestCase):
     @patch("api.views.game_view.GameService")
     def test_get_game_status(self, mock_gs, mock_cache_cls):
         mock_cache = MagicMock()
-        mock_cache.keys.game_status.return_value = "k"
+        mock_cache.game_status_key.return_value = "k"
         mock_cache.read_through.return_value = {}
         mock_cache_cls.return_value = mock_cache
         request = self.factory.get("/gs/")
@@ -241,7 +255,7 @@ class GameViewTest(SimpleTestCase):
         mock_pm.return_value = MagicMock(project_member_id="mid")
         mock_gs.return_value.get_project_member_items.return_value = {"items": []}
         mock_cache = MagicMock()
-        mock_cache.keys.project_member_items.return_value = "k"
+        mock_cache.project_member_items_key.return_value = "k"
         mock_cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = mock_cache
         request = self.factory.get("/items/")
@@ -274,7 +288,7 @@ class GameViewTest(SimpleTestCase):
         mock_pm.return_value = MagicMock(project_member_id="mid")
         mock_gs.return_value.get_project_member_status_effects.return_value = {}
         mock_cache = MagicMock()
-        mock_cache.keys.project_member_status_effects.return_value = "k"
+        mock_cache.project_member_status_effects_key.return_value = "k"
         mock_cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = mock_cache
         request = self.factory.get("/fx/")
@@ -1,16 +1,21 @@
 from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
 from rest_framework.test import APIRequestFactory
 
 from tests.drf_helpers import attach_authenticated_user
 
+from api.dtos.log_dto import ProjectLogPageDTO
 from api.views.log_view import (
+    _parse_limit,
     _parse_time_begin,
     get_all_task_logs,
     get_project_logs,
     get_project_logs_grouped,
+    stream_project_logs,
 )
+from api.services.log_stream import TaskLogHub
 
 
 class LogViewTest(SimpleTestCase):
@@ -41,16 +46,30 @@ class LogViewTest(SimpleTestCase):
         proj = MagicMock()
         mock_proj.return_value = proj
         mock_dom.return_value.check_access.return_value = True
-        mock_log_svc.return_value.get_game_logs.return_value = []
+        mock_log_svc.return_value.get_game_logs_page.return_value = ProjectLogPageDTO(logs=[], next_cursor="c2")
         cache = MagicMock()
-        cache.keys.project_game_logs.return_value = "lg"
+        cache.project_game_logs_key.return_value = "lg"
         cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = cache
         factory = APIRequestFactory()
-        request = factory.get("/logs/?time_begin=2026-01-01")
+        request = factory.get("/logs/?time_begin=2026-01-01&limit=5000&cursor=c1")
         attach_authenticated_user(request)
         r = get_project_logs(request, "00000000-0000-0000-0000-000000000001")
         self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["next_cursor"], "c2")
+        kwargs = mock_log_svc.return_value.get_game_logs_page.call_args.kwargs
+        self.assertEqual((kwargs["limit"], kwargs["cursor"]), (500, "c1"))
+        self.assertEqual(cache.project_game_logs_key.call_args.kwargs["limit"], 500)
+        self.assertEqual(cache.read_through.call_args.kwargs["ttl_seconds"], 30)
+
+    def test_parse_limit_defaults_caps_and_rejects(self):
+        with override_settings(GAME_LOGS_PAGE_SIZE=50, GAME_LOGS_MAX_PAGE_SIZE=200):
+            self.assertEqual(_parse_limit(None), 50)
+            self.assertEqual(_parse_limit("20"), 20)
+            self.assertEqual(_parse_limit("999"), 200)
+            for raw in ("0", "-3", "ten"):
+                with self.assertRaises(ValueError):
+                    _parse_limit(raw)
 
     @patch("api.views.log_view.Project.objects.get", side_effect=Exception("missing"))
     @patch("api.views.log_view.BusinessUser.objects.get")
@@ -92,3 +111,116 @@ class LogViewTest(SimpleTestCase):
         request = factory.get("/all-logs/")
         r = get_all_task_logs(request)
         self.assertEqual(r.status_code, 200)
+
+
+class StreamProjectLogsTest(SimpleTestCase):
+    PID = "00000000-0000-0000-0000-000000000001"
+    LAST = "00000000-0000-0000-0000-0000000000aa"
+
+    def _request(self, **extra):
+        request = APIRequestFactory().get("/logs/game/stream/", HTTP_ACCEPT="text/event-stream", **extra)
+        attach_authenticated_user(request)
+        return request
+
+    @override_settings(TASKLOG_STREAM_MAX_SECONDS=0.05, TASKLOG_STREAM_HEARTBEAT_SECONDS=0.01)
+    @patch("api.views.log_view.get_hub")
+    @patch("api.views.log_view.TaskLogQueryService")
+    @patch("api.views.log_view.ProjectDomain")
+    @patch("api.views.log_view.Project.objects.get")
+    @patch("api.views.log_view.BusinessUser.objects.get")
+    def test_replays_backlog_then_streams_live_events(self, _bu, _proj, mock_dom, mock_log_svc, mock_hub):
+        hub = TaskLogHub(broker="memory")
+        mock_hub.return_value = hub
+        mock_dom.return_value.check_access.return_value = True
+        missed = MagicMock(id="l1", project_id=self.PID, actor_type="user", actor_id=None,
+                           event_type="USER_ATTACK", payload={}, created_at=None)
+        mock_log_svc.return_value.get_game_logs_after.return_value = [missed]
+
+        r = stream_project_logs(self._request(HTTP_LAST_EVENT_ID=self.LAST), self.PID)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r["Content-Type"], "text/event-stream")
+        mock_log_svc.return_value.get_game_logs_after.assert_called_once_with(self.PID, self.LAST)
+
+        hub.publish(self.PID, {"id": "l1", "event_type": "USER_ATTACK"})  # already replayed
+        hub.publish(self.PID, {"id": "l2", "event_type": "BOSS_ATTACK"})
+        body = b"".join(r.streaming_content).decode()
+
+        self.assertTrue(body.startswith("retry: 3000"))
+        self.assertEqual(body.count("id: l1"), 1)
+        self.assertIn("id: l2\nevent: BOSS_ATTACK", body)
+        self.assertIn(": keepalive", body)
+        self.assertEqual(hub._subs, {})
+
+    @override_settings(TASKLOG_STREAM_MAX_SECONDS=0.05, TASKLOG_STREAM_HEARTBEAT_SECONDS=0.01)
+    @patch("api.views.log_view.connection")
+    @patch("api.views.log_view.get_hub")
+    @patch("api.views.log_view.TaskLogQueryService")
+    @patch("api.views.log_view.ProjectDomain")
+    @patch("api.views.log_view.Project.objects.get")
+    @patch("api.views.log_view.BusinessUser.objects.get")
+    def test_releases_db_connection_before_streaming(self, _bu, _proj, mock_dom, mock_log_svc, mock_hub, mock_conn):
+        hub = TaskLogHub(broker="memory")
+        mock_hub.return_value = hub
+        mock_dom.return_value.check_access.return_value = True
+        mock_log_svc.return_value.get_game_logs_after.return_value = []
+        mock_conn.in_atomic_block = False
+
+        r = stream_project_logs(self._request(HTTP_LAST_EVENT_ID=self.LAST), self.PID)
+        mock_conn.close.assert_called_once_with()
+
+        def no_queries(*args):
+            raise AssertionError("the event stream must not touch the database")
+
+        hub.publish(self.PID, {"id": "l2", "event_type": "BOSS_ATTACK"})
+        with connection.execute_wrapper(no_queries):
+            body = b"".join(r.streaming_content).decode()
+        self.assertIn("id: l2", body)
+
+    @override_settings(TASKLOG_STREAM_MAX_SECONDS=0)
+    @patch("api.views.log_view.get_hub")
+    @patch("api.views.log_view.TaskLogQueryService")
+    @patch("api.views.log_view.ProjectDomain")
+    @patch("api.views.log_view.Project.objects.get")
+    @patch("api.views.log_view.BusinessUser.objects.get")
+    def test_unreplayable_gap_sends_resync(self, _bu, _proj, mock_dom, mock_log_svc, mock_hub):
+        mock_hub.return_value = TaskLogHub(broker="memory")
+        mock_dom.return_value.check_access.return_value = True
+        mock_log_svc.return_value.get_game_logs_after.return_value = None
+
+        r = stream_project_logs(self._request(), self.PID)
+        self.assertNotIn("resync", b"".join(r.streaming_content).decode())
+
+        r = stream_project_logs(self._request(HTTP_LAST_EVENT_ID=self.LAST), self.PID)
+        self.assertIn("event: resync", b"".join(r.streaming_content).decode())
+
+    @patch("api.views.log_view.get_hub")
+    @patch("api.views.log_view.TaskLogQueryService")
+    @patch("api.views.log_view.ProjectDomain")
+    @patch("api.views.log_view.Project.objects.get")
+    @patch("api.views.log_view.BusinessUser.objects.get")
+    def test_full_worker_answers_503(self, _bu, _proj, mock_dom, mock_log_svc, mock_hub):
+        mock_hub.return_value = TaskLogHub(broker="memory", max_streams=1)
+        mock_dom.return_value.check_access.return_value = True
+
+        open_stream = stream_project_logs(self._request(), self.PID)
+        r = stream_project_logs(self._request(), self.PID)
+
+        self.assertEqual(open_stream.status_code, 200)
+        self.assertEqual(r.status_code, 503)
+        self.assertEqual(r["Retry-After"], "30")
+        open_stream.close()
+        self.assertEqual(stream_project_logs(self._request(), self.PID).status_code, 200)
+
+    def test_invalid_last_event_id(self):
+        r = stream_project_logs(self._request(HTTP_LAST_EVENT_ID="nope"), self.PID)
+        self.assertEqual(r.status_code, 400)
+
+    @patch("api.views.log_view.get_hub")
+    @patch("api.views.log_view.ProjectDomain")
+    @patch("api.views.log_view.Project.objects.get")
+    @patch("api.views.log_view.BusinessUser.objects.get")
+    def test_forbidden_without_access(self, _bu, _proj, mock_dom, mock_hub):
+        mock_dom.return_value.check_access.return_value = False
+        r = stream_project_logs(self._request(), self.PID)
+        self.assertEqual(r.status_code, 403)
+        mock_hub.return_value.subscribe.assert_not_called()
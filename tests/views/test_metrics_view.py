@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+
+from api.views.metrics_view import get_cache_stats, get_request_stats
+
+
+class MetricsViewTest(SimpleTestCase):
+    @patch("api.views.metrics_view.cache_metrics")
+    def test_get_cache_stats_returns_families(self, mock_metrics):
+        mock_metrics.enabled = True
+        mock_metrics.snapshot.return_value = {"task:detail": {"hits": 1}}
+        resp = get_cache_stats(APIRequestFactory().get("/api/internal/cache/stats/"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(resp.data["families"]["task:detail"]["hits"], 1)
+
+    @patch("api.views.metrics_view.cache_metrics")
+    def test_delete_resets(self, mock_metrics):
+        resp = get_cache_stats(APIRequestFactory().delete("/api/internal/cache/stats/"))
+        self.assertEqual(resp.status_code, 200)
+        mock_metrics.reset.assert_called_once()
+
+    @patch("api.views.metrics_view.request_metrics")
+    def test_get_request_stats_lists_slowest_views_first(self, mock_metrics):
+        mock_metrics.enabled = True
+        mock_metrics.snapshot.return_value = {
+            "task_list": {"p99_ms": 25, "avg_ms": 8.0},
+            "get_dashboard": {"p99_ms": "inf", "avg_ms": 900.0},
+            "idle": {"p99_ms": None, "avg_ms": None},
+            "player_attack": {"p99_ms": 250, "avg_ms": 40.0},
+        }
+        resp = get_request_stats(APIRequestFactory().get("/api/internal/requests/stats/"))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(list(resp.data["views"]), ["get_dashboard", "player_attack", "task_list", "idle"])
+        self.assertEqual(resp.data["count"], 4)
+
+    @patch("api.views.metrics_view.request_metrics")
+    def test_delete_request_stats_resets(self, mock_metrics):
+        resp = get_request_stats(APIRequestFactory().delete("/api/internal/requests/stats/"))
+        self.assertEqual(resp.status_code, 200)
+        mock_metrics.reset.assert_called_once()
@@ -15,7 +15,7 @@ class TaskViewTest(SimpleTestCase):
     @patch("api.views.task_view.TaskResponseSerializer")
     @patch("api.views.task_view.TaskService")
     @patch("api.views.task_view.CacheService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_list(self, mock_bu, mock_cache_cls, mock_ts, mock_ser_cls):
         mock_bu.return_value = MagicMock(user_id="u1")
         inst = MagicMock()
@@ -23,7 +23,7 @@ class TaskViewTest(SimpleTestCase):
         mock_ser_cls.return_value = inst
         mock_ts.return_value.get_all_tasks.return_value = []
         cache = MagicMock()
-        cache.keys.project_tasks.return_value = "k"
+        cache.project_tasks_key.return_value = "k"
         cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = cache
         request = self.factory.get("/tasks/")
@@ -35,7 +35,7 @@ class TaskViewTest(SimpleTestCase):
     @patch("api.views.task_view.TaskResponseSerializer")
     @patch("api.views.task_view.TaskRequestSerializer")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_create_valid(self, mock_bu, mock_ts, mock_req, mock_resp, _cache):
         mock_bu.return_value = MagicMock()
         mock_req.return_value.is_valid.return_value = True
@@ -49,7 +49,7 @@ class TaskViewTest(SimpleTestCase):
 
     @patch("api.views.task_view.TaskRequestSerializer")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_create_invalid(self, mock_bu, mock_ts, mock_req):
         mock_bu.return_value = MagicMock()
         mock_req.return_value.is_valid.return_value = False
@@ -62,13 +62,13 @@ class TaskViewTest(SimpleTestCase):
     @patch("api.views.task_view.TaskResponseSerializer")
     @patch("api.views.task_view.TaskService")
     @patch("api.views.task_view.CacheService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_detail_found(self, mock_bu, mock_cache_cls, mock_ts, mock_ser):
         mock_bu.return_value = MagicMock(user_id="u1")
         mock_ts.return_value.get_task.return_value = MagicMock()
         mock_ser.return_value.data = {"task_id": "x"}
         cache = MagicMock()
-        cache.keys.task_detail.return_value = "k"
+        cache.task_detail_key.return_value = "k"
         cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = cache
         request = self.factory.get("/tasks/t/")
@@ -78,12 +78,12 @@ class TaskViewTest(SimpleTestCase):
 
     @patch("api.views.task_view.TaskService")
     @patch("api.views.task_view.CacheService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_detail_not_found(self, mock_bu, mock_cache_cls, mock_ts):
         mock_bu.return_value = MagicMock(user_id="u1")
         mock_ts.return_value.get_task.return_value = None
         cache = MagicMock()
-        cache.keys.task_detail.return_value = "k"
+        cache.task_detail_key.return_value = "k"
         cache.read_through.side_effect = lambda **kw: kw["loader"]()
         mock_cache_cls.return_value = cache
         request = self.factory.get("/tasks/t/")
@@ -94,7 +94,7 @@ class TaskViewTest(SimpleTestCase):
     @patch("api.views.task_view.TaskResponseSerializer")
     @patch("api.views.task_view.CacheService")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_move(self, mock_bu, mock_ts, _c, mock_ser):
         mock_bu.return_value = MagicMock()
         mock_ts.return_value.get_task.return_value = MagicMock()
@@ -110,7 +110,7 @@ class TaskViewTest(SimpleTestCase):
     @patch("api.views.task_view.TaskRequestSerializer")
     @patch("api.views.task_view.CacheService")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_update(self, mock_bu, mock_ts, _c, mock_req, mock_resp):
         mock_bu.return_value = MagicMock()
         mock_ts.return_value.get_task.return_value = MagicMock()
@@ -128,7 +128,7 @@ class TaskViewTest(SimpleTestCase):
 
     @patch("api.views.task_view.CacheService")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_delete(self, mock_bu, mock_ts, _c):
         mock_bu.return_value = MagicMock()
         mock_ts.return_value.delete_task.return_value = True
@@ -147,7 +147,7 @@ class TaskViewTest(SimpleTestCase):
 
     @patch("api.views.task_view.CacheService")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_assign_success(self, mock_bu, mock_ts, _c):
         mock_bu.return_value = MagicMock()
         mock_ts.return_value.assign_user_to_task.return_value = (MagicMock(), True)
@@ -157,7 +157,7 @@ class TaskViewTest(SimpleTestCase):
 
     @patch("api.views.task_view.CacheService")
     @patch("api.views.task_view.TaskService")
-    @patch("api.views.task_view.BusinessUser.objects.get")
+    @patch("api.views.task_view.get_business_user")
     def test_task_unassign(self, mock_bu, mock_ts, _c):
         mock_bu.return_value = MagicMock()
         mock_ts.return_value.unassign_user_from_task.return_value = True